@@ -8,10 +8,11 @@ import asyncio
 from automation.scrapers.fieldedge_scraper import FieldEdgeScraper
 from automation.scrapers.work_orders_scraper import WorkOrdersScraper
 from automation.scrapers.online_rme_scraper import OnlineRMEScraper
+from automation.services.browser_pool import close_browser_pool
 
 
 async def run_fieldedge_scraper():
-    """Execute FieldEdge scraping workflow."""
+    """Execute FieldEdge scraping workflow. Returns True unless it failed."""
     print("=== Starting FieldEdge Scraper ===")
     scraper = None
 
@@ -24,18 +25,21 @@ async def run_fieldedge_scraper():
                 print("FieldEdge data inserted successfully.")
             else:
                 print("Failed to insert FieldEdge data.")
+                return False
         else:
             print("No FieldEdge data scraped.")
+        return True
 
     except Exception as e:
         print(f"Error during FieldEdge execution: {e}")
+        return False
     finally:
         if scraper:
             del scraper
 
 
 async def run_work_orders_scraper():
-    """Execute WorkOrders scraping workflow."""
+    """Execute WorkOrders scraping workflow. Returns True unless it failed."""
     print("\n=== Starting WorkOrders Scraper ===")
     scraper = None
 
@@ -44,13 +48,17 @@ async def run_work_orders_scraper():
         work_orders_data = await scraper.run()
 
         if work_orders_data:
-            scraper.insert_work_order_today(work_orders_data)
+            if not scraper.insert_work_order_today(work_orders_data):
+                print("Failed to insert WorkOrders data.")
+                return False
             print("WorkOrders data inserted successfully.")
         else:
             print("No WorkOrders data found today.")
+        return True
 
     except Exception as e:
         print(f"Error during WorkOrders execution: {e}")
+        return False
     finally:
         if scraper:
             try:
@@ -60,7 +68,7 @@ async def run_work_orders_scraper():
 
 
 async def run_online_rme_scraper():
-    """Execute Online RME scraping workflow."""
+    """Execute Online RME scraping workflow. Returns True unless it failed."""
     print("\n=== Starting Online RME Scraper ===")
     scraper = None
 
@@ -83,16 +91,16 @@ async def run_online_rme_scraper():
         if work_orders_missing_urls:
             updated_records = await scraper.run(work_orders_missing_urls)
 
-            del scraper
-            scraper = OnlineRMEScraper()
-
+            # Same scraper: run() released its context, the next step opens a fresh one
             await scraper.workorder_address_check_and_get_form(updated_records)
             print("RME data patching completed.")
         else:
             print("No RME records found to update.")
+        return True
 
     except Exception as e:
         print(f"Error during Online RME execution: {e}")
+        return False
     finally:
         if scraper:
             try:
@@ -101,15 +109,39 @@ async def run_online_rme_scraper():
                 pass
 
 
-async def main():
-    """Main execution flow - runs all scrapers in sequence."""
-    await run_fieldedge_scraper()
-    await run_work_orders_scraper()
-    await run_online_rme_scraper()
+# (progress name, scraper) in execution order
+SCRAPER_STEPS = [
+    ('fieldedge', run_fieldedge_scraper),
+    ('work_orders', run_work_orders_scraper),
+    ('online_rme', run_online_rme_scraper),
+]
+
+
+async def main(on_progress=None):
+    """
+    Main execution flow - runs all scrapers in sequence.
+
+    Args:
+        on_progress: Optional async callable(step, state) told when each step
+            is "running" and whether it ended "done" or "failed"
+    """
+    try:
+        for step, run_scraper in SCRAPER_STEPS:
+            if on_progress:
+                await on_progress(step, "running")
+            succeeded = await run_scraper()
+            if on_progress:
+                await on_progress(step, "done" if succeeded else "failed")
+    finally:
+        # One browser launch per cycle, shared by every scraper
+        await close_browser_pool()
 
 
-def start_scraping():
-    """Initialize and start the scraping process."""
+def start_scraping(on_progress=None):
+    """
+    Initialize and start the scraping process.
+    Blocks until every scraper finished; see locates.scrape_runs to run it in the background.
+    """
     print("\n" + "=" * 50)
     print("STERLING DASHBOARD SCRAPER - PROCESS INITIALIZED")
     print("=" * 50 + "\n")
@@ -122,7 +154,7 @@ def start_scraping():
         print(f"OS: {sys.platform} detected. Using default event loop.\n")
 
     try:
-        asyncio.run(main())
+        asyncio.run(main(on_progress))
     except KeyboardInterrupt:
         print("\nProcess interrupted by user.")
     except Exception as e:
@@ -7,10 +7,11 @@ import json
 import asyncio
 from datetime import datetime
 from dotenv import load_dotenv
-from playwright.async_api import async_playwright
 import pytz
 
 from automation.services.api_client import APIClient
+from automation.services.browser_pool import get_browser_pool
+from automation.services.session_cache import SessionCache
 
 # Load environment variables
 load_dotenv()
@@ -25,10 +26,13 @@ class BaseScraper:
     and authentication functionality.
     """
     
+    # Site of the scraper ("fieldedge" / "online_rme"): picks the cached
+    # session and the request_blocking rules
+    session_site = None
+    
     def __init__(self):
         """Initialize scraper with browser and API client."""
         # Playwright instances
-        self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
@@ -42,8 +46,23 @@ class BaseScraper:
         self.rme_username = os.getenv("RME_username")
         self.rme_password = os.getenv("RME_password")
         
+        # Pause after each perform_actions_by_xpaths action, in seconds
+        self.action_delay = float(os.getenv("SCRAPER_ACTION_DELAY", 3))
+        
         # Load scraping rules
         self.rules = self._load_rules()
+        
+        # Encrypted storage_state of the last login to session_site
+        self.session_cache = self._session_cache()
+    
+    def _session_cache(self):
+        accounts = {
+            "fieldedge": self.fieldedge_email,
+            "online_rme": self.rme_username,
+        }
+        if self.session_site not in accounts:
+            return None
+        return SessionCache(self.session_site, accounts[self.session_site])
     
     def _load_rules(self):
         """
@@ -71,21 +90,29 @@ class BaseScraper:
             print(f"Unexpected error loading rules: {e}")
             return {}
     
-    async def initialize(self):
+    def concurrency_rules(self):
+        """The session_site's ``concurrency`` settings from the rules file."""
+        return self.rules.get("concurrency", {}).get(self.session_site, {})
+    
+    async def initialize(self, storage_state=None):
         """
-        Launch and configure the browser instance.
-        Uses non-headless mode with slight delay for stability.
+        Open an isolated browser context and page, signed in with the cached
+        session when there is one. The browser itself is shared through the
+        browser pool, launched with the BROWSER_PROFILE settings.
+        
+        Args:
+            storage_state: Session to start with instead of the cached one
         """
         try:
-            self.playwright = await async_playwright().start()
-            
-            # Launch browser with visible UI and slight delay
-            self.browser = await self.playwright.chromium.launch(
-                headless=False,
-                slow_mo=50
-            )
+            context_options = {}
+            if storage_state is None and self.session_cache:
+                storage_state = self.session_cache.load()
+            if storage_state:
+                context_options["storage_state"] = storage_state
             
-            self.context = await self.browser.new_context()
+            request_rules = self.rules.get("request_blocking", {}).get(self.session_site)
+            self.context = await get_browser_pool().acquire(request_rules=request_rules, **context_options)
+            self.browser = self.context.browser
             self.page = await self.context.new_page()
             
             print("Browser initialized successfully.")
@@ -109,6 +136,7 @@ class BaseScraper:
                 await self.page.click(login_button_xpath)
             
             print("FieldEdge login successful.")
+            await self.save_session()
             
         except Exception as e:
             print(f"FieldEdge login failed: {e}")
@@ -129,12 +157,22 @@ class BaseScraper:
                 await self.page.click(login_button_xpath)
             
             print("Online RME login successful.")
+            await self.save_session()
             
         except Exception as e:
             print(f"Online RME login failed: {e}")
             raise
     
-    async def perform_actions_by_xpaths(self, name:str='', action_list:list=[], value:str=None):
+    async def save_session(self):
+        """Cache the signed-in session of the current context for the next run."""
+        if self.session_cache is None or not self.session_cache.enabled or not self.context:
+            return
+        try:
+            self.session_cache.save(await self.context.storage_state())
+        except Exception as e:
+            print(f"Could not cache session: {e}")
+    
+    async def perform_actions_by_xpaths(self, name:str='', action_list:list=[], value:str=None, delay:float=None):
         """
         Execute actions (click, right-click, input) on elements by XPath.
         
@@ -142,7 +180,10 @@ class BaseScraper:
             name: Key to lookup in rules configuration
             action_list: List of action dictionaries (fallback if name not found)
             value: Value to input for 'input' actions
+            delay: Pause after each action in seconds (default: self.action_delay)
         """
+        if delay is None:
+            delay = self.action_delay
         
         xpaths = self.rules.get(name, action_list)
         
@@ -176,7 +217,7 @@ class BaseScraper:
                             print(f"Warning: Action is 'input' but no value provided for: {xpath}")
                     
                     # Brief pause between actions for stability
-                    await asyncio.sleep(3)
+                    await asyncio.sleep(delay)
             except Exception as e:
                 print(f"Action '{action}' failed for xpath '{xpath}': {e}")
         
@@ -229,13 +270,14 @@ class BaseScraper:
                         work_order['scheduled_date'] = None
                 else:
                     work_order['scheduled_date'] = None
-                
-                # Insert via API
-                if self.api_client.insert_work_order_today(work_order):
-                    print(f"Work order {work_order.get('wo_number', 'N/A')} inserted.")
-                else:
-                    print(f"Failed to insert work order {work_order.get('wo_number', 'N/A')}.")
-            
+
+            # Insert / update the whole batch in one API request
+            result = self.api_client.upsert_work_orders(work_orders)
+            if not result:
+                print("Failed to insert work orders.")
+                return False
+
+            print(f"Work orders inserted: {result.get('created', 0)} created, {result.get('updated', 0)} updated.")
             return True
             
         except Exception as e:
@@ -243,12 +285,11 @@ class BaseScraper:
             return False
     
     async def cleanup(self):
-        """Clean up browser resources."""
+        """Release the browser context back to the pool (the browser stays up)."""
         try:
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+            if self.context:
+                context, self.context, self.page = self.context, None, None
+                await get_browser_pool().release(context)
             print("Browser cleanup completed.")
         except Exception as e:
             print(f"Error during cleanup: {e}")
\ No newline at end of file
@@ -12,6 +12,8 @@ class FieldEdgeScraper(BaseScraper):
     Filters by status, task type, and date range.
     """
     
+    session_site = "fieldedge"
+    
     def __init__(self):
         """Initialize FieldEdge scraper."""
         super().__init__()
@@ -2,6 +2,7 @@ try:
     from automation.scrapers.base_scraper import BaseScraper
 except:
     from base_scraper import BaseScraper
+from automation.services.concurrency import CooperativeBackoff, run_in_slots
 from automation.utils.address_helpers import extract_address_details
 from tasks.helper.edit_task import OnlineRMEEditTaskHelper
 from datetime import datetime
@@ -9,15 +10,55 @@ import asyncio
 from locates.models import WorkOrderToday
 from asgiref.sync import sync_to_async
 from django.utils import timezone
+import copy
 import re
+from urllib.parse import urlparse
 
 
 class OnlineRMEScraper(BaseScraper, OnlineRMEEditTaskHelper):
     """Optimized Online RME scraper with efficient data collection and single database updates."""
 
+    session_site = "online_rme"
+
     def __init__(self):
         """Initialize Online RME scraper."""
         super().__init__()
+        # Set once the session of the current context has been validated
+        self.rme_authenticated = False
+
+    async def initialize(self, storage_state=None):
+        """Open a new browser context; its session is validated on first use."""
+        await super().initialize(storage_state)
+        self.rme_authenticated = False
+
+    async def open_workers(self, count: int) -> list:
+        """
+        Return this scraper plus up to ``count - 1`` copies, each with its own
+        browser context signed in with this scraper's session.
+
+        Cookies listed in ``private_cookies`` (the server-side session, which
+        holds the selected property) are not shared, so every worker browses
+        independently. A worker whose copied login is refused signs in itself.
+        """
+        workers = [self]
+        if count <= 1:
+            return workers
+
+        private_cookies = set(self.concurrency_rules().get("private_cookies", []))
+        state = await self.context.storage_state()
+        state["cookies"] = [cookie for cookie in state["cookies"] if cookie["name"] not in private_cookies]
+
+        for _ in range(count - 1):
+            worker = copy.copy(self)
+            try:
+                await worker.initialize(storage_state=state)
+            except Exception as e:
+                print(f"⚠️  Could not open another worker, continuing with {len(workers)}: {e}")
+                break
+            worker.rme_authenticated = True
+            workers.append(worker)
+
+        return workers
 
     def normalize_address_for_matching(self, address: str) -> str:
         """
@@ -149,8 +190,16 @@ class OnlineRMEScraper(BaseScraper, OnlineRMEEditTaskHelper):
         print(f"   ❌ No match found")
         return False
 
+    def _redirected_from(self, url: str) -> bool:
+        """True when the page did not end up on ``url``, e.g. after a 302 to the login page."""
+        return urlparse(self.page.url).path.rstrip("/").lower() != urlparse(url).path.rstrip("/").lower()
+
     async def ensure_authenticated(self):
-        """Ensure user is authenticated to Online RME."""
+        """
+        Ensure user is authenticated to Online RME and leave the page on the
+        property search form. Validates the (possibly cached) session once;
+        use open_search_page() afterwards.
+        """
         try:
             search_url = self.rules.get("contractor_search_property")
             await self.page.goto(search_url, wait_until="domcontentloaded")
@@ -159,13 +208,14 @@ class OnlineRMEScraper(BaseScraper, OnlineRMEEditTaskHelper):
             login_indicator = self.page.locator('//span[@id="lblMultiMatch"]')
 
             is_logged_in = False
-            try:
-                if await login_indicator.is_visible(timeout=5000):
-                    content = await login_indicator.inner_text()
-                    if "You are currently logged in for Sterling Septic & Plumbing" in content:
-                        is_logged_in = True
-            except:
-                pass
+            if not self._redirected_from(search_url):
+                try:
+                    if await login_indicator.is_visible(timeout=5000):
+                        content = await login_indicator.inner_text()
+                        if "You are currently logged in for Sterling Septic & Plumbing" in content:
+                            is_logged_in = True
+                except:
+                    pass
 
             if not is_logged_in:
                 print("Not logged in. Redirecting to login page...")
@@ -179,10 +229,28 @@ class OnlineRMEScraper(BaseScraper, OnlineRMEEditTaskHelper):
             else:
                 print("Already authenticated to Online RME.")
 
+            self.rme_authenticated = True
+
         except Exception as e:
             print(f"Error during authentication check: {e}")
             raise
 
+    async def open_search_page(self):
+        """
+        Open the property search form. Signs in only on first use or when
+        the session expired (the search page redirects to the login page).
+        """
+        if not self.rme_authenticated:
+            await self.ensure_authenticated()
+            return
+
+        search_url = self.rules.get("contractor_search_property")
+        await self.page.goto(search_url, wait_until="domcontentloaded")
+        if self._redirected_from(search_url):
+            print("Online RME session expired. Signing in again...")
+            self.rme_authenticated = False
+            await self.ensure_authenticated()
+
     async def search_property(self, street_number: str, street_name: str):
         """
         Search for a property by street number and name.
@@ -829,8 +897,7 @@ class OnlineRMEScraper(BaseScraper, OnlineRMEEditTaskHelper):
                 street_number, street_name = extract_address_details(full_address)
                 if street_number and street_name:
                     try:
-                        # Ensure authentication
-                        await self.ensure_authenticated()
+                        await self.open_search_page()
                         
                         # Wait for search form
                         wait_xpath = self.rules.get("wait_rme_body")
@@ -883,8 +950,7 @@ class OnlineRMEScraper(BaseScraper, OnlineRMEEditTaskHelper):
                 result["error"] = "Could not parse address"
                 return result
 
-            # Ensure authentication
-            await self.ensure_authenticated()
+            await self.open_search_page()
 
             # Wait for search form
             wait_xpath = self.rules.get("wait_rme_body")
@@ -1082,6 +1148,8 @@ class OnlineRMEScraper(BaseScraper, OnlineRMEEditTaskHelper):
     async def workorder_address_check_and_get_form(self, work_orders: list) -> list:
         """
         Main entry point - process all work orders with optimized flow.
+        Work orders are spread over up to ``concurrency.online_rme.max_workers``
+        browser contexts (see open_workers), paced by a CooperativeBackoff.
 
         Args:
             work_orders: List of work order dictionaries
@@ -1093,19 +1161,29 @@ class OnlineRMEScraper(BaseScraper, OnlineRMEEditTaskHelper):
             await self.initialize()
 
         total_count = len(work_orders)
+        rules = self.concurrency_rules()
+        max_workers = max(1, min(int(rules.get("max_workers", 1)), total_count))
+
         print(f"\n{'='*80}")
-        print(f"Starting processing of {total_count} work orders")
+        print(f"Starting processing of {total_count} work orders ({max_workers} worker(s))")
         print(f"{'='*80}\n")
 
-        for index, work_order in enumerate(work_orders, start=1):
-            result = await self.process_single_work_order(work_order, index, total_count)
+        if max_workers > 1:
+            # Sign in once; the other workers start from this session
+            await self.ensure_authenticated()
+        workers = await self.open_workers(max_workers)
+        backoff = CooperativeBackoff(len(workers), slow_seconds=rules.get("slow_seconds", 90))
+
+        async def handle(worker, position, work_order):
+            index = position + 1
+            result = await worker.process_single_work_order(work_order, index, total_count)
 
             # Update work_orders list
-            work_orders[index - 1]["last_report_link"] = result.get("last_report_link")
-            work_orders[index - 1]["tech_report_submitted"] = result.get("tech_report_submitted", False)
+            work_orders[position]["last_report_link"] = result.get("last_report_link")
+            work_orders[position]["tech_report_submitted"] = result.get("tech_report_submitted", False)
 
             # Single database update per work order
-            await self.update_database_batch(result)
+            await worker.update_database_batch(result)
 
             print(f"\n{'─'*80}")
             print(f"✅ Summary for work order {index}/{total_count}:")
@@ -1117,6 +1195,17 @@ class OnlineRMEScraper(BaseScraper, OnlineRMEEditTaskHelper):
             if result.get("error"):
                 print(f"   ⚠️  Error: {result.get('error')}")
             print(f"{'─'*80}\n")
+            return result
+
+        try:
+            # A timed-out page is the usual sign of RME slowing down
+            await run_in_slots(
+                work_orders, workers, handle, backoff,
+                is_failure=lambda result: "timeout" in (result.get("error") or "").lower()
+            )
+        finally:
+            for worker in workers[1:]:
+                await worker.cleanup()
 
         await self.cleanup()
 
@@ -1147,7 +1236,7 @@ class OnlineRMEScraper(BaseScraper, OnlineRMEEditTaskHelper):
             print(f"\n📄 Processing work order {index}/{total_count}...")
 
             try:
-                await self.ensure_authenticated()
+                await self.open_search_page()
 
                 wait_xpath = self.rules.get("wait_rme_body")
                 try:
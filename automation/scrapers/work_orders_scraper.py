@@ -7,6 +7,7 @@ import copy
 from typing import List, Dict, Optional
 import asyncio
 from automation.scrapers.base_scraper import BaseScraper
+from automation.services.concurrency import CooperativeBackoff, retry_with_backoff, run_in_slots
 
 
 class WorkOrdersScraper(BaseScraper):
@@ -15,6 +16,8 @@ class WorkOrdersScraper(BaseScraper):
     Opens individual work orders to fetch full address details.
     """
     
+    session_site = "fieldedge"
+    
     def __init__(self):
         """Initialize work orders scraper."""
         super().__init__()
@@ -89,12 +92,13 @@ class WorkOrdersScraper(BaseScraper):
             return {'rows': []}
     
     
-    async def scrape_address_from_page(self, page):
+    async def scrape_address_from_page(self, page, timeout=60000):
         """
         Extract full address from work order detail page.
         
         Args:
             page: Playwright page object for the work order detail
+            timeout: Milliseconds to wait for the address fields
             
         Returns:
             str: Full address or None if extraction fails
@@ -103,7 +107,7 @@ class WorkOrdersScraper(BaseScraper):
             await page.wait_for_selector(
                 '[data-automation-id="address1"]',
                 state='attached',
-                timeout=60000
+                timeout=timeout
             )
         except Exception as e:
             print(f"Error waiting for address elements: {e}")
@@ -127,83 +131,143 @@ class WorkOrdersScraper(BaseScraper):
             print(f"Error extracting address: {e}")
             return None
     
+    async def fetch_address(self, wo_number, xpath_config, list_page_lock, action_delay, timeout):
+        """
+        Open one work order in a detail tab and read its address.
+        
+        Args:
+            wo_number: Work order number
+            xpath_config: Actions opening the work order from the list
+            list_page_lock: asyncio.Lock serializing the clicks on the list page
+            action_delay: Pause after each list page action, in seconds
+            timeout: Seconds allowed once the list page is free (waiting for it is not counted)
+            
+        Returns:
+            str: Full address; raises if it could not be read
+        """
+        loop = asyncio.get_running_loop()
+        context = self.page.context
+        # Tabs opened by our clicks; closed even if we are cancelled inside expect_page()
+        opened = []
+        new_page = None
+        
+        def track(page):
+            opened.append(page)
+        
+        try:
+            # The tab is opened from the shared list page, one work order at a time
+            async with list_page_lock:
+                deadline = loop.time() + timeout
+                # Only our clicks open tabs while the lock is held
+                context.on("page", track)
+                try:
+                    new_page = await asyncio.wait_for(self.open_detail_tab(xpath_config, action_delay), timeout)
+                finally:
+                    context.remove_listener("page", track)
+            
+            remaining = max(deadline - loop.time(), 0)
+            address = await asyncio.wait_for(self.read_address(new_page, remaining), remaining)
+            if not address:
+                raise Exception("Address not found")
+            return address
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"timed out after {timeout}s") from None
+        finally:
+            if new_page is not None and new_page not in opened:
+                opened.append(new_page)
+            for page in opened:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+    
+    async def open_detail_tab(self, xpath_config, action_delay):
+        """Open the work order from the list page and return its new tab."""
+        async with self.page.context.expect_page() as new_page_info:
+            await self.perform_actions_by_xpaths(action_list=xpath_config, delay=action_delay)
+        return await new_page_info.value
+    
+    async def read_address(self, page, timeout):
+        """Wait for a detail tab to load and read its address."""
+        await page.wait_for_load_state()
+        return await self.scrape_address_from_page(page=page, timeout=timeout * 1000)
+    
     async def fetch_addresses_for_work_orders(self, work_orders):
         """
         Open each work order to extract full address.
         Only processes work orders with "Complete" status.
         
+        Detail tabs are read concurrently (``concurrency.fieldedge`` in the
+        rules: max_workers tabs, item_timeout seconds per attempt counted
+        once the list page is free, attempts per work order with a jittered
+        back-off in between).
+        
         Args:
             work_orders: List of work order dictionaries
             
         Returns:
             list: Work orders with full_address field added
         """
-        result = []
         base_xpath_config = self.rules.get('open_work_order_xpath', [])
+        if not base_xpath_config:
+            print("No XPath configured for opening work orders.")
+            return []
         
-        while work_orders:
-            work_order = work_orders.pop(0)
+        pending = []
+        for work_order in work_orders:
+            wo_number = work_order.get('wo_number', '').strip()
+            status = work_order.get('status', '').strip()
+            
+            # Only process Complete work orders
+            if not wo_number or status != "Complete":
+                if wo_number:
+                    print(f"⏭Skipping work order {wo_number}: Status is '{status}'")
+                continue
+            pending.append(work_order)
+        
+        if not pending:
+            return []
+        
+        rules = self.concurrency_rules()
+        width = max(1, min(int(rules.get('max_workers', 1)), len(pending)))
+        item_timeout = rules.get('item_timeout', 60)
+        attempts = rules.get('attempts', 2)
+        action_delay = rules.get('action_delay', self.action_delay)
+        
+        list_page_lock = asyncio.Lock()
+        backoff = CooperativeBackoff(width, slow_seconds=rules.get('slow_seconds', item_timeout))
+        print(f"Fetching addresses for {len(pending)} work order(s) with {width} tab(s)...")
+        
+        async def handle(slot, index, work_order):
+            wo_number = work_order.get('wo_number', '').strip()
+            
+            # Prepare XPath with work order number
+            xpath_config = copy.deepcopy(base_xpath_config)
+            wo_xpath = xpath_config[0]["xpath"]
+            xpath_config[0]["xpath"] = wo_xpath.replace(
+                '{work_order_number}',
+                wo_number
+            )
             
             try:
-                wo_number = work_order.get('wo_number', '').strip()
-                status = work_order.get('status', '').strip()
-                retry_count = work_order.get('try_later', 0)
-                
-                # Only process Complete work orders with retry limit
-                if not wo_number or status != "Complete" or retry_count >= 2:
-                    if wo_number and status != "Complete":
-                        print(f"⏭Skipping work order {wo_number}: Status is '{status}'")
-                    elif retry_count >= 2:
-                        print(f"Skipping work order {wo_number}: Retry limit reached")
-                    continue
-                
-                if not base_xpath_config:
-                    print("No XPath configured for opening work orders.")
-                    continue
-                
-                # Prepare XPath with work order number
-                xpath_config = copy.deepcopy(base_xpath_config)
-                wo_xpath = xpath_config[0]["xpath"]
-                xpath_config[0]["xpath"] = wo_xpath.replace(
-                    '{work_order_number}',
-                    wo_number
+                address = await retry_with_backoff(
+                    lambda: self.fetch_address(wo_number, xpath_config, list_page_lock, action_delay, item_timeout),
+                    attempts=attempts,
+                    label=f"Work order {wo_number}"
                 )
-                
-                # Open work order in new tab
-                try:
-                    async with self.page.context.expect_page() as new_page_info:
-                        await self.perform_actions_by_xpaths(action_list=xpath_config)
-                    
-                    new_page = await new_page_info.value
-                    await new_page.wait_for_load_state()
-                    
-                    # Extract address
-                    address = await self.scrape_address_from_page(page=new_page)
-                    
-                    if address:
-                        work_order['full_address'] = address
-                        print(f"{wo_number}: {address}")
-                        result.append(work_order)
-                    else:
-                        raise Exception("Address not found")
-                
-                except Exception as e:
-                    print(f"Failed to scrape {wo_number}: {e}")
-                    work_order['try_later'] = retry_count + 1
-                    work_orders.append(work_order)
-                
-                finally:
-                    try:
-                        await new_page.close()
-                    except:
-                        pass
-            
             except Exception as e:
-                print(f"Error processing work order {wo_number}: {e}")
-                work_order['try_later'] = work_order.get("try_later", 0) + 1
-                work_orders.append(work_order)
+                print(f"Failed to scrape {wo_number}: {e}")
+                return None
+            
+            work_order['full_address'] = address
+            print(f"{wo_number}: {address}")
+            return work_order
         
-        return result
+        results = await run_in_slots(
+            pending, range(width), handle, backoff,
+            is_failure=lambda work_order: work_order is None
+        )
+        return [work_order for work_order in results if isinstance(work_order, dict)]
     
     async def run(self):
         """
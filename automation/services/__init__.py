@@ -2,5 +2,8 @@
 Services package containing API clients and external integrations.
 """
 from .api_client import APIClient
+from .browser_pool import BrowserPool, RequestFilter, get_browser_pool, close_browser_pool
+from .session_cache import SessionCache
+from .concurrency import CooperativeBackoff, retry_with_backoff, run_in_slots
 
-__all__ = ['APIClient']
\ No newline at end of file
+__all__ = ['APIClient', 'BrowserPool', 'RequestFilter', 'get_browser_pool', 'close_browser_pool', 'SessionCache', 'CooperativeBackoff', 'retry_with_backoff', 'run_in_slots']
\ No newline at end of file
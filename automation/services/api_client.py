@@ -245,7 +245,59 @@ class APIClient:
                 print("Failed to create work order.")
                 return False
 
-    
+    def upsert_work_orders(self, work_orders):
+        """
+        Create or update a batch of work orders in one request, keyed by wo_number.
+
+        Args:
+            work_orders: List of work order dictionaries
+
+        Returns:
+            dict: Created / updated counts or None on failure
+        """
+        if not self._ensure_authenticated():
+            return None
+
+        if not work_orders:
+            print("No work orders to upsert.")
+            return None
+
+        url = f"{self.work_orders_endpoint}upsert/"
+        print(f"Sending {len(work_orders)} work orders to: {url}")
+
+        try:
+            response = requests.post(
+                url,
+                json=work_orders,
+                headers=self.headers,
+                timeout=120
+            )
+
+            result = self._handle_response(response, "POST")
+
+            # Retry once if unauthorized
+            if result is None and response.status_code == 401:
+                print("🔄 Retrying with fresh token...")
+
+                if self._ensure_authenticated():
+                    response = requests.post(
+                        url,
+                        json=work_orders,
+                        headers=self.headers,
+                        timeout=120
+                    )
+                    result = self._handle_response(response, "POST")
+
+            return result
+
+        except requests.Timeout:
+            print("Request timed out while upserting work orders.")
+            return None
+        except requests.RequestException as e:
+            print(f"Connection error during upsert: {e}")
+            return None
+
+
     def manage_work_orders(self, method_type, data=None, record_id=None, params=None):
         """
         Universal method for CRUD operations on work orders.
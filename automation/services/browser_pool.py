@@ -0,0 +1,205 @@
+"""
+Browser Pool Service
+Shares one Playwright instance and Chromium browser between all scrapers.
+"""
+import asyncio
+import os
+import weakref
+from urllib.parse import urlparse
+
+from django.conf import settings
+from dotenv import load_dotenv
+from playwright.async_api import async_playwright
+
+load_dotenv()
+
+
+# Runtime browser profiles, selected with the BROWSER_PROFILE setting
+BROWSER_PROFILES = {
+    # Visible browser with slight delay, every request loaded: for watching a run
+    "debug": {
+        "launch": {"headless": False, "slow_mo": 50},
+        "context": {},
+        "block_requests": False,
+    },
+    # Headless, no delay, requests filtered by the site's request_blocking rules
+    "server": {
+        "launch": {"headless": True, "args": ["--disable-dev-shm-usage", "--disable-gpu"]},
+        # Service workers would fetch past the request filter
+        "context": {"service_workers": "block"},
+        "block_requests": True,
+    },
+}
+
+DEFAULT_BROWSER_PROFILE = "debug"
+
+
+def get_browser_profile(name=None):
+    """The launch / context settings of profile ``name`` (default settings.BROWSER_PROFILE)."""
+    name = name or getattr(settings, "BROWSER_PROFILE", DEFAULT_BROWSER_PROFILE)
+    if name not in BROWSER_PROFILES:
+        raise ValueError(f"Unknown BROWSER_PROFILE '{name}', expected one of: {', '.join(BROWSER_PROFILES)}")
+    return BROWSER_PROFILES[name]
+
+
+class RequestFilter:
+    """
+    Route handler dropping requests a scraper does not need: the blocked
+    resource types (images, fonts...) and anything served from a host outside
+    the site's allow-list (analytics, chat widgets...). Page navigations are
+    always let through.
+    """
+
+    def __init__(self, blocked_resource_types=(), allowed_hosts=()):
+        """
+        Args:
+            blocked_resource_types: Playwright resource types to abort
+            allowed_hosts: Hosts (subdomains included) to load; empty = any host
+        """
+        self.blocked_resource_types = frozenset(blocked_resource_types)
+        self.allowed_hosts = tuple(host.lower() for host in allowed_hosts)
+
+    def _host_allowed(self, url):
+        if not self.allowed_hosts:
+            return True
+        host = (urlparse(url).hostname or "").lower()
+        return any(host == allowed or host.endswith(f".{allowed}") for allowed in self.allowed_hosts)
+
+    def allows(self, request):
+        if request.resource_type == "document":
+            return True
+        if request.resource_type in self.blocked_resource_types:
+            return False
+        # data: / blob: URLs never leave the browser
+        if not request.url.startswith(("http://", "https://")):
+            return True
+        return self._host_allowed(request.url)
+
+    async def handle(self, route):
+        if self.allows(route.request):
+            await route.continue_()
+        else:
+            await route.abort("blockedbyclient")
+
+
+class BrowserPool:
+    """
+    One Chromium browser per event loop, handing out isolated BrowserContexts.
+
+    Each scraper acquires its own context (cookies, storage and pages are not
+    shared) and releases it when done; only the first acquire pays for the
+    browser launch. After ``max_pages`` pages have been opened the browser is
+    relaunched as soon as no context is in use, so a long-running process does
+    not keep growing.
+
+    The browser is launched with the settings of the runtime profile (see
+    BROWSER_PROFILES); the server profile also filters the requests of every
+    context with the rules passed to acquire().
+    """
+
+    def __init__(self, max_pages=None, profile=None):
+        """
+        Args:
+            max_pages: Pages to open before recycling the browser
+                (default BROWSER_POOL_MAX_PAGES, 0 = never)
+            profile: Name of a BROWSER_PROFILES entry (default settings.BROWSER_PROFILE)
+        """
+        if max_pages is None:
+            max_pages = int(os.getenv("BROWSER_POOL_MAX_PAGES", 200))
+        self.max_pages = max_pages
+        self.profile = get_browser_profile(profile)
+
+        self.playwright = None
+        self.browser = None
+        self.contexts = set()
+        self.pages_opened = 0
+        self._lock = asyncio.Lock()
+
+    async def _launch(self):
+        if self.playwright is None:
+            self.playwright = await async_playwright().start()
+
+        self.browser = await self.playwright.chromium.launch(**self.profile["launch"])
+        self.pages_opened = 0
+        print("Browser pool: browser launched.")
+
+    async def _close_browser(self):
+        browser, self.browser = self.browser, None
+        try:
+            await browser.close()
+        except Exception as e:
+            print(f"Browser pool: error closing browser: {e}")
+
+    def _needs_recycle(self):
+        if not self.browser.is_connected():
+            return True
+        return bool(self.max_pages) and self.pages_opened >= self.max_pages and not self.contexts
+
+    def _count_page(self, page):
+        self.pages_opened += 1
+
+    async def acquire(self, request_rules=None, **context_options):
+        """
+        Get a new isolated BrowserContext, launching the browser if needed.
+
+        Args:
+            request_rules: The site's ``request_blocking`` rules
+                (blocked_resource_types, allowed_hosts); applied by the server profile
+            context_options: Keyword arguments for Browser.new_context()
+
+        Returns:
+            BrowserContext: Context to release with release() when done
+        """
+        async with self._lock:
+            if self.browser is not None and self._needs_recycle():
+                print(f"Browser pool: recycling browser after {self.pages_opened} pages.")
+                await self._close_browser()
+            if self.browser is None:
+                await self._launch()
+
+            context = await self.browser.new_context(**{**self.profile["context"], **context_options})
+
+        if request_rules and self.profile["block_requests"]:
+            await context.route("**/*", RequestFilter(**request_rules).handle)
+        context.on("page", self._count_page)
+        self.contexts.add(context)
+        return context
+
+    async def release(self, context):
+        """Close a context obtained from acquire()."""
+        self.contexts.discard(context)
+        try:
+            await context.close()
+        except Exception as e:
+            print(f"Browser pool: error closing context: {e}")
+
+    async def close(self):
+        """Close every context, the browser and Playwright."""
+        for context in list(self.contexts):
+            await self.release(context)
+        if self.browser is not None:
+            await self._close_browser()
+        if self.playwright is not None:
+            await self.playwright.stop()
+            self.playwright = None
+        print("Browser pool closed.")
+
+
+# Playwright objects belong to the event loop that created them
+_pools = weakref.WeakKeyDictionary()
+
+
+def get_browser_pool():
+    """The browser pool of the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = BrowserPool()
+    return pool
+
+
+async def close_browser_pool():
+    """Close the browser pool of the running event loop, if it was used."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
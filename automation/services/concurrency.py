@@ -0,0 +1,157 @@
+"""
+Concurrency Service
+Runs scraper work over a fixed set of browser pages with cooperative back-off.
+"""
+import asyncio
+import random
+import time
+
+
+class CooperativeBackoff:
+    """
+    Shared pacing for the workers of one site.
+
+    Every finished item is reported with record(). A slow or failed item
+    takes one worker out of rotation and pauses all of them for a jittered,
+    doubling delay; a run of quick items brings the delay down and the
+    workers back one at a time. Workers call wait_turn() before taking the
+    next item, so the site sees less traffic as soon as it slows down.
+    """
+
+    def __init__(self, max_workers, slow_seconds=60, base_delay=2.0, max_delay=60.0):
+        """
+        Args:
+            max_workers: Workers allowed while the site responds normally
+            slow_seconds: Item duration treated as a slowdown
+            base_delay: First pause after a slowdown, in seconds
+            max_delay: Longest pause, in seconds
+        """
+        self.max_workers = max(1, max_workers)
+        self.active_workers = self.max_workers
+        self.slow_seconds = slow_seconds
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self.delay = 0.0
+        self.resume_at = 0.0
+        self._healthy = 0
+        self._done = False
+        self._changed = asyncio.Condition()
+
+    async def wait_turn(self, slot):
+        """Block worker ``slot`` while it is out of rotation or the site is paused."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._done or slot < self.active_workers)
+
+        pause = self.resume_at - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+    async def record(self, elapsed, failed=False):
+        """Report one item that took ``elapsed`` seconds."""
+        async with self._changed:
+            if failed or elapsed > self.slow_seconds:
+                self.delay = min(max(self.delay * 2, self.base_delay), self.max_delay)
+                # Jitter so the workers do not come back in lockstep
+                self.resume_at = time.monotonic() + random.uniform(self.delay / 2, self.delay)
+                if self.active_workers > 1:
+                    self.active_workers -= 1
+                    print(f"Site is slowing down: {self.active_workers} worker(s), pausing ~{self.delay:.0f}s.")
+                self._healthy = 0
+                return
+
+            self.delay /= 2
+            self._healthy += 1
+            if self.active_workers < self.max_workers and self._healthy >= self.active_workers:
+                self.active_workers += 1
+                self._healthy = 0
+                self._changed.notify_all()
+
+    async def finish(self):
+        """Wake every waiting worker; called once there is nothing left to take."""
+        async with self._changed:
+            self._done = True
+            self._changed.notify_all()
+
+
+async def run_in_slots(items, slots, handle, backoff=None, is_failure=None):
+    """
+    Process ``items`` with one worker per slot (e.g. a page or a scraper
+    holding one), each taking the next item as soon as it is free.
+
+    Args:
+        items: Items to process
+        slots: One object per worker, passed to ``handle``
+        handle: ``async handle(slot, index, item)``; ``index`` is 0-based
+        backoff: CooperativeBackoff pacing the workers (default: none)
+        is_failure: ``is_failure(result)`` -> True when a result counts as a slowdown
+
+    Returns:
+        list: Results in the order of ``items`` (the exception, if ``handle`` raised)
+    """
+    queue = asyncio.Queue()
+    for index, item in enumerate(items):
+        queue.put_nowait((index, item))
+    results = [None] * len(items)
+
+    async def worker(slot_index, slot):
+        while True:
+            if backoff is not None and not queue.empty():
+                await backoff.wait_turn(slot_index)
+            try:
+                index, item = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                if backoff is not None:
+                    await backoff.finish()
+                return
+
+            started = time.monotonic()
+            try:
+                result = await handle(slot, index, item)
+                failed = bool(is_failure and is_failure(result))
+            except Exception as e:
+                result, failed = e, True
+            results[index] = result
+
+            if backoff is not None:
+                await backoff.record(time.monotonic() - started, failed)
+
+    await asyncio.gather(*(worker(slot_index, slot) for slot_index, slot in enumerate(slots)))
+    return results
+
+
+def backoff_delay(attempt, base_delay=1.0, max_delay=30.0):
+    """Jittered, doubling delay before retry ``attempt`` (1 = first retry)."""
+    cap = min(max_delay, base_delay * 2 ** (attempt - 1))
+    return random.uniform(cap / 2, cap)
+
+
+async def retry_with_backoff(operation, attempts=2, timeout=None, base_delay=1.0, max_delay=30.0, label="Operation"):
+    """
+    Await ``operation()`` up to ``attempts`` times, sleeping backoff_delay()
+    between attempts.
+
+    Args:
+        operation: Coroutine function to call for each attempt
+        attempts: Total number of attempts
+        timeout: Seconds allowed per attempt (default: no limit)
+        base_delay: Delay before the first retry, in seconds
+        max_delay: Longest delay, in seconds
+        label: Name used in the log
+
+    Returns:
+        The result of the first successful attempt; the last error is raised.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            if timeout:
+                return await asyncio.wait_for(operation(), timeout)
+            return await operation()
+        except Exception as e:
+            if attempt >= attempts:
+                raise
+            if timeout and isinstance(e, asyncio.TimeoutError):
+                e = f"timed out after {timeout}s"
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            print(f"{label} failed ({e}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
@@ -0,0 +1,116 @@
+"""
+Session Cache Service
+Keeps signed-in Playwright sessions on disk, encrypted, between runs.
+"""
+import hashlib
+import json
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".session_cache")
+
+
+class SessionCache:
+    """
+    Encrypted Playwright ``storage_state`` (cookies + local storage) of one
+    site and account.
+
+    The state is encrypted with Fernet using SESSION_CACHE_KEY (generate one
+    with ``Fernet.generate_key()``); without a key nothing is read or written
+    and every run signs in as before. Entries older than SESSION_CACHE_TTL
+    seconds are ignored.
+    """
+
+    def __init__(self, site, account):
+        """
+        Args:
+            site: Site name, e.g. "fieldedge" or "online_rme"
+            account: Login the session belongs to
+        """
+        self.site = site
+        self.account = account or ""
+
+        cache_dir = os.getenv("SESSION_CACHE_DIR", DEFAULT_CACHE_DIR)
+        # Hash the account so the login does not end up in the file name
+        digest = hashlib.sha256(f"{site}:{self.account}".encode("utf-8")).hexdigest()[:16]
+        self.path = os.path.join(cache_dir, f"{site}-{digest}.bin")
+        self.ttl = int(os.getenv("SESSION_CACHE_TTL", 12 * 60 * 60))
+        self.fernet = self._fernet()
+
+    def _fernet(self):
+        key = os.getenv("SESSION_CACHE_KEY")
+        if not key:
+            return None
+
+        from cryptography.fernet import Fernet
+
+        try:
+            return Fernet(key)
+        except ValueError as e:
+            print(f"Session cache disabled, invalid SESSION_CACHE_KEY: {e}")
+            return None
+
+    @property
+    def enabled(self):
+        return self.fernet is not None
+
+    def load(self):
+        """
+        Read the cached session.
+
+        Returns:
+            dict: storage_state for Browser.new_context(), or None if there is none
+        """
+        if not self.enabled:
+            return None
+
+        from cryptography.fernet import InvalidToken
+
+        try:
+            with open(self.path, "rb") as f:
+                token = f.read()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            print(f"Could not read {self.site} session cache: {e}")
+            return None
+
+        try:
+            state = json.loads(self.fernet.decrypt(token, ttl=self.ttl))
+        except (InvalidToken, ValueError):
+            # Expired, or written with another key
+            self.clear()
+            return None
+
+        print(f"Using cached {self.site} session.")
+        return state
+
+    def save(self, state):
+        """Encrypt and store ``state`` (from BrowserContext.storage_state())."""
+        if not self.enabled:
+            return
+
+        token = self.fernet.encrypt(json.dumps(state).encode("utf-8"))
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "wb") as f:
+                f.write(token)
+            os.replace(tmp_path, self.path)
+            print(f"Cached {self.site} session.")
+        except OSError as e:
+            print(f"Could not write {self.site} session cache: {e}")
+
+    def clear(self):
+        """Forget the cached session."""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Could not remove {self.site} session cache: {e}")
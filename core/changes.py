@@ -0,0 +1,260 @@
+"""
+Incremental change feed for the dashboard tables.
+
+Every save / delete of a tracked model appends a ``ChangeLog`` row. Clients
+poll ``GET <resource>/changes/?since=<cursor>`` and get back only the rows
+written after their cursor:
+
+* ``data``    - current state of created / updated rows (same serializer as the list)
+* ``deleted`` - tombstones, ``{"id": 7, "reason": "deleted" | "soft_deleted"}``
+* ``cursor``  - pass it as ``since`` on the next poll
+* ``reset``   - the cursor is older than the retained log (or missing): reload
+                the full list, then continue from ``cursor``
+
+Call the endpoint once without ``since`` before the initial full load, so no
+write between the two requests is lost.
+
+Entries are appended after the writing transaction commits (``on_commit``),
+so ids follow commit order even when a transaction runs for minutes (bulk
+syncs / upserts). The only remaining gap is between two concurrent log
+inserts (each a single short statement); ``CHANGE_FEED_SETTLE_SECONDS``
+holds the cursor back that long. The trade-off: a process that dies between
+the commit and the log insert loses those entries, like any post-commit hook.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Max, Min
+from django.db.models.signals import post_delete, post_save
+from django.utils import timezone
+from rest_framework.decorators import action
+from rest_framework.pagination import _positive_int
+from rest_framework.response import Response
+
+from core.signals import bulk_changed
+
+
+CHANGES_PAGE_SIZE = 500
+CHANGES_MAX_PAGE_SIZE = 1000
+
+
+
+def settle_seconds():
+    """
+    Entries younger than this may still be behind a concurrent log insert
+    with a lower id; the cursor stops before them so the next poll sees them.
+    """
+    return getattr(settings, 'CHANGE_FEED_SETTLE_SECONDS', 2)
+
+
+def settled_before():
+    return timezone.now() - timedelta(seconds=settle_seconds())
+
+
+def settled(entries, created_at):
+    """
+    The leading run of ``entries`` (in id order) older than settle_seconds(),
+    i.e. the ones a cursor may move past. ``created_at(entry)`` reads the
+    entry's timestamp.
+    """
+    cutoff = settled_before()
+    for index, entry in enumerate(entries):
+        if created_at(entry) > cutoff:
+            return entries[:index]
+    return entries
+
+
+_tracked = set()
+
+
+def track(model):
+    """Log every save / delete of ``model`` to the change log."""
+    _tracked.add(model)
+    post_save.connect(_log_save, sender=model, dispatch_uid=f'changes-save-{model._meta.label_lower}')
+    post_delete.connect(_log_delete, sender=model, dispatch_uid=f'changes-delete-{model._meta.label_lower}')
+    bulk_changed.connect(_log_bulk_change, sender=model, dispatch_uid=f'changes-bulk-{model._meta.label_lower}')
+
+
+def tracked_models():
+    return list(_tracked)
+
+
+def log_changes(model, object_ids, action):
+    """Append entries once the current transaction commits (right away in autocommit)."""
+    label = model._meta.label_lower
+    object_ids = list(object_ids)
+    transaction.on_commit(lambda: _write_entries(label, object_ids, action))
+
+
+def _write_entries(label, object_ids, action):
+    from core.models import ChangeLog
+
+    ChangeLog.objects.bulk_create([
+        ChangeLog(resource=label, object_id=object_id, action=action)
+        for object_id in object_ids
+    ])
+
+
+def _log_save(sender, instance, raw=False, **kwargs):
+    from core.models import ChangeLog
+
+    if raw:
+        return
+    log_changes(sender, [instance.pk], ChangeLog.UPSERT)
+
+
+def _log_delete(sender, instance, **kwargs):
+    from core.models import ChangeLog
+
+    log_changes(sender, [instance.pk], ChangeLog.DELETE)
+
+
+def _log_bulk_change(sender, ids, action, **kwargs):
+    # core.signals actions match ChangeLog.UPSERT / ChangeLog.DELETE
+    log_changes(sender, ids, action)
+
+
+def latest_cursor():
+    """Newest cursor that does not pass an entry younger than settle_seconds()."""
+    from core.models import ChangeLog
+
+    unsettled = ChangeLog.objects.filter(created_at__gt=settled_before()).aggregate(first=Min('id'))['first']
+    if unsettled is not None:
+        return unsettled - 1
+    return ChangeLog.objects.aggregate(latest=Max('id'))['latest'] or 0
+
+
+def last_change_id(model):
+    """Id of the newest entry for ``model`` (None before its first write): one (resource, id) index seek."""
+    from core.models import ChangeLog
+
+    return (
+        ChangeLog.objects.filter(resource=model._meta.label_lower)
+        .order_by('-id').values_list('id', flat=True).first()
+    )
+
+
+def cursor_is_stale(since):
+    """True when entries after ``since`` may already have been pruned."""
+    from core.models import ChangeLog
+
+    oldest = ChangeLog.objects.aggregate(oldest=Min('id'))['oldest']
+    return oldest is not None and since < oldest - 1
+
+
+def read_changes(model, since, limit):
+    """
+    ``(upserted ids, deleted ids, cursor, has_more)`` for ``model`` after ``since``.
+    Several entries for the same object collapse into its latest action.
+    """
+    from core.models import ChangeLog
+
+    entries = list(
+        ChangeLog.objects
+        .filter(resource=model._meta.label_lower, id__gt=since)
+        .order_by('id')
+        .values_list('id', 'object_id', 'action', 'created_at')[:limit + 1]
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    latest_action = {}
+    for _, object_id, change, _ in entries:
+        latest_action[object_id] = change
+
+    consumed = settled(entries, lambda entry: entry[3])
+    cursor = consumed[-1][0] if consumed else since
+
+    # Only ask for more right away when the whole page could be consumed
+    has_more = has_more and bool(entries) and len(consumed) == len(entries)
+
+    upserted = [pk for pk, change in latest_action.items() if change == ChangeLog.UPSERT]
+    deleted = [pk for pk, change in latest_action.items() if change == ChangeLog.DELETE]
+    return upserted, deleted, cursor, has_more
+
+
+def prune_change_log(days=None):
+    """Delete entries older than ``days`` (CHANGE_LOG_RETENTION_DAYS). The newest entry is always kept."""
+    from core.models import ChangeLog
+
+    if days is None:
+        days = getattr(settings, 'CHANGE_LOG_RETENTION_DAYS', 7)
+
+    latest = latest_cursor()
+    cutoff = timezone.now() - timedelta(days=days)
+    deleted, _ = ChangeLog.objects.filter(created_at__lt=cutoff, id__lt=latest).delete()
+    return deleted
+
+
+# =============================
+# VIEWSET MIXIN
+# =============================
+
+class ChangeFeedViewSetMixin:
+    """Adds ``GET <resource>/changes/?since=<cursor>&limit=<n>`` to a ModelViewSet."""
+    changes_since_param = 'since'
+    changes_limit_param = 'limit'
+
+    def get_changes_limit(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.changes_limit_param],
+                strict=True,
+                cutoff=CHANGES_MAX_PAGE_SIZE
+            )
+        except (KeyError, ValueError):
+            return CHANGES_PAGE_SIZE
+
+    @action(detail=False, methods=['get'], url_path='changes')
+    def changes(self, request):
+        since = request.query_params.get(self.changes_since_param)
+        try:
+            since = int(since) if since not in (None, '') else None
+        except ValueError:
+            since = None
+
+        # No usable cursor: the client reloads the list and continues from here
+        if since is None or since < 0 or cursor_is_stale(since):
+            return Response({
+                'success': True,
+                'reset': True,
+                'cursor': latest_cursor(),
+                'hasMore': False,
+                'data': [],
+                'deleted': []
+            })
+
+        model = self.get_queryset().model
+        upserted, deleted, cursor, has_more = read_changes(model, since, self.get_changes_limit(request))
+
+        tombstones = [{'id': pk, 'reason': 'deleted'} for pk in deleted]
+        rows = []
+        if upserted:
+            queryset = self.get_queryset().filter(pk__in=upserted)
+            soft_deleted = set()
+            if any(field.name == 'is_deleted' for field in model._meta.concrete_fields):
+                queryset = queryset.exclude(is_deleted=True)
+                soft_deleted = set(
+                    model._default_manager.filter(pk__in=upserted, is_deleted=True).values_list('pk', flat=True)
+                )
+
+            existing = {obj.pk: obj for obj in queryset}
+            for pk in upserted:
+                if pk in existing:
+                    rows.append(existing[pk])
+                elif pk in soft_deleted:
+                    tombstones.append({'id': pk, 'reason': 'soft_deleted'})
+                else:
+                    # Deleted after the logged update
+                    tombstones.append({'id': pk, 'reason': 'deleted'})
+
+        serializer = self.get_serializer(rows, many=True)
+        return Response({
+            'success': True,
+            'reset': False,
+            'cursor': cursor,
+            'hasMore': has_more,
+            'data': serializer.data,
+            'deleted': tombstones
+        })
@@ -0,0 +1,126 @@
+"""
+Database helpers shared by the apps.
+"""
+import uuid
+
+from django.db import connections, router
+from django.db.models import Count
+
+
+def upsert_options(model, unique_fields, update_fields):
+    """
+    ``bulk_create()`` keyword arguments for an INSERT ... ON CONFLICT upsert.
+
+    MySQL's ON DUPLICATE KEY UPDATE takes no conflict target (any unique key
+    matches) and Django rejects ``unique_fields`` there, so it is only passed
+    to backends that support it (PostgreSQL, SQLite).
+    """
+    options = {'update_conflicts': True, 'update_fields': list(update_fields)}
+    if connections[router.db_for_write(model)].features.supports_update_conflicts_with_target:
+        options['unique_fields'] = list(unique_fields)
+    return options
+
+
+# Conflicts listed in the error message; the rest are summarized
+MAX_LISTED = 50
+
+
+def duplicate_report(model, field, queryset):
+    """
+    For migrations adding a unique constraint: an error message listing the
+    values of ``field`` held by several rows of ``queryset`` (with their ids),
+    or None when the values are already unique.
+    """
+    duplicates = list(
+        queryset
+        .values(field)
+        .annotate(rows=Count('id'))
+        .filter(rows__gt=1)
+        .order_by(field)
+        .values_list(field, flat=True)
+    )
+    if not duplicates:
+        return None
+
+    lines = []
+    for value in duplicates[:MAX_LISTED]:
+        ids = list(queryset.filter(**{field: value}).order_by('id').values_list('id', flat=True))
+        lines.append(f"  {value!r}: ids {ids}")
+    if len(duplicates) > MAX_LISTED:
+        lines.append(f"  ... and {len(duplicates) - MAX_LISTED} more")
+
+    return (
+        f"Cannot make {model._meta.label}.{field} unique: {len(duplicates)} value(s) are used by "
+        f"several rows. Merge or delete the duplicate rows by hand, "
+        f"then run the migration again.\n" + "\n".join(lines)
+    )
+
+
+def unique_fields(model):
+    """Concrete single-column unique fields of ``model`` other than the primary key."""
+    return [field for field in model._meta.concrete_fields if field.unique and not field.primary_key]
+
+
+def unique_conflicts(model, rows):
+    """
+    Check the unique fields of a batch of updated rows before a bulk_update().
+
+    ``rows`` maps each pk to its updated instance, in request order. Returns
+    ``{pk: {field: [message]}}`` for the rows whose new value is also held by
+    another row of the batch (as it will be after the update) or by a row
+    outside it; the latter is one IN query per unique field. Values the
+    batch moves between its own rows (e.g. a swap) are not conflicts.
+    """
+    conflicts = {}
+    for field in unique_fields(model):
+        holders = {}
+        for pk, instance in rows.items():
+            value = getattr(instance, field.attname)
+            if value is None:
+                continue
+            other = holders.setdefault(value, pk)
+            if other != pk:
+                conflicts.setdefault(pk, {})[field.name] = [
+                    f"Row {other} in this request also sets {field.name} to '{value}'."
+                ]
+
+        if not holders:
+            continue
+        taken = (
+            model._default_manager
+            .filter(**{f'{field.attname}__in': list(holders)})
+            .exclude(pk__in=list(rows))
+            .values_list(field.attname, flat=True)
+        )
+        message = field.error_messages['unique'] % {
+            'model_name': model._meta.verbose_name, 'field_label': field.verbose_name
+        }
+        for value in taken:
+            conflicts.setdefault(holders[value], {})[field.name] = [message]
+    return conflicts
+
+
+def release_unique_values(model, rows, originals):
+    """
+    Before a bulk_update() of ``rows`` (pk -> updated instance): when a row
+    takes a unique value another row of the batch gives up, first park the
+    changed values on placeholders (NULL, or a random string for NOT NULL
+    columns). A single UPDATE is checked row by row, so a swap or a chain of
+    renames would otherwise collide with itself.
+
+    ``originals`` maps each pk to ``{attname: value}`` as loaded.
+    """
+    for field in unique_fields(model):
+        name = field.attname
+        moving = [pk for pk, instance in rows.items() if getattr(instance, name) != originals[pk][name]]
+        new_values = {getattr(rows[pk], name) for pk in moving}
+        if not new_values & {originals[pk][name] for pk in moving}:
+            continue
+
+        final = {pk: getattr(rows[pk], name) for pk in moving}
+        for pk in moving:
+            placeholder = None if field.null else uuid.uuid4().hex[:field.max_length]
+            setattr(rows[pk], name, placeholder)
+        model._default_manager.bulk_update([rows[pk] for pk in moving], [name], batch_size=500)
+        for pk, value in final.items():
+            setattr(rows[pk], name, value)
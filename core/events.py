@@ -0,0 +1,345 @@
+"""
+Server-Sent Events push channel for dashboard changes.
+
+Saves and deletes of the models registered here publish a small event
+(``{"id", "resource", "action", "object_id"}``) once the transaction
+commits. ``GET /api/events/`` streams them to the browser as
+``event: change`` frames; the client then refreshes the row through the
+change feed (core.changes) or the detail endpoint.
+
+The broker is pluggable (``EVENTS_BROKER`` setting, dotted path):
+
+* ``core.events.ChangeLogBroker`` (default) - reads the ChangeLog table with
+  one poller per process, so events written by any process (scheduler,
+  scrapers, other workers) reach every subscriber.
+* ``core.events.LocalBroker`` - in-memory, single process. Used in tests.
+
+A client that reconnects with ``Last-Event-ID`` gets what it missed; when
+that is no longer available it gets an ``event: reset`` frame and should
+reload its lists.
+"""
+import asyncio
+import json
+import threading
+from collections import deque
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.module_loading import import_string
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from core.signals import DELETE, UPSERT, bulk_changed
+
+
+HEARTBEAT_SECONDS = 15
+RETRY_MILLISECONDS = 3000
+
+_broker = None
+
+
+# =============================
+# BROKERS
+# =============================
+
+class LocalBroker:
+    """
+    In-memory broker for a single process.
+
+    Keeps the last ``buffer_size`` events for ``Last-Event-ID`` resumes.
+    ``publish`` may be called from any thread; waiting subscribers are woken
+    on their own event loop.
+    """
+    buffer_size = 1000
+
+    def __init__(self):
+        self._events = deque(maxlen=self.buffer_size)
+        self._lock = threading.Lock()
+        self._waiters = set()
+        self._last_id = 0
+
+    def publish(self, resource, action, object_id):
+        with self._lock:
+            event_id = self._last_id + 1
+            self._store([{'id': event_id, 'resource': resource, 'action': action, 'object_id': object_id}])
+            waiters = list(self._waiters)
+        self._wake(waiters)
+
+    def _append(self, events):
+        with self._lock:
+            self._store(events)
+            waiters = list(self._waiters)
+        self._wake(waiters)
+
+    def _store(self, events):
+        """Buffer ``events`` and move ``_last_id`` past them; the caller holds the lock."""
+        self._events.extend(events)
+        self._last_id = events[-1]['id']
+
+    def _wake(self, waiters):
+        for loop, flag in waiters:
+            try:
+                loop.call_soon_threadsafe(flag.set)
+            except RuntimeError:
+                # The subscriber's loop is already closed
+                pass
+
+    async def latest_id(self):
+        return self._last_id
+
+    async def backlog(self, after):
+        """Buffered events after ``after``, or None when some were already dropped."""
+        with self._lock:
+            events = list(self._events)
+
+        if events and after < events[0]['id'] - 1:
+            return None
+        if not events and after < self._last_id:
+            return None
+        return [event for event in events if event['id'] > after]
+
+    async def next_events(self, after, timeout):
+        """
+        Events after ``after``, waiting up to ``timeout`` seconds for the
+        first one. Returns [] on timeout and None when the client must reset.
+        """
+        flag = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), flag)
+        with self._lock:
+            self._waiters.add(waiter)
+
+        try:
+            events = await self.backlog(after)
+            if events is None or events or timeout <= 0:
+                return events
+            try:
+                await asyncio.wait_for(flag.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+            return await self.backlog(after)
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+
+class ChangeLogBroker(LocalBroker):
+    """
+    Broker fed by the ChangeLog table (models tracked with core.changes.track).
+
+    ``publish`` is a no-op: the ChangeLog row written by the save hook *is*
+    the event. One poller per process reads new rows every ``poll_interval``
+    seconds while somebody is listening, so the database cost does not grow
+    with the number of connected clients.
+
+    Rows are only sent once they are CHANGE_FEED_SETTLE_SECONDS old, like the
+    change feed cursor (core.changes.settled): a younger row may still have
+    a lower id being inserted by another transaction, which an event id past
+    it would skip for good.
+    """
+    poll_interval = 1
+    idle_polls = 30
+    batch_size = 500
+
+    def __init__(self):
+        super().__init__()
+        self._poller = None
+
+    def publish(self, resource, action, object_id):
+        pass
+
+    async def latest_id(self):
+        from core.changes import latest_cursor
+
+        return await sync_to_async(latest_cursor)()
+
+    async def _ensure_poller(self):
+        if self._poller is not None and not self._poller.done():
+            return
+
+        # Rows written while nobody listened are read back by backlog()
+        latest = await self.latest_id()
+        with self._lock:
+            self._events.clear()
+            self._last_id = latest
+        self._poller = asyncio.get_running_loop().create_task(self._poll())
+
+    async def _poll(self):
+        idle = 0
+        while idle < self.idle_polls:
+            await asyncio.sleep(self.poll_interval)
+            with self._lock:
+                idle = 0 if self._waiters else idle + 1
+                after = self._last_id
+
+            events = await sync_to_async(self._read)(after, self.batch_size)
+            if events:
+                self._append(events)
+
+    def _read(self, after, limit):
+        """Settled rows after ``after`` (see core.changes.settled)."""
+        from core.changes import settled
+        from core.models import ChangeLog
+
+        rows = list(
+            ChangeLog.objects
+            .filter(id__gt=after)
+            .order_by('id')
+            .values_list('id', 'resource', 'action', 'object_id', 'created_at')[:limit]
+        )
+        return [
+            {'id': event_id, 'resource': resource, 'action': action, 'object_id': object_id}
+            for event_id, resource, action, object_id, _ in settled(rows, lambda row: row[4])
+        ]
+
+    async def backlog(self, after):
+        if after >= self._last_id:
+            return []
+
+        events = await super().backlog(after)
+        if events is not None:
+            return events
+
+        # Older than the buffer: read it back from the table unless pruned
+        from core.changes import cursor_is_stale
+
+        if await sync_to_async(cursor_is_stale)(after):
+            return None
+        return await sync_to_async(self._read)(after, self.batch_size)
+
+    async def next_events(self, after, timeout):
+        if timeout <= 0:
+            # One-shot read (WSGI fallback): not worth starting the poller
+            from core.changes import cursor_is_stale
+
+            if await sync_to_async(cursor_is_stale)(after):
+                return None
+            return await sync_to_async(self._read)(after, self.batch_size)
+
+        await self._ensure_poller()
+        return await super().next_events(after, timeout)
+
+
+def get_broker():
+    """Broker selected by ``settings.EVENTS_BROKER`` (created once per process)."""
+    global _broker
+
+    if _broker is None:
+        path = getattr(settings, 'EVENTS_BROKER', 'core.events.ChangeLogBroker')
+        _broker = import_string(path)()
+    return _broker
+
+
+# =============================
+# SAVE HOOKS
+# =============================
+
+def register(model):
+    """Publish an event after every committed save / delete of ``model``."""
+    label = model._meta.label_lower
+    post_save.connect(_publish_on_save, sender=model, dispatch_uid=f'events-save-{label}')
+    post_delete.connect(_publish_on_delete, sender=model, dispatch_uid=f'events-delete-{label}')
+    bulk_changed.connect(_publish_on_bulk_change, sender=model, dispatch_uid=f'events-bulk-{label}')
+
+
+def publish_on_commit(model, object_ids, action):
+    for object_id in object_ids:
+        transaction.on_commit(partial(get_broker().publish, model._meta.label_lower, action, object_id))
+
+
+def _publish_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    publish_on_commit(sender, [instance.pk], UPSERT)
+
+
+def _publish_on_delete(sender, instance, **kwargs):
+    publish_on_commit(sender, [instance.pk], DELETE)
+
+
+def _publish_on_bulk_change(sender, ids, action, **kwargs):
+    publish_on_commit(sender, ids, action)
+
+
+# =============================
+# SSE VIEW
+# =============================
+
+@sync_to_async
+def _authenticate(request):
+    """
+    User for the JWT in ``?token=`` (EventSource cannot send headers) or in
+    the Authorization header; None when missing or invalid.
+    """
+    authenticator = JWTAuthentication()
+
+    raw_token = request.GET.get('token')
+    if not raw_token:
+        header = authenticator.get_header(request)
+        raw_token = authenticator.get_raw_token(header) if header else None
+    if not raw_token:
+        return None
+
+    try:
+        return authenticator.get_user(authenticator.get_validated_token(raw_token))
+    except (InvalidToken, TokenError, AuthenticationFailed):
+        return None
+
+
+def _format_event(event_id, name, data):
+    return f"id: {event_id}\nevent: {name}\ndata: {json.dumps(data)}\n\n"
+
+
+async def event_stream(request):
+    """
+    ``GET /api/events/?token=<access token>`` - text/event-stream of change events.
+
+    Needs an ASGI server (``uvicorn core.asgi:application``) to stay open.
+    Under WSGI the response only carries the events missed since
+    ``Last-Event-ID`` and closes, and the browser reconnects after ``retry``.
+    """
+    user = await _authenticate(request)
+    if user is None:
+        return JsonResponse({
+            'success': False,
+            'message': 'Authentication credentials were not provided or are invalid.'
+        }, status=401)
+
+    broker = get_broker()
+    keep_open = isinstance(request, ASGIRequest)
+
+    try:
+        last_id = int(request.headers.get('Last-Event-ID') or request.GET.get('lastEventId'))
+    except (TypeError, ValueError):
+        last_id = await broker.latest_id()
+
+    async def stream():
+        cursor = last_id
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+
+        while True:
+            events = await broker.next_events(cursor, HEARTBEAT_SECONDS if keep_open else 0)
+
+            if events is None:
+                cursor = await broker.latest_id()
+                yield _format_event(cursor, 'reset', {'cursor': cursor})
+            elif events:
+                for event in events:
+                    cursor = event['id']
+                    yield _format_event(cursor, 'change', event)
+            elif keep_open:
+                # Keeps proxies from closing an idle connection
+                yield ": ping\n\n"
+
+            if not keep_open:
+                return
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from core.changes import prune_change_log
+
+
+class Command(BaseCommand):
+    help = "Delete change feed entries older than CHANGE_LOG_RETENTION_DAYS."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=None, help="Override CHANGE_LOG_RETENTION_DAYS")
+
+    def handle(self, *args, **options):
+        deleted = prune_change_log(options['days'])
+        self.stdout.write(f"Deleted {deleted} change log entries.")
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from core import search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the search token index for every model registered in core.search."
+
+    def handle(self, *args, **options):
+        backend = search.get_search_backend()
+        self.stdout.write(f"Search backend: {backend.name}")
+
+        for model in search.registered_models():
+            count = search.reindex(model)
+            self.stdout.write(f"Indexed {count} {model._meta.verbose_name_plural}.")
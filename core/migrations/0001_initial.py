@@ -0,0 +1,27 @@
+# Generated by Django 5.2.10 on 2026-10-17 01:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(help_text='Model label, e.g. locates.workordertoday', max_length=100)),
+                ('object_id', models.BigIntegerField()),
+                ('token', models.CharField(max_length=3)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['model', 'token', 'object_id'], name='core_search_model_dba9b3_idx')],
+                'unique_together': {('model', 'object_id', 'token')},
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+from django.db import migrations
+
+
+# Copy of core.search.tokenize as of this migration, so later changes to it
+# do not change what this migration writes
+TOKEN_SIZE = 3
+
+
+def tokenize(value):
+    text = str(value).lower()
+    return {text[i:i + TOKEN_SIZE] for i in range(len(text) - TOKEN_SIZE + 1)}
+
+
+# Snapshot of the fields registered in LocatesConfig / TankRepairConfig.ready()
+SEARCH_FIELDS = {
+    ('locates', 'WorkOrderToday'): ['wo_number', 'full_address', 'technician', 'notes'],
+    ('tank_repair', 'TankRepair'): ['work_order_number', 'name', 'address', 'notes', 'assigned_to'],
+}
+
+
+def backfill_tokens(apps, schema_editor):
+    SearchToken = apps.get_model('core', 'SearchToken')
+
+    for (app_label, model_name), fields in SEARCH_FIELDS.items():
+        model = apps.get_model(app_label, model_name)
+        label = f'{app_label}.{model_name.lower()}'
+
+        rows = []
+        for values in model.objects.values_list('pk', *fields).iterator(chunk_size=500):
+            pk, grams = values[0], set()
+            for value in values[1:]:
+                if value:
+                    grams |= tokenize(value)
+            rows.extend(SearchToken(model=label, object_id=pk, token=gram) for gram in grams)
+
+            if len(rows) >= 5000:
+                SearchToken.objects.bulk_create(rows, ignore_conflicts=True)
+                rows = []
+        SearchToken.objects.bulk_create(rows, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+        ('locates', '0012_workordertoday_search_fulltext'),
+        ('tank_repair', '0002_tankrepair_search_fulltext'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_tokens, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.10 on 2026-10-17 01:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_backfill_search_tokens'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLog',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('resource', models.CharField(help_text='Model label, e.g. locates.locates', max_length=100)),
+                ('object_id', models.BigIntegerField()),
+                ('action', models.CharField(choices=[('upsert', 'Created / updated'), ('delete', 'Hard deleted')], max_length=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['resource', 'id'], name='core_change_resourc_9c38d6_idx'), models.Index(fields=['created_at'], name='core_change_created_1da5d6_idx')],
+            },
+        ),
+    ]
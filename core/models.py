@@ -0,0 +1,47 @@
+from django.db import models
+
+
+class SearchToken(models.Model):
+    """
+    Trigram index row used by the token search backend (core.search).
+    One row per distinct lower-cased trigram found in an object's search fields.
+    """
+    model = models.CharField(max_length=100, help_text="Model label, e.g. locates.workordertoday")
+    object_id = models.BigIntegerField()
+    token = models.CharField(max_length=3)
+
+    class Meta:
+        unique_together = ('model', 'object_id', 'token')
+        indexes = [
+            models.Index(fields=['model', 'token', 'object_id'])
+        ]
+
+    def __str__(self):
+        return f"{self.model}:{self.object_id} '{self.token}'"
+
+
+class ChangeLog(models.Model):
+    """
+    Append-only log of writes to the models tracked by core.changes.
+    The auto-increment id is the cursor handed to change-feed clients.
+    """
+    UPSERT = 'upsert'
+    DELETE = 'delete'
+    ACTION_CHOICES = [
+        (UPSERT, 'Created / updated'),
+        (DELETE, 'Hard deleted'),
+    ]
+
+    resource = models.CharField(max_length=100, help_text="Model label, e.g. locates.locates")
+    object_id = models.BigIntegerField()
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['resource', 'id']),
+            models.Index(fields=['created_at']),
+        ]
+
+    def __str__(self):
+        return f"#{self.id} {self.action} {self.resource}:{self.object_id}"
@@ -1,7 +1,8 @@
 # core/scheduler.py
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from automation.main import start_scraping
+from locates.scrape_runs import start_scrape_run
+from core.changes import prune_change_log
 from dotenv import load_dotenv
 import os
 
@@ -11,6 +12,8 @@ load_dotenv()
 def start():
     scheduler = BackgroundScheduler()
     
-    scheduler.add_job(start_scraping, 'interval', minutes=int(os.getenv('interval_minutes', 10)))
+    # Skipped when a scrape (e.g. started from the dashboard) is still running
+    scheduler.add_job(start_scrape_run, 'interval', minutes=int(os.getenv('interval_minutes', 10)), kwargs={'trigger': 'scheduler'})
+    scheduler.add_job(prune_change_log, 'interval', hours=24)
     
     scheduler.start()
\ No newline at end of file
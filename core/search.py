@@ -0,0 +1,283 @@
+"""
+Pluggable search backends for DRF ``search_fields``.
+
+DRF's SearchFilter turns every term into ``LIKE '%term%'`` on each field,
+which is a full table scan per field. ``IndexedSearchFilter`` keeps exactly
+the same matching rules (case-insensitive substring, every term must match
+some field) but first narrows the candidate rows with an index:
+
+* ``fulltext`` - a MySQL FULLTEXT index built WITH PARSER ngram.
+* ``tokens``   - the ``SearchToken`` trigram table, kept up to date from
+                 post_save / post_delete (works on any database, incl. SQLite).
+* ``like``     - plain DRF behaviour.
+
+The candidate set is always re-checked with the original ``icontains``
+condition, so results are identical to a LIKE search.
+
+Select the backend with the ``SEARCH_BACKEND`` setting (default ``auto``:
+``fulltext`` on MySQL when usable, ``tokens`` otherwise).
+"""
+import logging
+import operator
+from functools import reduce
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Count, F, FloatField, Func, Q, Value
+from django.db.models.signals import post_delete, post_save
+from rest_framework import filters
+
+from core.signals import DELETE, bulk_changed
+
+
+logger = logging.getLogger(__name__)
+
+TOKEN_SIZE = 3
+
+# Model -> {'fields': [...], 'fulltext_index': name or None}
+_registry = {}
+_backend = None
+
+
+def register(model, fields, fulltext_index=None):
+    """
+    Make ``fields`` of ``model`` searchable through the indexed backends.
+
+    ``fulltext_index`` is the name of the MySQL FULLTEXT index that covers
+    exactly these columns (created by a migration of the owning app).
+    """
+    _registry[model] = {'fields': list(fields), 'fulltext_index': fulltext_index}
+    post_save.connect(_index_on_save, sender=model, dispatch_uid=f'search-save-{model._meta.label_lower}')
+    post_delete.connect(_unindex_on_delete, sender=model, dispatch_uid=f'search-delete-{model._meta.label_lower}')
+    bulk_changed.connect(_index_on_bulk_change, sender=model, dispatch_uid=f'search-bulk-{model._meta.label_lower}')
+
+
+def registered_models():
+    return list(_registry)
+
+
+def registered_fields(model):
+    entry = _registry.get(model)
+    return entry['fields'] if entry else []
+
+
+def tokenize(value):
+    """Distinct lower-cased trigrams of ``value``."""
+    text = str(value).lower()
+    return {text[i:i + TOKEN_SIZE] for i in range(len(text) - TOKEN_SIZE + 1)}
+
+
+# =============================
+# BACKENDS
+# =============================
+
+class LikeSearchBackend:
+    """Plain ``icontains`` on every field, same as DRF's SearchFilter."""
+    name = 'like'
+
+    def like_condition(self, fields, term):
+        return reduce(operator.or_, (Q(**{f'{field}__icontains': term}) for field in fields))
+
+    def filter(self, queryset, fields, term):
+        return queryset.filter(self.like_condition(fields, term))
+
+    def index_objects(self, model, objects):
+        pass
+
+    def remove_objects(self, model, object_ids):
+        pass
+
+
+class TokenSearchBackend(LikeSearchBackend):
+    """Trigram candidate lookup in ``SearchToken``, verified with ``icontains``."""
+    name = 'tokens'
+
+    def filter(self, queryset, fields, term):
+        like = self.like_condition(fields, term)
+        grams = tokenize(term)
+
+        # Terms shorter than a trigram, or fields that are not indexed, fall back to LIKE
+        if not grams or not set(fields) <= set(registered_fields(queryset.model)):
+            return queryset.filter(like)
+
+        from core.models import SearchToken
+
+        candidates = (
+            SearchToken.objects
+            .filter(model=queryset.model._meta.label_lower, token__in=grams)
+            .values('object_id')
+            .annotate(hits=Count('token'))
+            .filter(hits=len(grams))
+            .values('object_id')
+        )
+        return queryset.filter(pk__in=candidates).filter(like)
+
+    def index_objects(self, model, objects):
+        from core.models import SearchToken
+
+        label = model._meta.label_lower
+        fields = registered_fields(model)
+        objects = list(objects)
+
+        rows = []
+        for obj in objects:
+            grams = set()
+            for field in fields:
+                value = getattr(obj, field, None)
+                if value:
+                    grams |= tokenize(value)
+            rows.extend(SearchToken(model=label, object_id=obj.pk, token=gram) for gram in grams)
+
+        with transaction.atomic():
+            SearchToken.objects.filter(model=label, object_id__in=[obj.pk for obj in objects]).delete()
+            SearchToken.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+    def remove_objects(self, model, object_ids):
+        from core.models import SearchToken
+
+        SearchToken.objects.filter(model=model._meta.label_lower, object_id__in=list(object_ids)).delete()
+
+
+class MatchAgainst(Func):
+    """``MATCH (columns) AGAINST (query IN BOOLEAN MODE)`` for a MySQL FULLTEXT index."""
+    output_field = FloatField()
+
+    def __init__(self, fields, query):
+        super().__init__(*[F(field) for field in fields], Value(query))
+
+    def as_sql(self, compiler, connection, **extra_context):
+        *columns, query = self.get_source_expressions()
+        column_sql = [compiler.compile(column)[0] for column in columns]
+        query_sql, query_params = compiler.compile(query)
+        sql = f"MATCH ({', '.join(column_sql)}) AGAINST ({query_sql} IN BOOLEAN MODE)"
+        return sql, query_params
+
+
+class MySQLFullTextSearchBackend(LikeSearchBackend):
+    """
+    Phrase search on an ngram FULLTEXT index, verified with ``icontains``.
+
+    A quoted phrase matches the consecutive n-grams of the term, i.e. any
+    substring at least ``ngram_token_size`` long.
+    """
+    name = 'fulltext'
+
+    def __init__(self, ngram_token_size=2):
+        self.ngram_token_size = ngram_token_size
+
+    def filter(self, queryset, fields, term):
+        like = self.like_condition(fields, term)
+        entry = _registry.get(queryset.model)
+
+        # The MATCH column list has to be exactly the FULLTEXT index columns
+        if (not entry or not entry['fulltext_index'] or set(fields) != set(entry['fields'])
+                or len(term) < self.ngram_token_size):
+            return queryset.filter(like)
+
+        phrase = '"%s"' % term.replace('"', ' ')
+        return (
+            queryset
+            .alias(search_match=MatchAgainst(entry['fields'], phrase))
+            .filter(search_match__gt=0)
+            .filter(like)
+        )
+
+
+def _mysql_fulltext_settings():
+    """Return ngram_token_size when the server can serve ngram phrase search, else None."""
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT @@innodb_ft_enable_stopword, @@ngram_token_size")
+        stopwords_enabled, ngram_token_size = cursor.fetchone()
+
+    # With stopwords on, the ngram parser drops every n-gram containing one
+    # (e.g. "a"), so phrase matches would miss rows LIKE finds.
+    if stopwords_enabled:
+        return None
+    return int(ngram_token_size)
+
+
+def get_search_backend():
+    """Backend selected by ``settings.SEARCH_BACKEND`` (resolved once per process)."""
+    global _backend
+
+    if _backend is None:
+        choice = getattr(settings, 'SEARCH_BACKEND', 'auto')
+
+        if choice == 'like':
+            _backend = LikeSearchBackend()
+        elif choice == 'tokens':
+            _backend = TokenSearchBackend()
+        elif connection.vendor == 'mysql' and choice in ('auto', 'fulltext'):
+            ngram_token_size = _mysql_fulltext_settings()
+            if ngram_token_size:
+                _backend = MySQLFullTextSearchBackend(ngram_token_size)
+            else:
+                logger.warning("MySQL FULLTEXT search unavailable (innodb_ft_enable_stopword is ON); using token index.")
+                _backend = TokenSearchBackend()
+        else:
+            _backend = TokenSearchBackend()
+
+    return _backend
+
+
+def reindex(model, queryset=None):
+    """Rebuild the search index for ``model`` (or just the rows in ``queryset``)."""
+    backend = get_search_backend()
+    queryset = queryset if queryset is not None else model._default_manager.all()
+
+    count = 0
+    batch = []
+    for obj in queryset.iterator(chunk_size=500):
+        batch.append(obj)
+        if len(batch) == 500:
+            backend.index_objects(model, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        backend.index_objects(model, batch)
+        count += len(batch)
+    return count
+
+
+def _index_on_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    get_search_backend().index_objects(sender, [instance])
+
+
+def _unindex_on_delete(sender, instance, **kwargs):
+    get_search_backend().remove_objects(sender, [instance.pk])
+
+
+def _index_on_bulk_change(sender, ids, action, **kwargs):
+    if action == DELETE:
+        get_search_backend().remove_objects(sender, ids)
+    else:
+        reindex(sender, sender._default_manager.filter(pk__in=ids))
+
+
+# =============================
+# DRF FILTER BACKEND
+# =============================
+
+class IndexedSearchFilter(filters.SearchFilter):
+    """
+    Drop-in replacement for ``rest_framework.filters.SearchFilter`` that
+    resolves each search term through the configured search backend.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        search_fields = self.get_search_fields(view, request)
+        search_terms = self.get_search_terms(request)
+
+        if not search_fields or not search_terms:
+            return queryset
+
+        # Prefixed ('^', '=', '@', '$') or related lookups keep DRF's behaviour
+        if any(not field.isidentifier() or '__' in field for field in search_fields):
+            return super().filter_queryset(request, queryset, view)
+
+        backend = get_search_backend()
+        for term in search_terms:
+            queryset = backend.filter(queryset, search_fields, term)
+        return queryset
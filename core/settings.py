@@ -103,6 +103,56 @@ DATABASES = {
 }
 
 
+# Search backend for list endpoints (core.search): auto | fulltext | tokens | like
+# "auto" uses the MySQL ngram FULLTEXT index when available, the token table otherwise.
+SEARCH_BACKEND = os.getenv('SEARCH_BACKEND', 'auto')
+
+# Change feed (core.changes): entries older than this are pruned daily;
+# clients with an older cursor are told to reload.
+CHANGE_LOG_RETENTION_DAYS = int(os.getenv('CHANGE_LOG_RETENTION_DAYS', 7))
+
+# Change feed cursors and push events stop this many seconds short of the newest
+# entries, so a concurrent log insert with a lower id is not skipped (see core.changes).
+CHANGE_FEED_SETTLE_SECONDS = int(os.getenv('CHANGE_FEED_SETTLE_SECONDS', 2))
+
+# Push channel broker (core.events). ChangeLogBroker works across processes;
+# core.events.LocalBroker keeps everything in memory (single process / tests).
+EVENTS_BROKER = os.getenv('EVENTS_BROKER', 'core.events.ChangeLogBroker')
+
+# Cache used for shared list responses (locates.list_cache). Entries are keyed
+# on the data fingerprint, so local memory stays correct with several workers;
+# point CACHE_BACKEND / CACHE_LOCATION at Redis or Memcached to share them.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
+# Seconds a cached list may be served; 0 disables the list cache.
+LIST_CACHE_TIMEOUT = int(os.getenv('LIST_CACHE_TIMEOUT', 60))
+
+# Seconds a /api/dashboard-summary/ response may be served from the cache.
+SUMMARY_CACHE_TIMEOUT = int(os.getenv('SUMMARY_CACHE_TIMEOUT', 30))
+
+# Online RME automation queue (locates.jobs, run_automation_jobs command):
+# a task running longer than AUTOMATION_JOB_TIMEOUT seconds is killed and failed.
+AUTOMATION_JOB_TIMEOUT = int(os.getenv('AUTOMATION_JOB_TIMEOUT', 900))
+AUTOMATION_JOB_POLL_SECONDS = float(os.getenv('AUTOMATION_JOB_POLL_SECONDS', 2))
+# The worker's resident browser is restarted after this many jobs.
+AUTOMATION_WORKER_MAX_JOBS = int(os.getenv('AUTOMATION_WORKER_MAX_JOBS', 50))
+# Queued locks / deletes the worker runs together in one work history pass.
+AUTOMATION_BATCH_SIZE = int(os.getenv('AUTOMATION_BATCH_SIZE', 20))
+
+# A scrape run without a heartbeat for this many seconds is treated as dead
+# (locates.scrape_runs), so a new run can start.
+SCRAPE_RUN_STALE_SECONDS = int(os.getenv('SCRAPE_RUN_STALE_SECONDS', 300))
+
+# Scraper browser (automation.services.browser_pool.BROWSER_PROFILES): "debug" is
+# a visible browser, "server" is headless and applies the request_blocking rules.
+BROWSER_PROFILE = os.getenv('BROWSER_PROFILE', 'debug')
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -184,6 +234,8 @@ CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOWED_ORIGINS = [
     x.strip() for x in os.getenv('CORS_ALLOWED_ORIGINS', '').split(',')
 ]
+# Let the dashboard read the validators (for If-None-Match on its polls) and the bulk create skip count
+CORS_EXPOSE_HEADERS = ['ETag', 'Last-Modified', 'X-Skipped-Duplicates']
 
 # GMT-8
 USE_TZ = True
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""
+Signals for writes that bypass the model save / delete hooks.
+
+``bulk_create``, ``bulk_update`` and ``QuerySet.update()`` do not send
+post_save / post_delete, so code that uses them sends ``bulk_changed``
+afterwards. The search index, change log, push events and list cache all
+listen to it for the models they track:
+
+    bulk_changed.send(sender=WorkOrderToday, ids=[...], action='upsert')
+
+``action`` is 'upsert' (created / updated) or 'delete'.
+"""
+from django.dispatch import Signal
+
+
+UPSERT = 'upsert'
+DELETE = 'delete'
+
+bulk_changed = Signal()
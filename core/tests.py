@@ -0,0 +1,188 @@
+import asyncio
+import threading
+from datetime import timedelta
+from unittest import mock, skipUnless
+
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework import filters
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from accounts.models import User
+from core import events, search
+from core.changes import latest_cursor
+from core.events import ChangeLogBroker, LocalBroker
+from core.models import ChangeLog
+from core.search import IndexedSearchFilter, LikeSearchBackend, MySQLFullTextSearchBackend, TokenSearchBackend
+from locates.models import WorkOrderToday
+from tank_repair.models import TankRepair
+
+
+WORK_ORDER_FIELDS = ['wo_number', 'full_address', 'technician', 'notes']
+TANK_REPAIR_FIELDS = ['work_order_number', 'name', 'address', 'notes', 'assigned_to']
+
+# Prefixes, substrings, mixed case, terms shorter than a trigram and misses
+TERMS = ['WO', 'wo-102', '10231', '023', '23', '3', 'main', 'MAIN ST', 'n st', 'Ocean', 'ann', 'a', 'zzz', '']
+
+
+class SearchBackendEquivalenceTests(TestCase):
+    """The indexed backends return exactly the rows of a plain icontains search."""
+
+    @classmethod
+    def setUpTestData(cls):
+        WorkOrderToday.objects.bulk_create([
+            WorkOrderToday(wo_number='WO-10231', full_address='123 Main St', technician='Ann'),
+            WorkOrderToday(wo_number='WO-1023', full_address='Main Street North', technician='Bob Main'),
+            WorkOrderToday(wo_number='wo-99', full_address='9 Ocean Ave', notes='ring main st. gate'),
+            WorkOrderToday(wo_number='ABC-123', full_address=None, technician='Joann'),
+            WorkOrderToday(wo_number=None, notes='WO pending'),
+        ])
+        TankRepair.objects.bulk_create([
+            TankRepair(work_order_number='WO-10231', name='Ann Main', address='123 Main St'),
+            TankRepair(work_order_number='T-77', name='Ocean Side', assigned_to='ann'),
+            TankRepair(work_order_number='T-023', notes='main valve'),
+        ])
+
+        # bulk_create sends no post_save: index the rows explicitly
+        tokens = TokenSearchBackend()
+        tokens.index_objects(WorkOrderToday, WorkOrderToday.objects.all())
+        tokens.index_objects(TankRepair, TankRepair.objects.all())
+
+    def ids(self, queryset):
+        return sorted(queryset.values_list('pk', flat=True))
+
+    def assertSameAsLike(self, backend, model, fields):
+        like = LikeSearchBackend()
+        for term in TERMS:
+            with self.subTest(model=model.__name__, term=term):
+                queryset = model.objects.all()
+                self.assertEqual(
+                    self.ids(backend.filter(queryset, fields, term)),
+                    self.ids(like.filter(queryset, fields, term))
+                )
+
+    def test_token_backend(self):
+        self.assertSameAsLike(TokenSearchBackend(), WorkOrderToday, WORK_ORDER_FIELDS)
+        self.assertSameAsLike(TokenSearchBackend(), TankRepair, TANK_REPAIR_FIELDS)
+
+    @skipUnless(connection.vendor == 'mysql', "FULLTEXT search needs MySQL")
+    def test_fulltext_backend(self):
+        ngram_token_size = search._mysql_fulltext_settings()
+        if not ngram_token_size:
+            self.skipTest("innodb_ft_enable_stopword is ON")
+        backend = MySQLFullTextSearchBackend(ngram_token_size)
+        self.assertSameAsLike(backend, WorkOrderToday, WORK_ORDER_FIELDS)
+        self.assertSameAsLike(backend, TankRepair, TANK_REPAIR_FIELDS)
+
+    @override_settings(SEARCH_BACKEND='tokens')
+    def test_filter_matches_drf_search_filter(self):
+        view = mock.Mock(search_fields=WORK_ORDER_FIELDS)
+        factory = APIRequestFactory()
+
+        with mock.patch.object(search, '_backend', None):
+            for query in TERMS + ['wo main', 'Main, Ann', '123 st']:
+                with self.subTest(search=query):
+                    request = Request(factory.get('/', {'search': query}))
+                    queryset = WorkOrderToday.objects.all()
+                    self.assertEqual(
+                        self.ids(IndexedSearchFilter().filter_queryset(request, queryset, view)),
+                        self.ids(filters.SearchFilter().filter_queryset(request, queryset, view))
+                    )
+
+    def test_search_fields_are_indexed(self):
+        from locates.views import WorkOrderTodayViewSet
+        from tank_repair.views import TankRepairViewSet
+
+        self.assertEqual(WorkOrderTodayViewSet.search_fields, search.registered_fields(WorkOrderToday))
+        self.assertEqual(TankRepairViewSet.search_fields, search.registered_fields(TankRepair))
+
+
+class LocalBrokerTests(SimpleTestCase):
+    def test_backlog_after_cursor(self):
+        broker = LocalBroker()
+        for object_id in (1, 2, 3):
+            broker.publish('locates.locates', 'upsert', object_id)
+
+        events = asyncio.run(broker.next_events(1, 0))
+
+        self.assertEqual([event['object_id'] for event in events], [2, 3])
+        self.assertEqual(asyncio.run(broker.latest_id()), 3)
+
+    def test_dropped_events_reset_the_client(self):
+        class SmallBroker(LocalBroker):
+            buffer_size = 2
+
+        broker = SmallBroker()
+        for object_id in (1, 2, 3):
+            broker.publish('locates.locates', 'upsert', object_id)
+
+        self.assertIsNone(asyncio.run(broker.next_events(0, 0)))
+
+    def test_publish_from_another_thread_wakes_the_waiter(self):
+        broker = LocalBroker()
+
+        async def wait():
+            threading.Timer(0.05, broker.publish, ('locates.locates', 'delete', 7)).start()
+            return await broker.next_events(0, 5)
+
+        events = asyncio.run(wait())
+
+        self.assertEqual(events, [{'id': 1, 'resource': 'locates.locates', 'action': 'delete', 'object_id': 7}])
+
+
+@override_settings(EVENTS_BROKER='core.events.LocalBroker')
+class EventStreamTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='events@test.com', password='x', name='Events')
+
+    def setUp(self):
+        patcher = mock.patch.object(events, '_broker', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def read(self, response):
+        async def collect():
+            return b''.join([chunk async for chunk in response.streaming_content])
+
+        return asyncio.run(collect()).decode()
+
+    def test_requires_token(self):
+        self.assertEqual(self.client.get('/api/events/').status_code, 401)
+
+    def test_missed_events_after_last_event_id(self):
+        token = str(AccessToken.for_user(self.user))
+        with self.captureOnCommitCallbacks(execute=True):
+            first = WorkOrderToday.objects.create(wo_number='WO-E1')
+            second = WorkOrderToday.objects.create(wo_number='WO-E2')
+
+        # Under WSGI the stream sends what was missed and closes
+        response = self.client.get('/api/events/', {'token': token}, HTTP_LAST_EVENT_ID='1')
+        body = self.read(response)
+
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        self.assertIn('event: change', body)
+        self.assertIn(f'"object_id": {second.pk}', body)
+        self.assertNotIn(f'"object_id": {first.pk}', body)
+
+
+class ChangeLogBrokerTests(TestCase):
+    def log(self, object_id, age):
+        entry = ChangeLog.objects.create(resource='locates.workordertoday', object_id=object_id, action='upsert')
+        ChangeLog.objects.filter(pk=entry.pk).update(created_at=timezone.now() - timedelta(seconds=age))
+        return entry
+
+    @override_settings(CHANGE_FEED_SETTLE_SECONDS=2)
+    def test_stops_before_unsettled_rows(self):
+        settled = self.log(1, age=60)
+        self.log(2, age=0)
+        self.log(3, age=60)
+
+        events = ChangeLogBroker()._read(0, 100)
+
+        # Row 3 is old, but a cursor past it would also pass row 2
+        self.assertEqual([event['id'] for event in events], [settled.pk])
+        self.assertEqual(latest_cursor(), settled.pk)
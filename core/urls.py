@@ -5,6 +5,7 @@ from django.urls import path, include
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 from rest_framework import permissions
+from core.events import event_stream
 
 schema_view = get_schema_view(
    openapi.Info(
@@ -21,6 +22,7 @@ urlpatterns = [
     path('api/', include('accounts.urls')),
     path('api/', include('locates.urls')),
     path('api/', include('tank_repair.urls')),
+    path('api/events/', event_stream, name='events'),
     
     # --- API Documentation URLs ---
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
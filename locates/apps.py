@@ -4,3 +4,24 @@ from django.apps import AppConfig
 class LocatesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'locates'
+
+    def ready(self):
+        from core import changes, events, search
+        from .models import WorkOrderToday, WorkOrderTodayEdit, Locates
+
+        # Columns behind WorkOrderTodayViewSet.search_fields (FULLTEXT index: migration 0012)
+        search.register(
+            WorkOrderToday,
+            ['wo_number', 'full_address', 'technician', 'notes'],
+            fulltext_index='workorder_search_ft'
+        )
+
+        # Change feed (GET .../changes/?since=)
+        changes.track(WorkOrderToday)
+        changes.track(Locates)
+        changes.track(WorkOrderTodayEdit)
+
+        # Push channel (GET /api/events/)
+        events.register(WorkOrderToday)
+        events.register(Locates)
+        events.register(WorkOrderTodayEdit)
@@ -0,0 +1,123 @@
+"""
+Conditional GET (ETag / Last-Modified) for the dashboard polling endpoints.
+
+The validators are the table's data fingerprint (see data_fingerprint) plus
+the caller's seen fingerprint and the query string. When the client's
+``If-None-Match`` / ``If-Modified-Since`` still match, the view answers
+``304 Not Modified`` before serializing.
+
+The fingerprint is table-wide rather than per filter: any write to the table
+revalidates every list of it, but the check costs two index seeks instead of
+an aggregate over the filtered rows.
+
+The change log id catches hard deletes, which leave max(updated_at)
+unchanged; only the ETag sees them, so clients should prefer ``If-None-Match``.
+"""
+import hashlib
+
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from core.changes import last_change_id
+
+from .seen import seen_fingerprint
+
+
+def make_etag(*parts):
+    digest = hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+    return f'"{digest}"'
+
+
+def _query_params(request):
+    # Sorted so ?a=1&b=2 and ?b=2&a=1 share a validator
+    params = request.query_params
+    return sorted((key, sorted(params.getlist(key))) for key in params)
+
+
+def _latest(*values):
+    values = [value for value in values if value is not None]
+    return max(values) if values else None
+
+
+def data_fingerprint(model):
+    """
+    ``(max updated_at, newest change log id)`` of ``model``'s table, read from
+    the database, so it changes with writes made by any process. Both come
+    from an index (``updated_at``; ChangeLog's ``(resource, id)``).
+
+    ``updated_at`` also sees writes that skip the change log
+    (``QuerySet.update(updated_at=...)``); the log id sees deletes.
+    """
+    last_updated = (
+        model._default_manager.order_by('-updated_at')
+        .values_list('updated_at', flat=True).first()
+    )
+    return last_updated, last_change_id(model)
+
+
+def list_validators(request, queryset, fingerprint=None):
+    """``(etag, last_modified)`` for a filtered list queryset."""
+    last_updated, last_change = fingerprint or data_fingerprint(queryset.model)
+    seen_total, last_seen, watermark = seen_fingerprint(request.user, queryset.model)
+
+    etag = make_etag(
+        queryset.model._meta.label_lower,
+        last_updated, last_change,
+        seen_total, last_seen, watermark,
+        _query_params(request)
+    )
+    return etag, _latest(last_updated, last_seen)
+
+
+def object_validators(request, instance):
+    """``(etag, last_modified)`` for a single object."""
+    etag = make_etag(
+        instance._meta.label_lower, instance.pk, instance.updated_at,
+        getattr(instance, 'is_seen', None),
+        _query_params(request)
+    )
+    return etag, instance.updated_at
+
+
+def set_validators(response, etag, last_modified):
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified.timestamp())
+    # Let the browser keep the body but revalidate on every poll
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+class ConditionalGetViewSetMixin:
+    """
+    ``get_not_modified_response()`` returns a 304 for unchanged data (or None)
+    and remembers the validators, which are then sent on the full response.
+    The list's data fingerprint is kept as ``list_fingerprint`` (the shared
+    list cache keys on it, see locates.list_cache).
+    """
+    conditional_validators = None
+    list_fingerprint = None
+
+    def _check_validators(self, etag, last_modified):
+        self.conditional_validators = (etag, last_modified)
+        response = get_conditional_response(
+            self.request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()) if last_modified else None
+        )
+        if response is not None:
+            set_validators(response, etag, last_modified)
+        return response
+
+    def get_not_modified_response(self, queryset):
+        self.list_fingerprint = data_fingerprint(queryset.model)
+        return self._check_validators(*list_validators(self.request, queryset, self.list_fingerprint))
+
+    def get_object_not_modified_response(self, instance):
+        return self._check_validators(*object_validators(self.request, instance))
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if self.conditional_validators and response.status_code == 200:
+            set_validators(response, *self.conditional_validators)
+        return response
@@ -0,0 +1,69 @@
+"""
+Sparse fieldsets for the dashboard list endpoints.
+
+``?fields=id,wo_number,status`` keeps only the listed fields and
+``?omit=notes,reason`` drops the listed ones. The serializer output is
+trimmed and the queryset loads only the matching columns with ``.only()``,
+so unused TextFields are never read from the database. ``id`` is always kept.
+Only GET requests are affected; writes always return the full object.
+"""
+
+FIELDS_PARAM = 'fields'
+OMIT_PARAM = 'omit'
+
+
+def _parse_field_list(value):
+    return {name.strip() for name in value.split(',') if name.strip()}
+
+
+def get_requested_fields(request, available):
+    """
+    Names from ``available`` to keep for this request, or None to keep all.
+    Unknown names in ``?fields=`` / ``?omit=`` are ignored.
+    """
+    if request is None or request.method not in ('GET', 'HEAD'):
+        return None
+
+    params = request.query_params
+    if not params.get(FIELDS_PARAM) and not params.get(OMIT_PARAM):
+        return None
+
+    keep = set(available)
+    if params.get(FIELDS_PARAM):
+        keep &= _parse_field_list(params[FIELDS_PARAM]) | {'id'}
+    if params.get(OMIT_PARAM):
+        keep -= _parse_field_list(params[OMIT_PARAM]) - {'id'}
+    return keep
+
+
+class SparseFieldsetSerializerMixin:
+    """Drop serializer fields that were not requested with ?fields= / ?omit=."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        keep = get_requested_fields(self.context.get('request'), self.fields)
+        if keep is not None:
+            for name in set(self.fields) - keep:
+                self.fields.pop(name)
+
+
+class SparseFieldsetViewSetMixin:
+    """Load only the requested columns (plus what paging needs) with ``.only()``."""
+
+    def get_fieldset_required_fields(self):
+        required = {'id'}
+        # Keyset pagination reads the ordering column to build the next cursor
+        ordering = getattr(self.pagination_class, 'ordering', None)
+        if ordering:
+            required.add(ordering.lstrip('-'))
+        return required
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        model_fields = {field.name for field in queryset.model._meta.concrete_fields}
+        keep = get_requested_fields(self.request, model_fields)
+        if keep is None:
+            return queryset
+        return queryset.only(*(keep | self.get_fieldset_required_fields()))
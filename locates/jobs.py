@@ -0,0 +1,275 @@
+"""
+Queue for the Online RME lock / delete / edit automations.
+
+The API only records an ``AutomationJob`` and answers 202; the
+``run_automation_jobs`` management command claims pending jobs, runs the
+Online RME task (in its resident browser, see tasks.automation_worker, or as
+``tasks/run_locked_deleted_edit_task.py`` with ``--cold``) and applies the
+requested change once the automation succeeded. A failed automation leaves
+the database as it was, like the synchronous endpoints did.
+
+Claiming is a conditional UPDATE (``status = PENDING``), so several workers
+can share the queue without running a job twice.
+"""
+import json
+import os
+import subprocess
+import sys
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import AutomationJob, WorkOrderTodayEdit
+from .serializers import WorkOrderTodaySerializer, WorkOrderTodayEditSerializer
+
+
+AUTOMATION_SCRIPT = 'run_locked_deleted_edit_task.py'
+
+PENDING = 'PENDING'
+RUNNING = 'RUNNING'
+SUCCEEDED = 'SUCCEEDED'
+FAILED = 'FAILED'
+CANCELLED = 'CANCELLED'
+
+ACTIVE_STATUSES = (PENDING, RUNNING)
+
+# Actions the resident worker can run together in one work history pass
+BATCH_ACTIONS = ('LOCKED', 'DELETED')
+
+
+class AutomationError(Exception):
+    """The Online RME task did not complete; the job's changes are not saved."""
+
+
+def job_timeout():
+    return getattr(settings, 'AUTOMATION_JOB_TIMEOUT', 900)
+
+
+def enqueue_automation(action, work_order, payload, changes, user=None, partial=True):
+    """
+    Queue ``action`` for ``work_order``. Returns ``(job, created)``.
+
+    ``changes`` is the request data, validated again with the serializer
+    (as a PATCH, or as a PUT when ``partial`` is False) when it is applied.
+
+    A lock / delete that is already queued or running is returned instead of
+    queueing it twice. A new edit cancels the pending edits of the same work
+    order, whose form data it replaces.
+    """
+    with transaction.atomic():
+        if action != 'UPDATE':
+            active = AutomationJob.objects.filter(
+                work_order_today=work_order, action=action, status__in=ACTIVE_STATUSES
+            ).first()
+            if active is not None:
+                return active, False
+
+        job = AutomationJob.objects.create(
+            action=action,
+            work_order_today=work_order,
+            payload=payload,
+            changes=changes,
+            partial=partial,
+            created_by=user if user is not None and user.is_authenticated else None,
+            progress='Queued'
+        )
+
+        if action == 'UPDATE':
+            AutomationJob.objects.filter(
+                work_order_today=work_order, action='UPDATE', status=PENDING, id__lt=job.id
+            ).update(
+                status=CANCELLED,
+                progress=f'Superseded by job {job.id}',
+                finished_at=timezone.now(),
+                updated_at=timezone.now()
+            )
+
+    return job, True
+
+
+def set_progress(job, progress, **fields):
+    now = timezone.now()
+    AutomationJob.objects.filter(pk=job.pk).update(progress=progress, updated_at=now, **fields)
+
+
+def claim_next_job(worker):
+    """Mark the oldest pending job as running for ``worker`` and return it (None when idle)."""
+    while True:
+        job_id = (
+            AutomationJob.objects
+            .filter(status=PENDING)
+            .order_by('id')
+            .values_list('id', flat=True)
+            .first()
+        )
+        if job_id is None:
+            return None
+
+        job = _claim(job_id, worker)
+        if job is not None:
+            return job
+        # Another worker took it first: try the next one
+
+
+def _claim(job_id, worker):
+    """Mark job ``job_id`` as running for ``worker`` if it is still pending."""
+    now = timezone.now()
+    claimed = AutomationJob.objects.filter(pk=job_id, status=PENDING).update(
+        status=RUNNING, worker=worker, started_at=now, updated_at=now, progress='Running automation'
+    )
+    if not claimed:
+        return None
+    return AutomationJob.objects.select_related('work_order_today').get(pk=job_id)
+
+
+def fail_abandoned_jobs():
+    """Fail jobs left running by a worker that died. Returns how many."""
+    now = timezone.now()
+    # The task itself is killed after AUTOMATION_JOB_TIMEOUT, so older runs are orphans
+    cutoff = now - timedelta(seconds=job_timeout() + 60)
+    return AutomationJob.objects.filter(status=RUNNING, started_at__lt=cutoff).update(
+        status=FAILED,
+        error='Worker stopped before the job finished. Database was NOT updated.',
+        progress='Failed',
+        finished_at=now,
+        updated_at=now
+    )
+
+
+def run_automation_script(action, payload):
+    """
+    Run the Online RME task for ``action`` in a new interpreter.
+    Raises AutomationError if it fails.
+    """
+    def json_safe(obj):
+        if isinstance(obj, bytes):
+            return obj.decode("utf-8", errors="ignore")
+        return str(obj)
+
+    form_data = json.dumps(payload.get('form_data') or {}, default=json_safe)
+    script_path = os.path.join(os.getcwd(), 'tasks', AUTOMATION_SCRIPT)
+
+    # Inject current working directory to PYTHONPATH to ensure imports work
+    env = os.environ.copy()
+    env["PYTHONPATH"] = os.getcwd()
+
+    try:
+        subprocess.run(
+            [
+                sys.executable, script_path,
+                str(payload.get('full_address')), action, str(payload.get('work_order_today_id', 0)), form_data
+            ],
+            check=True,
+            env=env,
+            timeout=job_timeout()
+        )
+    except subprocess.CalledProcessError as e:
+        raise AutomationError(f"Automation failed for status {action} (exit code {e.returncode}).") from e
+    except subprocess.TimeoutExpired as e:
+        raise AutomationError(f"Automation timed out after {job_timeout()} seconds.") from e
+
+
+def apply_changes(job):
+    """Save the change the job was queued for. Raises ValueError if it no longer validates."""
+    if job.action == 'UPDATE':
+        instance = WorkOrderTodayEdit.objects.get(work_order_today_id=job.work_order_today_id)
+        changes = dict(job.changes)
+        if instance.updated_at >= job.started_at:
+            # The task already stored the form as read back from RME after saving it
+            changes.pop('form_data', None)
+        serializer = WorkOrderTodayEditSerializer(instance, data=changes, partial=job.partial)
+    else:
+        serializer = WorkOrderTodaySerializer(job.work_order_today, data=job.changes, partial=job.partial)
+
+    if not serializer.is_valid():
+        raise ValueError(json.dumps(serializer.errors))
+    serializer.save()
+
+
+def claim_job_batch(worker, size):
+    """
+    Claim the oldest pending job plus, when it is a lock / delete, up to
+    ``size - 1`` more pending locks / deletes to run in the same pass.
+
+    Only the run of locks / deletes that directly follows it in queue order
+    is taken: a pending edit ends the batch, so no job overtakes an older
+    edit (e.g. an edit of a work order queued before its lock).
+    """
+    job = claim_next_job(worker)
+    if job is None or job.action not in BATCH_ACTIONS:
+        return [job] if job is not None else []
+
+    jobs = [job]
+    while len(jobs) < size:
+        following = (
+            AutomationJob.objects
+            .filter(status=PENDING)
+            .order_by('id')
+            .values_list('id', 'action')
+            .first()
+        )
+        if following is None or following[1] not in BATCH_ACTIONS:
+            break
+
+        job = _claim(following[0], worker)
+        if job is not None:
+            jobs.append(job)
+        # Otherwise another worker took it first: look at the next one
+    return jobs
+
+
+def _fail(job, error):
+    set_progress(job, 'Failed', status=FAILED, finished_at=timezone.now(), error=f"{error} Database was NOT updated.")
+
+
+def run_job(job, runner=run_automation_script):
+    """
+    Run a claimed job to completion with ``runner(action, payload)``,
+    recording the outcome on it.
+    """
+    try:
+        runner(job.action, job.payload)
+    except AutomationError as e:
+        _fail(job, e)
+        return
+    except Exception as e:
+        _fail(job, f"Automation error: {e}.")
+        return
+
+    _save(job)
+
+
+def run_job_batch(jobs, runner):
+    """
+    Run claimed lock / delete jobs in one pass with ``runner(items)``, which
+    takes ``(action, payload)`` pairs and returns one ``{"success", "error"}``
+    dict per pair. Each job gets its own outcome.
+    """
+    try:
+        results = runner([(job.action, job.payload) for job in jobs])
+    except Exception as e:
+        results = [{"success": False, "error": str(e)}] * len(jobs)
+
+    for job, result in zip(jobs, results):
+        if result.get("success"):
+            _save(job)
+        else:
+            _fail(job, f"Automation failed for status {job.action}: {result.get('error', 'Unknown error')}.")
+
+
+def _save(job):
+    """Apply the change of a job whose automation succeeded and mark it done."""
+    set_progress(job, 'Saving changes')
+    try:
+        with transaction.atomic():
+            apply_changes(job)
+    except Exception as e:
+        set_progress(
+            job, 'Failed', status=FAILED, finished_at=timezone.now(),
+            error=f"Automation succeeded but the changes could not be saved: {e}"
+        )
+        return
+
+    set_progress(job, 'Completed', status=SUCCEEDED, finished_at=timezone.now())
@@ -0,0 +1,104 @@
+"""
+Shared response cache for the work order / locate list endpoints.
+
+A list response is the same for every user except the ``is_seen`` flags, so
+it is cached once per (path, query string, data fingerprint) in Django's
+cache and the requesting user's flags are overlaid on each hit (see
+seen.seen_ids).
+
+The data fingerprint is the one behind the list ETag (max ``updated_at`` and
+newest change log id of the table, see conditional.data_fingerprint). It is
+read from the database on every request, so a write from any process - the
+automation worker, another web worker, the scraper - moves the list to a new
+key, and a cached body always matches the ETag it is sent with.
+``LIST_CACHE_TIMEOUT`` bounds how long a list can live when rows are changed
+without touching ``updated_at`` (``QuerySet.update``); 0 turns the cache off.
+
+Any cache backend works. Local memory is per process, which only costs each
+worker its own copy; a shared backend (Redis, Memcached, database) in
+``CACHES`` lets the workers share them.
+
+Requests that miss the same key at the same moment each build the list; the
+cache is not locked, so a slow build never holds other web workers waiting.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.response import Response
+
+from .conditional import data_fingerprint
+from .seen import seen_ids
+
+
+KEY_PREFIX = 'list-cache'
+
+
+def fingerprint_key(fingerprint):
+    """Cache key fragment for a data_fingerprint()."""
+    last_updated, last_change = fingerprint
+    return f"{last_updated.isoformat() if last_updated else '-'}:{last_change or 0}"
+
+
+def table_fingerprint(model):
+    """Cache key fragment that changes with every write to ``model``'s table."""
+    return fingerprint_key(data_fingerprint(model))
+
+
+def overlay_seen(rows, model, user):
+    """Set ``is_seen`` on serialized ``rows`` for ``user`` (rows without the key are left alone)."""
+    rows = [row for row in rows if 'is_seen' in row]
+    if not rows:
+        return
+
+    seen = seen_ids(user, model, [row['id'] for row in rows])
+    for row in rows:
+        row['is_seen'] = row['id'] in seen
+
+
+def _rows(payload):
+    # Plain list, or the {'success', 'data': [...]} / paginated envelopes
+    if isinstance(payload, dict):
+        return payload.get('data') or []
+    return payload
+
+
+class CachedListViewSetMixin:
+    """
+    ``cached_list_response(build)`` serves the list from the shared cache,
+    calling ``build()`` (which returns the full Response) only on a miss.
+
+    Reuses the fingerprint computed for the ETag (``list_fingerprint``, see
+    ConditionalGetViewSetMixin) when the view checked it first.
+    """
+
+    def get_list_fingerprint(self):
+        fingerprint = getattr(self, 'list_fingerprint', None)
+        if fingerprint is None:
+            fingerprint = data_fingerprint(self.get_queryset().model)
+        return fingerprint
+
+    def get_list_cache_key(self, model):
+        params = self.request.query_params
+        query = sorted((key, sorted(params.getlist(key))) for key in params)
+        digest = hashlib.sha1(repr((self.request.path, query)).encode('utf-8')).hexdigest()
+        return f'{KEY_PREFIX}:{model._meta.label_lower}:{fingerprint_key(self.get_list_fingerprint())}:{digest}'
+
+    def cached_list_response(self, build):
+        timeout = getattr(settings, 'LIST_CACHE_TIMEOUT', 60)
+        if not timeout:
+            return build()
+
+        model = self.get_queryset().model
+        key = self.get_list_cache_key(model)
+
+        payload = cache.get(key)
+        if payload is None:
+            response = build()
+            if response.status_code == 200:
+                cache.set(key, response.data, timeout)
+            # Built for this user, so is_seen is already right
+            return response
+
+        overlay_seen(_rows(payload), model, self.request.user)
+        return Response(payload)
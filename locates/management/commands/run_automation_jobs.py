@@ -0,0 +1,66 @@
+import os
+import socket
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from locates.jobs import claim_job_batch, fail_abandoned_jobs, run_automation_script, run_job, run_job_batch
+
+
+class Command(BaseCommand):
+    help = "Run queued Online RME lock / delete / edit automation jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Exit when the queue is empty")
+        parser.add_argument(
+            '--poll-interval', type=float, default=None,
+            help="Seconds between queue checks (default AUTOMATION_JOB_POLL_SECONDS)"
+        )
+        parser.add_argument(
+            '--cold', action='store_true',
+            help="Run every job in a new interpreter and browser instead of the resident session"
+        )
+
+    def handle(self, *args, **options):
+        poll_interval = options['poll_interval'] or getattr(settings, 'AUTOMATION_JOB_POLL_SECONDS', 2)
+        batch_size = getattr(settings, 'AUTOMATION_BATCH_SIZE', 20)
+        worker = f"{socket.gethostname()}:{os.getpid()}"
+
+        abandoned = fail_abandoned_jobs()
+        if abandoned:
+            self.stdout.write(f"Marked {abandoned} abandoned jobs as failed.")
+        if options['cold']:
+            resident, runner = None, run_automation_script
+        else:
+            # Imported here: it pulls in Playwright, which --cold does not need
+            from tasks.automation_worker import AutomationWorker
+            resident = AutomationWorker(max_jobs=getattr(settings, 'AUTOMATION_WORKER_MAX_JOBS', 50))
+            runner = resident.run
+        self.stdout.write(f"Automation worker {worker} started.")
+
+        try:
+            while True:
+                close_old_connections()
+                # Queued locks / deletes share one work history pass in the resident browser
+                jobs = claim_job_batch(worker, batch_size if resident is not None else 1)
+                if not jobs:
+                    if options['once']:
+                        break
+                    time.sleep(poll_interval)
+                    continue
+
+                for job in jobs:
+                    self.stdout.write(f"Running {job}")
+                if len(jobs) > 1:
+                    run_job_batch(jobs, resident.run_batch)
+                else:
+                    run_job(jobs[0], runner)
+
+                for job in jobs:
+                    job.refresh_from_db()
+                    self.stdout.write(f"Finished {job}")
+        finally:
+            if resident is not None:
+                resident.close()
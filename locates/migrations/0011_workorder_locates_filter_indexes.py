@@ -0,0 +1,49 @@
+# Generated by Django 5.2.10 on 2026-10-17 01:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locates', '0010_workordertoday_customer'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='locates',
+            index=models.Index(fields=['work_order_number'], name='locates_das_work_or_1c25cd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='locates',
+            index=models.Index(fields=['created_at', 'id'], name='locates_das_created_684439_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='locates',
+            index=models.Index(fields=['is_deleted', 'created_at'], name='locates_das_is_dele_ac56d5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workordertoday',
+            index=models.Index(fields=['wo_number'], name='locates_wor_wo_numb_a4cd80_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workordertoday',
+            index=models.Index(fields=['elapsed_time'], name='locates_wor_elapsed_b0e1a4_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workordertoday',
+            index=models.Index(fields=['scheduled_date', 'id'], name='locates_wor_schedul_8ae7ba_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workordertoday',
+            index=models.Index(fields=['is_deleted', 'scheduled_date'], name='locates_wor_is_dele_994db6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workordertoday',
+            index=models.Index(fields=['status', 'is_deleted', 'scheduled_date'], name='locates_wor_status_4702c2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workordertoday',
+            index=models.Index(fields=['is_deleted', 'rme_completed', 'scheduled_date'], name='locates_wor_is_dele_53251f_idx'),
+        ),
+    ]
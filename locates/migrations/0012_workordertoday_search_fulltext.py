@@ -0,0 +1,33 @@
+from django.db import migrations
+
+
+INDEX_NAME = 'workorder_search_ft'
+COLUMNS = 'wo_number, full_address, technician, notes'
+
+
+def add_fulltext_index(apps, schema_editor):
+    # FULLTEXT / ngram only exists on MySQL; other databases use the token index
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    table = apps.get_model('locates', 'WorkOrderToday')._meta.db_table
+    schema_editor.execute(
+        f"ALTER TABLE {table} ADD FULLTEXT INDEX {INDEX_NAME} ({COLUMNS}) WITH PARSER ngram"
+    )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    table = apps.get_model('locates', 'WorkOrderToday')._meta.db_table
+    schema_editor.execute(f"ALTER TABLE {table} DROP INDEX {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locates', '0011_workorder_locates_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_fulltext_index, drop_fulltext_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locates', '0012_workordertoday_search_fulltext'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workordertoday',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.10 on 2026-10-17 01:57
+
+from django.db import migrations, models
+
+from core.db import duplicate_report
+
+
+def check_wo_numbers(apps, schema_editor):
+    """
+    Make wo_number unique before the constraint is added: blank numbers
+    become NULL; repeated numbers stop the migration for manual cleanup
+    (the rows carry edits, seen state and history that cannot be merged
+    automatically).
+    """
+    WorkOrderToday = apps.get_model('locates', 'WorkOrderToday')
+
+    WorkOrderToday.objects.filter(wo_number='').update(wo_number=None)
+
+    report = duplicate_report(WorkOrderToday, 'wo_number', WorkOrderToday.objects.exclude(wo_number=None))
+    if report:
+        raise RuntimeError(report)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locates', '0014_seenwatermark'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_wo_numbers, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='workordertoday',
+            name='locates_wor_wo_numb_a4cd80_idx',
+        ),
+        migrations.AlterField(
+            model_name='workordertoday',
+            name='wo_number',
+            field=models.CharField(blank=True, help_text='Work Order Number', max_length=100, null=True, unique=True),
+        ),
+    ]
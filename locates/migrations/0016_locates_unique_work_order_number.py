@@ -0,0 +1,34 @@
+# Generated by Django 5.2.10 on 2026-10-17 01:58
+
+from django.db import migrations, models
+
+from core.db import duplicate_report
+
+
+def check_work_order_numbers(apps, schema_editor):
+    """Stop for manual cleanup when a work_order_number is used by several locates."""
+    Locates = apps.get_model('locates', 'Locates')
+
+    report = duplicate_report(Locates, 'work_order_number', Locates.objects.all())
+    if report:
+        raise RuntimeError(report)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locates', '0015_workordertoday_unique_wo_number'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_work_order_numbers, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='locates',
+            name='locates_das_work_or_1c25cd_idx',
+        ),
+        migrations.AlterField(
+            model_name='locates',
+            name='work_order_number',
+            field=models.CharField(max_length=100, unique=True),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.10 on 2026-10-17 02:02
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locates', '0016_locates_unique_work_order_number'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AutomationJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action', models.CharField(choices=[('LOCKED', 'Lock report'), ('DELETED', 'Delete report'), ('UPDATE', 'Update report')], max_length=20)),
+                ('status', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('SUCCEEDED', 'Succeeded'), ('FAILED', 'Failed'), ('CANCELLED', 'Cancelled')], default='PENDING', max_length=20)),
+                ('payload', models.JSONField(blank=True, default=dict)),
+                ('changes', models.JSONField(blank=True, default=dict)),
+                ('progress', models.CharField(blank=True, default='', max_length=255)),
+                ('error', models.TextField(blank=True, default='')),
+                ('worker', models.CharField(blank=True, default='', max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='automation_jobs', to=settings.AUTH_USER_MODEL)),
+                ('work_order_today', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='automation_jobs', to='locates.workordertoday')),
+            ],
+            options={
+                'ordering': ['-id'],
+                'indexes': [models.Index(fields=['status', 'id'], name='locates_aut_status_367afa_idx'), models.Index(fields=['work_order_today', 'action', 'status'], name='locates_aut_work_or_1c594a_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.10 on 2026-10-17 02:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locates', '0018_scraperun'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='automationjob',
+            name='partial',
+            field=models.BooleanField(default=True),
+        ),
+    ]
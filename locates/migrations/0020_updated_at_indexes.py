@@ -0,0 +1,21 @@
+# Generated by Django 5.2.10 on 2026-10-17 02:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locates', '0019_automationjob_partial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='locates',
+            index=models.Index(fields=['updated_at'], name='locates_das_updated_bcba98_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='workordertoday',
+            index=models.Index(fields=['updated_at'], name='locates_wor_updated_a97e75_idx'),
+        ),
+    ]
@@ -15,7 +15,7 @@ class WorkOrderToday(models.Model):
     completed_date = models.CharField(max_length=100, null=True, blank=True, help_text="Date the work is Completed")
     elapsed_time = models.DateTimeField(max_length=50, null=True, blank=True, help_text="Time elapsed as a string")
     technician = models.CharField(max_length=255, null=True, blank=True, help_text="Name or ID of the technician")
-    wo_number = models.CharField(max_length=100, null=True, blank=True, help_text="Work Order Number")
+    wo_number = models.CharField(max_length=100, unique=True, null=True, blank=True, help_text="Work Order Number")
     customer = models.CharField(max_length=255, null=True, blank=True, help_text="Customer name")
     
     # Address field can be long, so TextField is safer
@@ -57,6 +57,9 @@ class WorkOrderToday(models.Model):
     
     # Report Reference
     report_id = models.CharField(max_length=100, null=True, blank=True, help_text="Associated Report ID")
+
+    # Bumped on every save; drives the ETag / Last-Modified of the list endpoints
+    updated_at = models.DateTimeField(auto_now=True)
     
 
     def __str__(self):
@@ -67,6 +70,17 @@ class WorkOrderToday(models.Model):
         verbose_name = "Work Order"
         verbose_name_plural = "Work Orders"
         ordering = ['-elapsed_time']
+        # Matches the WorkOrderTodayFilter / ordering combinations the dashboard
+        # and the scrapers actually send. Equality columns first, sort column last.
+        indexes = [
+            models.Index(fields=['elapsed_time']),
+            models.Index(fields=['scheduled_date', 'id']),
+            models.Index(fields=['is_deleted', 'scheduled_date']),
+            models.Index(fields=['status', 'is_deleted', 'scheduled_date']),
+            models.Index(fields=['is_deleted', 'rme_completed', 'scheduled_date']),
+            # max(updated_at) for the list ETag / cache key (conditional.data_fingerprint)
+            models.Index(fields=['updated_at']),
+        ]
         
 
 class WorkOrderTodayEdit(models.Model):
@@ -119,7 +133,7 @@ class Locates(models.Model):
         (None, 'None'),
     ]
     
-    work_order_number = models.CharField(max_length=100)
+    work_order_number = models.CharField(max_length=100, unique=True)
     customer_name = models.CharField(max_length=200)
     customer_address = models.TextField()
     status = models.CharField(max_length=100)
@@ -160,6 +174,11 @@ class Locates(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Locate'
         verbose_name_plural = 'Locates'
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['is_deleted', 'created_at']),
+            models.Index(fields=['updated_at']),
+        ]
 
     def __str__(self):
         return f"{self.work_order_number} - {self.customer_name}"
@@ -185,4 +204,134 @@ class LocateSeen(models.Model):
         ]
 
     def __str__(self):
-        return f"{self.user} seen locate {self.locate_id}"
\ No newline at end of file
+        return f"{self.user} seen locate {self.locate_id}"
+
+class SeenWatermark(models.Model):
+    """
+    Per-user "seen everything up to id N" marker for work orders / locates.
+    WorkOrderSeen / LocateSeen rows only record the records seen above it.
+    """
+    RESOURCE_CHOICES = [
+        ('work_order', 'Work Order'),
+        ('locate', 'Locate'),
+    ]
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='seen_watermarks'
+    )
+    resource = models.CharField(max_length=20, choices=RESOURCE_CHOICES)
+    last_seen_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ('user', 'resource')
+
+    def __str__(self):
+        return f"{self.user} seen {self.resource} up to {self.last_seen_id}"
+
+
+class AutomationJob(models.Model):
+    """
+    One Online RME lock / delete / edit run for a work order.
+
+    The API stores the requested change in ``changes`` and answers 202; the
+    ``run_automation_jobs`` worker runs the task and applies ``changes`` only
+    when it succeeds, so a failed automation never touches the database.
+    """
+    ACTION_CHOICES = [
+        ('LOCKED', 'Lock report'),
+        ('DELETED', 'Delete report'),
+        ('UPDATE', 'Update report'),
+    ]
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('RUNNING', 'Running'),
+        ('SUCCEEDED', 'Succeeded'),
+        ('FAILED', 'Failed'),
+        ('CANCELLED', 'Cancelled'),
+    ]
+
+    action = models.CharField(max_length=20, choices=ACTION_CHOICES)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='PENDING')
+    work_order_today = models.ForeignKey(
+        WorkOrderToday,
+        on_delete=models.CASCADE,
+        related_name='automation_jobs'
+    )
+    # Arguments of the automation task (address, form data)
+    payload = models.JSONField(default=dict, blank=True)
+    # Request data applied with the serializer once the automation succeeded
+    changes = models.JSONField(default=dict, blank=True)
+    # False for a PUT: ``changes`` is then validated as a full update
+    partial = models.BooleanField(default=True)
+
+    progress = models.CharField(max_length=255, blank=True, default='')
+    error = models.TextField(blank=True, default='')
+    worker = models.CharField(max_length=100, blank=True, default='')
+
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='automation_jobs'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-id']
+        indexes = [
+            # The worker claims the oldest pending job
+            models.Index(fields=['status', 'id']),
+            models.Index(fields=['work_order_today', 'action', 'status']),
+        ]
+
+    def __str__(self):
+        return f"{self.action} job {self.id} for WorkOrder {self.work_order_today_id} ({self.status})"
+
+
+class ScrapeRun(models.Model):
+    """
+    One run of the FieldEdge / WorkOrders / Online RME scrapers
+    (see locates.scrape_runs). At most one run is active at a time.
+    """
+    STATUS_CHOICES = [
+        ('RUNNING', 'Running'),
+        ('SUCCEEDED', 'Succeeded'),
+        ('FAILED', 'Failed'),
+    ]
+    TRIGGER_CHOICES = [
+        ('manual', 'Manual'),
+        ('scheduler', 'Scheduler'),
+    ]
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='RUNNING')
+    trigger = models.CharField(max_length=20, choices=TRIGGER_CHOICES, default='manual')
+    # True while running and NULL afterwards: the unique index admits one running scrape
+    active = models.BooleanField(null=True, unique=True, default=True, editable=False)
+    # Scraper step -> pending / running / done / failed
+    progress = models.JSONField(default=dict, blank=True)
+    error = models.TextField(blank=True, default='')
+
+    started_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='scrape_runs'
+    )
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    # Heartbeat of the running scrape; a stale value means its process died
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-id']
+
+    def __str__(self):
+        return f"Scrape run {self.id} ({self.status})"
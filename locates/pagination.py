@@ -0,0 +1,183 @@
+"""
+Keyset (cursor) pagination for the dashboard list endpoints.
+"""
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from rest_framework import status
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, _positive_int
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class InvalidCursor(NotFound):
+    """A stale or malformed ?cursor=."""
+
+
+def invalid_cursor_response(exc):
+    """The dashboard error envelope for an InvalidCursor."""
+    return Response({
+        'success': False,
+        'message': str(exc.detail)
+    }, status=status.HTTP_404_NOT_FOUND)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opt-in keyset pagination over ``(ordering field, id)``.
+
+    Paging only kicks in when the request carries ``cursor`` or ``limit``,
+    so clients that expect the full list keep working unchanged. Each page
+    is read with ``WHERE (field, id) > cursor`` instead of OFFSET, so the
+    cost of a page does not grow with its position in the table. A paged
+    request always uses the keyset ordering, whatever ``?ordering=`` says.
+    """
+    ordering = None
+    page_size = 50
+    max_page_size = 500
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'limit'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def is_requested(self, request):
+        params = request.query_params
+        return self.cursor_query_param in params or self.page_size_query_param in params
+
+    def get_page_size(self, request):
+        try:
+            return _positive_int(
+                request.query_params[self.page_size_query_param],
+                strict=True,
+                cutoff=self.max_page_size
+            )
+        except (KeyError, ValueError):
+            return self.page_size
+
+    # --- Ordering / cursor helpers ---
+
+    def get_ordering_field(self):
+        descending = self.ordering.startswith('-')
+        return self.ordering.lstrip('-'), descending
+
+    def get_order_by(self):
+        field, descending = self.get_ordering_field()
+        # Keep NULLs where MySQL puts them naturally so the index order is used
+        if descending:
+            return [F(field).desc(nulls_last=True), 'id']
+        return [F(field).asc(nulls_first=True), 'id']
+
+    def get_after_condition(self, value, pk):
+        """Rows strictly after ``(value, pk)`` in keyset order."""
+        field, descending = self.get_ordering_field()
+
+        if value is None:
+            after_nulls = Q(**{f'{field}__isnull': True, 'id__gt': pk})
+            if descending:
+                return after_nulls
+            return after_nulls | Q(**{f'{field}__isnull': False})
+
+        lookup = 'lt' if descending else 'gt'
+        condition = Q(**{f'{field}__{lookup}': value}) | Q(**{field: value, 'id__gt': pk})
+        if descending:
+            condition |= Q(**{f'{field}__isnull': True})
+        return condition
+
+    def encode_cursor(self, instance):
+        field, _ = self.get_ordering_field()
+        value = getattr(instance, field)
+        if hasattr(value, 'isoformat'):
+            value = value.isoformat()
+        token = json.dumps([value, instance.pk], separators=(',', ':'))
+        return base64.urlsafe_b64encode(token.encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, request, model):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None
+
+        field, _ = self.get_ordering_field()
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+            if value is not None:
+                value = model._meta.get_field(field).to_python(value)
+            return value, int(pk)
+        except (TypeError, ValueError, binascii.Error, ValidationError):
+            raise InvalidCursor(self.invalid_cursor_message)
+
+    # --- DRF pagination API ---
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(*self.get_order_by())
+        cursor = self.decode_cursor(request, queryset.model)
+        if cursor is not None:
+            queryset = queryset.filter(self.get_after_condition(*cursor))
+
+        # Fetch one extra row to know whether another page exists
+        rows = list(queryset[:page_size + 1])
+        self.has_next = len(rows) > page_size
+        rows = rows[:page_size]
+        self.next_cursor = self.encode_cursor(rows[-1]) if self.has_next else None
+        return rows
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'success': True,
+            'count': len(data),
+            'next': self.get_next_link(),
+            'nextCursor': self.next_cursor,
+            'data': data
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'success': {'type': 'boolean'},
+                'count': {'type': 'integer'},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'nextCursor': {'type': 'string', 'nullable': True},
+                'data': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Opaque cursor returned as nextCursor by the previous page.',
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.page_size_query_param,
+                'required': False,
+                'in': 'query',
+                'description': 'Page size. Passing it (or a cursor) enables paging.',
+                'schema': {'type': 'integer'},
+            },
+        ]
+
+
+class LocatesCursorPagination(KeysetPagination):
+    ordering = '-created_at'
+
+
+class WorkOrderTodayCursorPagination(KeysetPagination):
+    ordering = '-scheduled_date'
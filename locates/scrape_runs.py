@@ -0,0 +1,104 @@
+"""
+Background scrape runs with a single-flight guard.
+
+``start_scrape_run()`` records a ``ScrapeRun`` and runs the scrapers
+(automation.main) in a background thread, so neither the start-scraping
+action nor the scheduler blocks on them. ``ScrapeRun.active`` is unique and
+only set on the running scrape, so a second trigger - from any process -
+gets the run already in progress instead of starting another.
+
+The running thread bumps ``updated_at`` every ``HEARTBEAT_SECONDS``; a run
+whose heartbeat is older than ``SCRAPE_RUN_STALE_SECONDS`` belonged to a
+process that died and is failed before the next one starts.
+"""
+import threading
+from datetime import timedelta
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from automation.main import SCRAPER_STEPS, start_scraping
+
+from .models import ScrapeRun
+
+
+HEARTBEAT_SECONDS = 30
+
+
+def fail_stale_runs():
+    """Fail the active run when its process stopped sending heartbeats. Returns how many."""
+    now = timezone.now()
+    cutoff = now - timedelta(seconds=getattr(settings, 'SCRAPE_RUN_STALE_SECONDS', 300))
+    return ScrapeRun.objects.filter(active=True, updated_at__lt=cutoff).update(
+        active=None, status='FAILED', error='Scrape process stopped before the run finished.',
+        finished_at=now, updated_at=now
+    )
+
+
+def start_scrape_run(trigger='manual', user=None):
+    """
+    Start a scrape in the background. Returns ``(run, started)``; ``started``
+    is False when a run was already in progress (and ``run`` is that run).
+    """
+    fail_stale_runs()
+
+    try:
+        with transaction.atomic():
+            run = ScrapeRun.objects.create(
+                trigger=trigger,
+                started_by=user if user is not None and user.is_authenticated else None,
+                progress={step: 'pending' for step, _ in SCRAPER_STEPS}
+            )
+    except IntegrityError:
+        # Another scrape holds the active slot
+        run = ScrapeRun.objects.filter(active=True).first()
+        if run is not None:
+            return run, False
+        # It finished in the meantime: take the slot
+        return start_scrape_run(trigger, user)
+
+    threading.Thread(target=execute_scrape_run, args=(run.id,), name=f'scrape-run-{run.id}', daemon=True).start()
+    return run, True
+
+
+def _record_step(run_id, step, state):
+    run = ScrapeRun.objects.get(pk=run_id)
+    run.progress[step] = state
+    run.save(update_fields=['progress', 'updated_at'])
+
+
+def _heartbeat(run_id, stop):
+    try:
+        while not stop.wait(HEARTBEAT_SECONDS):
+            ScrapeRun.objects.filter(pk=run_id, active=True).update(updated_at=timezone.now())
+    finally:
+        connection.close()
+
+
+def execute_scrape_run(run_id):
+    """Run every scraper for ``run_id`` and record the outcome (blocks; see start_scrape_run)."""
+    stop = threading.Event()
+    threading.Thread(target=_heartbeat, args=(run_id, stop), name=f'scrape-run-{run_id}-heartbeat', daemon=True).start()
+
+    error = ''
+    try:
+        start_scraping(on_progress=sync_to_async(partial(_record_step, run_id)))
+    except Exception as e:
+        error = str(e)
+    finally:
+        stop.set()
+
+        run = ScrapeRun.objects.get(pk=run_id)
+        failed = [step for step, state in run.progress.items() if state != 'done']
+        if failed and not error:
+            error = f"Scrapers did not complete: {', '.join(failed)}"
+
+        run.status = 'FAILED' if error else 'SUCCEEDED'
+        run.error = error
+        run.active = None
+        run.finished_at = timezone.now()
+        run.save(update_fields=['status', 'error', 'active', 'finished_at', 'updated_at'])
+        connection.close()
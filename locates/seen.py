@@ -0,0 +1,135 @@
+"""
+Helpers for computing the per-user ``is_seen`` flag in bulk.
+
+Seen state is stored as a per-user watermark (``SeenWatermark``: everything
+up to ``last_seen_id`` is seen) plus sparse ``WorkOrderSeen`` / ``LocateSeen``
+rows for records seen above it. "Mark all seen" moves the watermark and drops
+the rows it now covers, so the tables stay small.
+"""
+from django.db import transaction
+from django.db.models import (
+    BooleanField, Count, Exists, ExpressionWrapper, Max, OuterRef, Q, Subquery, Value
+)
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.db import upsert_options
+
+from .models import WorkOrderToday, WorkOrderSeen, Locates, LocateSeen, SeenWatermark
+
+
+# Model -> (seen model, FK field name on the seen model; also the SeenWatermark resource)
+SEEN_MODELS = {
+    WorkOrderToday: (WorkOrderSeen, 'work_order'),
+    Locates: (LocateSeen, 'locate'),
+}
+
+
+def _watermark_subquery(user, resource):
+    return Coalesce(
+        Subquery(SeenWatermark.objects.filter(user=user, resource=resource).values('last_seen_id')[:1]),
+        Value(0)
+    )
+
+
+def annotate_is_seen(queryset, user):
+    """
+    Annotate ``is_seen`` for ``user`` on a WorkOrderToday or Locates queryset.
+
+    The flag (id <= watermark OR a seen row exists) is computed inside the
+    list query, so serializing N rows costs one query instead of N + 1.
+    """
+    if user is None or not user.is_authenticated:
+        return queryset.annotate(is_seen=Value(False, output_field=BooleanField()))
+
+    seen_model, field = SEEN_MODELS[queryset.model]
+    return queryset.annotate(
+        is_seen=ExpressionWrapper(
+            Q(pk__lte=_watermark_subquery(user, field))
+            | Q(Exists(seen_model.objects.filter(user=user, **{field: OuterRef('pk')}))),
+            output_field=BooleanField()
+        )
+    )
+
+
+def get_watermark(user, model):
+    """Highest id ``user`` has seen everything up to (0 when never set)."""
+    _, field = SEEN_MODELS[model]
+    watermark = SeenWatermark.objects.filter(user=user, resource=field).values_list('last_seen_id', flat=True).first()
+    return watermark or 0
+
+
+def seen_ids(user, model, ids):
+    """Subset of ``ids`` that ``user`` has seen (two queries)."""
+    if user is None or not user.is_authenticated or not ids:
+        return set()
+
+    seen_model, field = SEEN_MODELS[model]
+    watermark = get_watermark(user, model)
+    above = [pk for pk in ids if pk > watermark]
+    seen = {pk for pk in ids if pk <= watermark}
+    if above:
+        seen |= set(
+            seen_model.objects
+            .filter(user=user, **{f'{field}_id__in': above})
+            .values_list(f'{field}_id', flat=True)
+        )
+    return seen
+
+
+def is_seen_by(user, obj):
+    if user is None or not user.is_authenticated:
+        return False
+    return obj.pk in seen_ids(user, type(obj), [obj.pk])
+
+
+def mark_seen(user, model, ids):
+    """
+    Mark the existing records among ``ids`` as seen. Returns how many exist.
+    Records at or below the watermark are already seen and get no row.
+    """
+    seen_model, field = SEEN_MODELS[model]
+    existing = list(model.objects.filter(id__in=ids).values_list('id', flat=True))
+
+    watermark = get_watermark(user, model)
+    seen_model.objects.bulk_create(
+        [seen_model(user=user, **{f'{field}_id': pk}) for pk in existing if pk > watermark],
+        ignore_conflicts=True
+    )
+    return len(existing)
+
+
+def mark_all_seen(user, model):
+    """
+    Move ``user``'s watermark to the newest record of ``model`` (one upsert)
+    and drop the seen rows it now covers. Returns the new watermark.
+    """
+    seen_model, field = SEEN_MODELS[model]
+    latest = model.objects.aggregate(latest=Max('id'))['latest'] or 0
+
+    with transaction.atomic():
+        SeenWatermark.objects.bulk_create(
+            [SeenWatermark(user=user, resource=field, last_seen_id=latest, updated_at=timezone.now())],
+            **upsert_options(SeenWatermark, ['user', 'resource'], ['last_seen_id', 'updated_at'])
+        )
+        seen_model.objects.filter(user=user, **{f'{field}_id__lte': latest}).delete()
+    return latest
+
+
+def seen_fingerprint(user, model):
+    """
+    ``(count, latest change, watermark)`` of ``user``'s seen state for ``model``.
+    Changes whenever one of that user's ``is_seen`` flags can change.
+    """
+    if user is None or not user.is_authenticated:
+        return 0, None, 0
+
+    seen_model, field = SEEN_MODELS[model]
+    stats = seen_model.objects.filter(user=user).aggregate(total=Count('pk'), last_seen=Max('seen_at'))
+    watermark = SeenWatermark.objects.filter(user=user, resource=field).values_list('last_seen_id', 'updated_at').first()
+    if watermark is None:
+        return stats['total'], stats['last_seen'], 0
+
+    last_seen_id, updated_at = watermark
+    last_change = max(value for value in (stats['last_seen'], updated_at) if value is not None)
+    return stats['total'], last_change, last_seen_id
@@ -1,21 +1,28 @@
 from rest_framework import serializers
-from .models import WorkOrderToday, WorkOrderTodayEdit, WorkOrderSeen, Locates, LocateSeen
+from .models import WorkOrderToday, WorkOrderTodayEdit, Locates, AutomationJob, ScrapeRun
+from .fieldsets import SparseFieldsetSerializerMixin
+from .seen import is_seen_by
 
-class WorkOrderTodaySerializer(serializers.ModelSerializer):
+class WorkOrderTodaySerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     is_seen = serializers.SerializerMethodField()
 
     class Meta:
         model = WorkOrderToday
         fields = '__all__'
 
+    def validate_wo_number(self, value):
+        # wo_number is unique; a blank number is stored as NULL so it never collides
+        return value or None
+
     def get_is_seen(self, obj):
-        user = self.context['request'].user
-        return WorkOrderSeen.objects.filter(
-            user=user,
-            work_order=obj
-        ).exists()
+        # Use the value annotated by the viewset queryset when available
+        if hasattr(obj, 'is_seen'):
+            return obj.is_seen
+
+        user = getattr(self.context.get('request'), 'user', None)
+        return is_seen_by(user, obj)
 
-class LocatesSerializer(serializers.ModelSerializer):
+class LocatesSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     is_seen = serializers.SerializerMethodField()
 
     class Meta:
@@ -23,11 +30,26 @@ class LocatesSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
     def get_is_seen(self, obj):
-        user = self.context['request'].user
-        return LocateSeen.objects.filter(
-            user=user,
-            locate=obj
-        ).exists()
+        # Use the value annotated by the viewset queryset when available
+        if hasattr(obj, 'is_seen'):
+            return obj.is_seen
+
+        user = getattr(self.context.get('request'), 'user', None)
+        return is_seen_by(user, obj)
+
+
+class WorkOrderTodayBulkSerializer(WorkOrderTodaySerializer):
+    """For UnifiedBulkUpdateView, which checks wo_number for the whole batch at once."""
+
+    class Meta(WorkOrderTodaySerializer.Meta):
+        extra_kwargs = {'wo_number': {'validators': []}}
+
+
+class LocatesBulkSerializer(LocatesSerializer):
+    """For UnifiedBulkUpdateView, which checks work_order_number for the whole batch at once."""
+
+    class Meta(LocatesSerializer.Meta):
+        extra_kwargs = {'work_order_number': {'validators': []}}
 
 
 class BulkSeenSerializer(serializers.Serializer):
@@ -63,4 +85,19 @@ class WorkOrderTodayEditSerializer(serializers.ModelSerializer):
     class Meta:
         model = WorkOrderTodayEdit
         fields = '__all__' 
-        read_only_fields = ['created_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['created_at', 'updated_at']
+
+
+class AutomationJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = AutomationJob
+        # payload / changes hold the submitted form data and stay server-side
+        exclude = ['payload', 'changes']
+        read_only_fields = [field.name for field in AutomationJob._meta.fields]
+
+
+class ScrapeRunSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ScrapeRun
+        exclude = ['active']
+        read_only_fields = [field.name for field in ScrapeRun._meta.fields]
@@ -0,0 +1,67 @@
+"""
+Aggregates behind the dashboard header widgets (DashboardSummaryView).
+
+Each function runs a handful of GROUP BY / conditional-aggregate queries,
+so the counters never require shipping the rows themselves.
+"""
+from django.db.models import Count, Q
+
+
+def work_order_summary(queryset):
+    """Counters for a (filtered) WorkOrderToday queryset: 3 queries."""
+    queryset = queryset.order_by()
+
+    totals = queryset.aggregate(
+        total=Count('id'),
+        wait_to_lock=Count('id', filter=Q(wait_to_lock=True)),
+        rme_completed=Count('id', filter=Q(rme_completed=True)),
+        tech_report_submitted=Count('id', filter=Q(tech_report_submitted=True)),
+        deleted=Count('id', filter=Q(is_deleted=True)),
+    )
+
+    by_status = {
+        row['status']: row['count']
+        for row in queryset.values('status').annotate(count=Count('id'))
+    }
+
+    by_technician = [
+        {
+            'technician': row['technician'],
+            'total': row['total'],
+            'wait_to_lock': row['wait_to_lock'],
+            'rme_completed': row['rme_completed'],
+        }
+        for row in (
+            queryset
+            .values('technician')
+            .annotate(
+                total=Count('id'),
+                wait_to_lock=Count('id', filter=Q(wait_to_lock=True)),
+                rme_completed=Count('id', filter=Q(rme_completed=True)),
+            )
+            .order_by('-total', 'technician')
+        )
+    ]
+
+    return {**totals, 'by_status': by_status, 'by_technician': by_technician}
+
+
+def locates_summary(queryset):
+    """Counters for a Locates queryset: 2 queries."""
+    queryset = queryset.order_by()
+
+    totals = queryset.aggregate(
+        total=Count('id'),
+        emergency=Count('id', filter=Q(call_type='EMERGENCY')),
+        standard=Count('id', filter=Q(call_type='STANDARD')),
+        locates_called=Count('id', filter=Q(locates_called=True)),
+        completed=Count('id', filter=Q(completed_at__isnull=False)),
+        timer_expired=Count('id', filter=Q(timer_expired=True)),
+    )
+
+    by_status = {
+        row['status']: row['count']
+        for row in queryset.values('status').annotate(count=Count('id'))
+    }
+
+    return {**totals, 'by_status': by_status}
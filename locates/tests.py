@@ -1,3 +1,655 @@
+import re
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from core.models import ChangeLog
+from .jobs import (
+    AutomationError, CANCELLED, FAILED, PENDING, RUNNING, SUCCEEDED,
+    claim_job_batch, claim_next_job, enqueue_automation, run_job
+)
+from .models import WorkOrderToday, Locates, AutomationJob, WorkOrderSeen
+from .seen import annotate_is_seen, mark_all_seen, mark_seen, seen_fingerprint, seen_ids
+from .views import WorkOrderTodayFilter
+
+
+class QueryPlanTests(TestCase):
+    """
+    Run EXPLAIN on the hot dashboard / scraper queries and fail when one of
+    them falls back to a full table scan.
+
+    Boolean-only filters are checked with assertNoFullScan: SQLite renders
+    them as "NOT is_deleted", which it cannot seek on, so it walks the
+    ordering index instead. MySQL compares them with "= false" and seeks.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='plan@test.com', password='x', name='Plan')
+
+    def explain(self, queryset):
+        if connection.vendor == 'mysql':
+            return queryset.explain(format='json')
+        return queryset.explain()
+
+    def assertNoFullScan(self, queryset):
+        """The table is read through an index (a full index scan is allowed)."""
+        table = queryset.model._meta.db_table
+        plan = self.explain(queryset)
+
+        if connection.vendor == 'mysql':
+            self.assertNotIn('"access_type": "ALL"', plan, f"Full scan on {table}:\n{plan}")
+        else:
+            # "SCAN <table>" without "USING INDEX" is a full table scan
+            full_scan = re.search(r'\bSCAN %s\b(?! USING)' % re.escape(table), plan)
+            self.assertIsNone(full_scan, f"Full scan on {table}:\n{plan}")
+
+    def assertIndexSearch(self, queryset):
+        """The filter itself is resolved by an index seek / range read."""
+        table = queryset.model._meta.db_table
+        plan = self.explain(queryset)
+
+        if connection.vendor == 'mysql':
+            self.assertNotIn('"access_type": "ALL"', plan, f"Full scan on {table}:\n{plan}")
+            self.assertNotIn('"access_type": "index"', plan, f"Full index scan on {table}:\n{plan}")
+        else:
+            self.assertRegex(plan, r'\bSEARCH %s USING (COVERING )?INDEX' % re.escape(table))
+
+    def work_orders(self, params, ordering='-scheduled_date'):
+        queryset = annotate_is_seen(WorkOrderToday.objects.all(), self.user)
+        return WorkOrderTodayFilter(params, queryset=queryset).qs.order_by(ordering)
+
+    def test_scraper_lookup_by_wo_number(self):
+        self.assertIndexSearch(self.work_orders({'wo_number': '12345'}))
+
+    def test_dashboard_default_list(self):
+        self.assertNoFullScan(self.work_orders({'is_deleted': 'false'}))
+
+    def test_dashboard_status_filter(self):
+        self.assertIndexSearch(self.work_orders({'is_deleted': 'false', 'status': 'LOCKED'}))
+
+    def test_dashboard_rme_completed_filter(self):
+        self.assertNoFullScan(self.work_orders({'is_deleted': 'false', 'rme_completed': 'true'}))
+
+    def test_scheduled_date_range(self):
+        self.assertIndexSearch(self.work_orders({
+            'scheduled_date__gte': '2026-01-01T00:00:00Z',
+            'scheduled_date__lte': '2026-01-31T23:59:59Z',
+        }))
+
+    def test_elapsed_time_default_ordering(self):
+        self.assertIndexSearch(self.work_orders({'elapsed_time__gte': '2026-01-01T00:00:00Z'}, '-elapsed_time'))
+
+    def test_locates_list(self):
+        queryset = annotate_is_seen(Locates.objects.all(), self.user).order_by('-created_at', 'id')
+        self.assertNoFullScan(queryset)
+
+    def test_locates_sync_lookup(self):
+        self.assertIndexSearch(Locates.objects.filter(work_order_number='12345'))
+
+    def test_data_fingerprint(self):
+        for model in (WorkOrderToday, Locates):
+            with self.subTest(model=model.__name__):
+                self.assertNoFullScan(model.objects.order_by('-updated_at').values_list('updated_at')[:1])
+        self.assertIndexSearch(
+            ChangeLog.objects.filter(resource='locates.workordertoday').order_by('-id').values_list('id')[:1]
+        )
+
+
+class ListQueryCountTests(TestCase):
+    """is_seen is annotated, so listing N rows costs the same queries as listing one."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='count@test.com', password='x', name='Count')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def create_rows(self, count):
+        start = WorkOrderToday.objects.count()
+        WorkOrderToday.objects.bulk_create(
+            WorkOrderToday(wo_number=f'WO-{start + i}') for i in range(count)
+        )
+        Locates.objects.bulk_create(
+            Locates(work_order_number=f'L-{start + i}', customer_name='C', customer_address='A', status='Open')
+            for i in range(count)
+        )
+
+    def assertConstantQueries(self, url):
+        self.create_rows(2)
+        with CaptureQueriesContext(connection) as small:
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+        self.create_rows(40)
+        cache.clear()
+        with self.assertNumQueries(len(small)):
+            self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_work_orders_list(self):
+        self.assertConstantQueries('/api/work-orders-today/')
+
+    def test_locates_list(self):
+        self.assertConstantQueries('/api/locates/')
+
+
+class InvalidCursorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='cursor@test.com', password='x', name='Cursor')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_same_envelope_on_both_lists(self):
+        for url in ('/api/work-orders-today/', '/api/locates/'):
+            response = self.client.get(url, {'cursor': 'not-a-cursor'})
+            self.assertEqual(response.status_code, 404)
+            self.assertEqual(response.json(), {'success': False, 'message': 'Invalid cursor'})
+
+
+class ListCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='cache@test.com', password='x', name='Cache')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_write_without_signals_is_not_served_stale(self):
+        """A write from another process (no signals here) moves the list to a new cache entry."""
+        work_order = WorkOrderToday.objects.create(wo_number='WO-1', notes='before')
+        url = '/api/work-orders-today/'
+
+        first = self.client.get(url)
+        self.assertEqual(first.json()[0]['notes'], 'before')
+
+        WorkOrderToday.objects.filter(pk=work_order.pk).update(notes='after', updated_at=timezone.now())
+
+        second = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json()[0]['notes'], 'after')
+        self.assertNotEqual(second['ETag'], first['ETag'])
+
+        third = self.client.get(url, HTTP_IF_NONE_MATCH=second['ETag'])
+        self.assertEqual(third.status_code, 304)
+
+    def test_if_none_match(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            kept = WorkOrderToday.objects.create(wo_number='WO-1')
+            dropped = WorkOrderToday.objects.create(wo_number='WO-2')
+        url = '/api/work-orders-today/'
+
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+
+        unchanged = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(unchanged.status_code, 304)
+        self.assertEqual(unchanged['ETag'], first['ETag'])
+
+        # A hard delete leaves max(updated_at) alone; the change log id moves
+        with self.captureOnCommitCallbacks(execute=True):
+            dropped.delete()
+
+        after_delete = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(after_delete.status_code, 200)
+        self.assertEqual([row['id'] for row in after_delete.json()], [kept.pk])
+
+    def test_summary_follows_writes(self):
+        url = '/api/dashboard-summary/'
+        with self.captureOnCommitCallbacks(execute=True):
+            work_order = WorkOrderToday.objects.create(wo_number='WO-1', status='LOCKED')
+            Locates.objects.create(work_order_number='WO-1', call_type='EMERGENCY')
+
+        first = self.client.get(url).json()['data']
+        self.assertEqual(first['work_orders']['by_status'], {'LOCKED': 1})
+        self.assertEqual(first['locates']['emergency'], 1)
+
+        # Served from the cache while nothing changed
+        self.assertEqual(self.client.get(url).json()['data']['generated_at'], first['generated_at'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            work_order.status = 'DELETED'
+            work_order.save()
+        self.assertEqual(self.client.get(url).json()['data']['work_orders']['by_status'], {'DELETED': 1})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Locates.objects.all().delete()
+        self.assertEqual(self.client.get(url).json()['data']['locates']['total'], 0)
+
+
+class ChangeLogOrderTests(TestCase):
+    def test_entries_are_written_at_commit(self):
+        """A long transaction's entries get ids after its commit, not at write time."""
+        with self.captureOnCommitCallbacks(execute=True):
+            work_order = WorkOrderToday.objects.create(wo_number='WO-LOG')
+            self.assertFalse(ChangeLog.objects.filter(object_id=work_order.pk).exists())
+
+        self.assertTrue(
+            ChangeLog.objects.filter(resource='locates.workordertoday', object_id=work_order.pk).exists()
+        )
+
+
+class WorkOrderCreateTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='create@test.com', password='x', name='Create')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def post(self, payload):
+        return self.client.post('/api/work-orders-today/', payload, format='json')
+
+    def test_list_skips_duplicates(self):
+        WorkOrderToday.objects.create(wo_number='WO-OLD')
+
+        response = self.post([
+            {'wo_number': 'WO-OLD'},
+            {'wo_number': 'WO-N1', 'notes': 'first'},
+            {'wo_number': 'WO-N1', 'notes': 'repeat'},
+            {'notes': 'no number'},
+            {'wo_number': 'WO-N2'},
+        ])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(sorted(row['wo_number'] for row in response.json()), ['WO-N1', 'WO-N2'])
+        self.assertEqual(response['X-Skipped-Duplicates'], '1')
+        self.assertEqual(WorkOrderToday.objects.get(wo_number='WO-N1').notes, 'first')
+        self.assertEqual(WorkOrderToday.objects.count(), 3)
+
+    def test_list_query_count_does_not_grow(self):
+        with CaptureQueriesContext(connection) as small:
+            self.post([{'wo_number': f'WO-S{i}'} for i in range(2)])
+
+        with self.assertNumQueries(len(small)):
+            self.post([{'wo_number': f'WO-L{i}'} for i in range(30)])
+
+    def test_list_reports_numbers_inserted_concurrently(self):
+        WorkOrderToday.objects.create(wo_number='WO-RACE')
+        original_filter = WorkOrderToday.objects.filter
+        calls = []
+
+        def filter_missing_race(*args, **kwargs):
+            # The duplicate check runs before the other request's insert
+            calls.append(kwargs)
+            if len(calls) == 1:
+                return original_filter(pk__in=[])
+            return original_filter(*args, **kwargs)
+
+        with mock.patch.object(WorkOrderToday.objects, 'filter', side_effect=filter_missing_race):
+            response = self.post([{'wo_number': 'WO-RACE'}, {'wo_number': 'WO-MINE'}])
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([row['wo_number'] for row in response.json()], ['WO-MINE'])
+        self.assertEqual(response['X-Skipped-Duplicates'], '1')
+
+    def test_single_duplicate_conflicts(self):
+        WorkOrderToday.objects.create(wo_number='WO-ONE')
+
+        response = self.post({'wo_number': 'WO-ONE'})
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(WorkOrderToday.objects.filter(wo_number='WO-ONE').count(), 1)
+
+
+class SeenWatermarkTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='seen@test.com', password='x', name='Seen')
+        cls.other = User.objects.create_user(email='other@test.com', password='x', name='Other')
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def seen_flags(self):
+        queryset = annotate_is_seen(WorkOrderToday.objects.order_by('id'), self.user)
+        return {row.wo_number: row.is_seen for row in queryset}
+
+    def unseen_count(self):
+        return self.client.get('/api/work-orders-today/unseen-count/').json()['unseen']
+
+    def test_row_created_after_watermark_is_unseen(self):
+        first = WorkOrderToday.objects.create(wo_number='WO-W1')
+        WorkOrderToday.objects.create(wo_number='WO-W2')
+        mark_all_seen(self.user, WorkOrderToday)
+        newer = WorkOrderToday.objects.create(wo_number='WO-W3')
+
+        self.assertEqual(self.seen_flags(), {'WO-W1': True, 'WO-W2': True, 'WO-W3': False})
+        self.assertEqual(seen_ids(self.user, WorkOrderToday, [first.pk, newer.pk]), {first.pk})
+        self.assertFalse(annotate_is_seen(WorkOrderToday.objects.filter(pk=first.pk), self.other).get().is_seen)
+
+    def test_mark_all_seen_drops_covered_rows(self):
+        first = WorkOrderToday.objects.create(wo_number='WO-D1')
+        mark_seen(self.user, WorkOrderToday, [first.pk])
+        mark_seen(self.other, WorkOrderToday, [first.pk])
+
+        mark_all_seen(self.user, WorkOrderToday)
+
+        self.assertFalse(WorkOrderSeen.objects.filter(user=self.user).exists())
+        self.assertTrue(WorkOrderSeen.objects.filter(user=self.other).exists())
+
+        # Below the watermark a mark adds no row; above it, it does
+        newer = WorkOrderToday.objects.create(wo_number='WO-D2')
+        mark_seen(self.user, WorkOrderToday, [first.pk, newer.pk])
+        self.assertEqual(list(WorkOrderSeen.objects.filter(user=self.user).values_list('work_order_id', flat=True)), [newer.pk])
+        self.assertTrue(self.seen_flags()['WO-D2'])
+
+    def test_unseen_count_follows_marks(self):
+        rows = [WorkOrderToday.objects.create(wo_number=f'WO-C{i}') for i in range(3)]
+        self.assertEqual(self.unseen_count(), 3)
+
+        self.client.post('/api/work-orders-today/mark-seen/', {'ids': [rows[0].pk]}, format='json')
+        self.assertEqual(self.unseen_count(), 2)
+
+        self.client.post('/api/work-orders-today/mark-all-seen/')
+        self.assertEqual(self.unseen_count(), 0)
+
+        WorkOrderToday.objects.create(wo_number='WO-C3')
+        self.assertEqual(self.unseen_count(), 1)
+
+    def test_fingerprint_changes_with_marks(self):
+        row = WorkOrderToday.objects.create(wo_number='WO-F1')
+        before = seen_fingerprint(self.user, WorkOrderToday)
+
+        mark_seen(self.user, WorkOrderToday, [row.pk])
+        after_mark = seen_fingerprint(self.user, WorkOrderToday)
+        mark_all_seen(self.user, WorkOrderToday)
+        after_all = seen_fingerprint(self.user, WorkOrderToday)
+
+        self.assertNotEqual(before, after_mark)
+        self.assertNotEqual(after_mark, after_all)
+        self.assertEqual(after_all[2], row.pk)
+
+
+class BulkUpdateTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='bulk@test.com', password='x', name='Bulk')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def patch(self, payload):
+        return self.client.patch('/api/bulk-update/', payload, format='json')
+
+    def test_duplicate_unique_value_in_batch(self):
+        first = WorkOrderToday.objects.create(wo_number='WO-B1')
+        second = WorkOrderToday.objects.create(wo_number='WO-B2')
+
+        response = self.patch({'work_orders': [
+            {'id': first.pk, 'wo_number': 'WO-NEW'},
+            {'id': second.pk, 'wo_number': 'WO-NEW'},
+        ]})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(list(response.json()['details']), [f'work_order_{second.pk}'])
+        self.assertIn('wo_number', response.json()['details'][f'work_order_{second.pk}'])
+        self.assertEqual(WorkOrderToday.objects.get(pk=first.pk).wo_number, 'WO-B1')
+
+    def test_swap_unique_values(self):
+        first = WorkOrderToday.objects.create(wo_number='WO-X')
+        second = WorkOrderToday.objects.create(wo_number='WO-Y')
+        third = Locates.objects.create(work_order_number='L-X', customer_name='C', customer_address='A', status='Open')
+        fourth = Locates.objects.create(work_order_number='L-Y', customer_name='C', customer_address='A', status='Open')
+
+        response = self.patch({
+            'work_orders': [{'id': first.pk, 'wo_number': 'WO-Y'}, {'id': second.pk, 'wo_number': 'WO-X'}],
+            # A chain: L-Y moves on to L-Z and L-X takes its old number
+            'locates': [{'id': third.pk, 'work_order_number': 'L-Y'}, {'id': fourth.pk, 'work_order_number': 'L-Z'}],
+        })
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(WorkOrderToday.objects.get(pk=first.pk).wo_number, 'WO-Y')
+        self.assertEqual(WorkOrderToday.objects.get(pk=second.pk).wo_number, 'WO-X')
+        self.assertEqual(Locates.objects.get(pk=third.pk).work_order_number, 'L-Y')
+        self.assertEqual(Locates.objects.get(pk=fourth.pk).work_order_number, 'L-Z')
+
+    def test_unique_value_held_outside_batch(self):
+        WorkOrderToday.objects.create(wo_number='WO-TAKEN')
+        row = WorkOrderToday.objects.create(wo_number='WO-FREE')
+
+        response = self.patch({'work_orders': [{'id': row.pk, 'wo_number': 'WO-TAKEN'}]})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('wo_number', response.json()['details'][f'work_order_{row.pk}'])
+        self.assertEqual(WorkOrderToday.objects.get(pk=row.pk).wo_number, 'WO-FREE')
+
+    def test_query_count_does_not_grow(self):
+        def payload(prefix, count):
+            rows = [WorkOrderToday.objects.create(wo_number=f'{prefix}-{i}') for i in range(count)]
+            return {'work_orders': [{'id': row.pk, 'wo_number': f'{prefix}-NEW-{i}'} for i, row in enumerate(rows)]}
+
+        small = payload('WO-S', 2)
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.patch(small).status_code, 200)
+
+        large = payload('WO-L', 30)
+        with self.assertNumQueries(len(queries)):
+            self.assertEqual(self.patch(large).status_code, 200)
+
+    def test_data_in_request_order(self):
+        rows = [WorkOrderToday.objects.create(wo_number=f'WO-O{i}') for i in range(3)]
+
+        response = self.patch({'work_orders': [
+            {'id': row.pk, 'notes': 'x'} for row in reversed(rows)
+        ]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [row['id'] for row in response.json()['data']['work_orders']],
+            [row.pk for row in reversed(rows)]
+        )
+
+
+class AutomationJobTests(TestCase):
+    """Locks / deletes / edits are queued and only saved once the automation succeeded."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='jobs@test.com', password='x', name='Jobs')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.work_order = WorkOrderToday.objects.create(wo_number='WO-JOB', status='Complete')
+
+    def put_status(self, new_status):
+        return self.client.put(
+            f'/api/work-orders-today/{self.work_order.pk}/', {'status': new_status}, format='json'
+        )
+
+    def test_lock_is_queued_once(self):
+        response = self.put_status('LOCKED')
+
+        self.assertEqual(response.status_code, 202)
+        job = AutomationJob.objects.get()
+        self.assertEqual((job.action, job.status, job.partial), ('LOCKED', PENDING, False))
+        self.assertEqual(response.json()['job_id'], job.pk)
+        self.work_order.refresh_from_db()
+        self.assertEqual(self.work_order.status, 'Complete')
+
+        # The same lock while the first one is queued is not queued again
+        response = self.put_status('LOCKED')
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()['job_id'], job.pk)
+        self.assertEqual(AutomationJob.objects.count(), 1)
+
+    def test_new_edit_cancels_pending_edits(self):
+        older, _ = enqueue_automation('UPDATE', self.work_order, {}, {})
+        newer, created = enqueue_automation('UPDATE', self.work_order, {}, {})
+
+        self.assertTrue(created)
+        older.refresh_from_db()
+        self.assertEqual(older.status, CANCELLED)
+        self.assertEqual(AutomationJob.objects.get(pk=newer.pk).status, PENDING)
+
+    def test_job_is_claimed_once(self):
+        queued, _ = enqueue_automation('LOCKED', self.work_order, {}, {'status': 'LOCKED'})
+
+        job = claim_next_job('a')
+        self.assertEqual((job.pk, job.status, job.worker), (queued.pk, RUNNING, 'a'))
+        self.assertIsNone(claim_next_job('b'))
+
+    def test_failed_automation_writes_nothing(self):
+        enqueue_automation('LOCKED', self.work_order, {}, {'status': 'LOCKED'})
+
+        def runner(action, payload):
+            raise AutomationError("Automation failed for status LOCKED (exit code 1).")
+
+        job = claim_next_job('w')
+        run_job(job, runner)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, FAILED)
+        self.assertIn('Database was NOT updated', job.error)
+        self.work_order.refresh_from_db()
+        self.assertEqual(self.work_order.status, 'Complete')
+
+    def test_changes_are_validated_when_applied(self):
+        self.put_status('LOCKED')
+        AutomationJob.objects.update(changes={'status': 'LOCKED', 'last_report_link': 'not a url'})
+
+        job = claim_next_job('w')
+        run_job(job, lambda action, payload: None)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, FAILED)
+        self.work_order.refresh_from_db()
+        self.assertEqual(self.work_order.status, 'Complete')
+
+    def test_successful_automation_applies_changes(self):
+        self.put_status('DELETED')
+
+        job = claim_next_job('w')
+        run_job(job, lambda action, payload: None)
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, SUCCEEDED)
+        self.work_order.refresh_from_db()
+        self.assertEqual(self.work_order.status, 'DELETED')
+
+
+class ClaimJobBatchTests(TestCase):
+    def test_batch_stops_at_an_older_edit(self):
+        """A lock queued after an edit of the same work order does not overtake it."""
+        first = WorkOrderToday.objects.create(wo_number='WO-JA')
+        second = WorkOrderToday.objects.create(wo_number='WO-JB')
+        lock_first, _ = enqueue_automation('LOCKED', first, {}, {})
+        edit_second, _ = enqueue_automation('UPDATE', second, {}, {})
+        enqueue_automation('LOCKED', second, {}, {})
+
+        self.assertEqual([job.pk for job in claim_job_batch('w', 20)], [lock_first.pk])
+        self.assertEqual([job.pk for job in claim_job_batch('w', 20)], [edit_second.pk])
+
+
+class LocatesSyncTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        Locates.objects.bulk_create([
+            Locates(work_order_number='L-1', customer_name='A', customer_address='1 St', status='OPEN', tech_name='Ann'),
+            Locates(work_order_number='L-2', customer_name='B', customer_address='2 St', status='OPEN', tech_name='Bob'),
+        ])
+
+    def work_order(self, number, tags='OPEN', tech='Ann', priority='EXCAVATOR'):
+        return {
+            'workOrderNumber': number, 'customerName': 'C', 'customerAddress': 'Addr',
+            'tags': tags, 'priorityName': priority, 'techName': tech, 'scheduledDate': None,
+        }
+
+    def sync(self, work_orders, **params):
+        url = '/api/locates/sync/'
+        if params:
+            url += '?' + '&'.join(f'{key}={value}' for key, value in params.items())
+        return self.client.post(url, {'workOrders': work_orders}, format='json')
+
+    def test_counts(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.sync([
+                self.work_order('L-1'),
+                self.work_order('L-2', tags='LOCKED', tech='Bob'),
+                self.work_order('L-3'),
+                self.work_order('L-3', tags='REPEAT'),
+                self.work_order('L-4', priority='SERVICE'),
+            ])
+
+        body = response.json()
+        self.assertEqual((body['created'], body['updated'], body['unchanged']), (1, 1, 1))
+        self.assertNotIn('data', body)
+
+        created = Locates.objects.get(work_order_number='L-3')
+        self.assertEqual(created.status, 'OPEN')
+        self.assertEqual(Locates.objects.get(work_order_number='L-2').status, 'LOCKED')
+        self.assertFalse(Locates.objects.filter(work_order_number='L-4').exists())
+
+        logged = set(ChangeLog.objects.filter(resource='locates.locates').values_list('object_id', flat=True))
+        self.assertEqual(logged, {created.pk, Locates.objects.get(work_order_number='L-2').pk})
+
+    def test_include_data(self):
+        response = self.sync([self.work_order('L-3')], include_data='true')
+
+        numbers = [row['work_order_number'] for row in response.json()['data']]
+        self.assertEqual(numbers[0], 'L-3')
+        self.assertCountEqual(numbers, ['L-1', 'L-2', 'L-3'])
+
+    def test_missing_work_orders(self):
+        response = self.client.post('/api/locates/sync/', {}, format='json')
+        self.assertEqual(response.status_code, 400)
+
+
+class WorkOrderUpsertTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(email='upsert@test.com', password='x', name='Upsert')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.existing = WorkOrderToday.objects.create(wo_number='WO-1', technician='Ann', notes='old')
+
+    def upsert(self, payload, query=''):
+        return self.client.post(f'/api/work-orders-today/upsert/{query}', payload, format='json')
+
+    def test_counts(self):
+        response = self.upsert([
+            {'wo_number': 'WO-1', 'notes': 'new'},
+            {'wo_number': 'WO-2', 'status': 'OPEN'},
+            {'wo_number': 'WO-2', 'status': 'LOCKED'},
+            {'notes': 'no number'},
+        ])
+
+        body = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((body['created'], body['updated']), (1, 1))
+        self.assertNotIn('data', body)
+
+        self.existing.refresh_from_db()
+        # Fields the item left out are kept
+        self.assertEqual((self.existing.notes, self.existing.technician), ('new', 'Ann'))
+        # Last occurrence of a number wins
+        self.assertEqual(WorkOrderToday.objects.get(wo_number='WO-2').status, 'LOCKED')
+
+    def test_include_data(self):
+        response = self.upsert([{'wo_number': 'WO-1'}, {'wo_number': 'WO-3'}], '?include_data=true')
+
+        self.assertCountEqual([row['wo_number'] for row in response.json()['data']], ['WO-1', 'WO-3'])
 
-# Create your tests here.
+    def test_rejects_non_list(self):
+        self.assertEqual(self.upsert({'wo_number': 'WO-1'}).status_code, 400)
+        self.assertEqual(self.upsert([{'notes': 'no number'}]).status_code, 400)
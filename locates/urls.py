@@ -1,5 +1,5 @@
 from django.urls import path, include
-from .views import WorkOrderTodayViewSet, LocatesViewSet, UnifiedBulkUpdateView, WorkOrderTodayEditViewSet
+from .views import WorkOrderTodayViewSet, LocatesViewSet, UnifiedBulkUpdateView, WorkOrderTodayEditViewSet, DashboardSummaryView, AutomationJobViewSet, ScrapeRunViewSet
 from rest_framework.routers import DefaultRouter
 
 app_name = 'locates'
@@ -9,10 +9,13 @@ router = DefaultRouter()
 router.register(r'work-orders-today', WorkOrderTodayViewSet, basename='work-orders-today')
 router.register(r'locates', LocatesViewSet, basename='locates')
 router.register(r'work-order-edit', WorkOrderTodayEditViewSet, basename='work-order-edit')
+router.register(r'automation-jobs', AutomationJobViewSet, basename='automation-jobs')
+router.register(r'scrape-runs', ScrapeRunViewSet, basename='scrape-runs')
 
 urlpatterns = [
     # Custom APIView path
     path('bulk-update/', UnifiedBulkUpdateView.as_view(), name='bulk-update'),
+    path('dashboard-summary/', DashboardSummaryView.as_view(), name='dashboard-summary'),
 
     # Router generated URLs
     path('', include(router.urls)),
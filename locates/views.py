@@ -7,22 +7,43 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters
 from django_filters import FilterSet
 from rest_framework.decorators import action
-from .models import WorkOrderToday, Locates, WorkOrderSeen, LocateSeen, WorkOrderTodayEdit
+from .models import WorkOrderToday, Locates, WorkOrderTodayEdit, AutomationJob, ScrapeRun
 from rest_framework.renderers import JSONRenderer
-from django.db import transaction
-from django.shortcuts import get_object_or_404
+from django.db import transaction, IntegrityError
+from django.core.cache import cache
+from django.conf import settings
 from rest_framework.views import APIView
 from rest_framework import serializers
 from .serializers import (
     WorkOrderTodaySerializer, 
     LocatesSerializer, 
+    WorkOrderTodayBulkSerializer,
+    LocatesBulkSerializer,
     BulkUpdatePayloadSerializer,
     BulkSeenSerializer,
-    WorkOrderTodayEditSerializer
+    WorkOrderTodayEditSerializer,
+    AutomationJobSerializer,
+    ScrapeRunSerializer
 )
-import subprocess, os, sys, json
-from automation.main import start_scraping
-
+from .seen import annotate_is_seen, mark_seen, mark_all_seen
+from .pagination import WorkOrderTodayCursorPagination, LocatesCursorPagination, InvalidCursor, invalid_cursor_response
+from .fieldsets import SparseFieldsetViewSetMixin
+from .conditional import ConditionalGetViewSetMixin
+from .list_cache import CachedListViewSetMixin, table_fingerprint
+from .summary import work_order_summary, locates_summary
+from .jobs import enqueue_automation
+from .scrape_runs import start_scrape_run
+from core.changes import ChangeFeedViewSetMixin
+from core.signals import bulk_changed, UPSERT
+from core.db import upsert_options, unique_fields, unique_conflicts, release_unique_values
+from core.export import StreamingExportViewSetMixin
+from core.search import IndexedSearchFilter
+import hashlib
+import logging
+from functools import partial
+
+
+logger = logging.getLogger(__name__)
 
 
 class WorkOrderTodayFilter(FilterSet):
@@ -69,39 +90,86 @@ class WorkOrderTodayFilter(FilterSet):
         }
 
 
-class WorkOrderTodayViewSet(viewsets.ModelViewSet):
+class WorkOrderTodayViewSet(StreamingExportViewSetMixin, ChangeFeedViewSetMixin, ConditionalGetViewSetMixin, CachedListViewSetMixin, SparseFieldsetViewSetMixin, viewsets.ModelViewSet):
     """
     ViewSet for WorkOrderToday.
     Handles standard CRUD operations with automation triggers on specific status updates.
+    GET requests accept ?fields= / ?omit= (see locates.fieldsets) and answer
+    304 Not Modified when the ETag still matches (see locates.conditional).
+    GET changes/?since= returns only the rows written after a cursor (see core.changes).
+    List responses are shared between users through the cache (see locates.list_cache).
+    GET export/?export_format=json|ndjson|csv streams the filtered rows (see core.export).
+    POST upsert/ creates or updates a batch of work orders keyed by wo_number.
     """
     queryset = WorkOrderToday.objects.all()
     serializer_class = WorkOrderTodaySerializer
 
     # Filter, Search, and Ordering Configuration
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, IndexedSearchFilter, filters.OrderingFilter]
     filterset_class = WorkOrderTodayFilter
     search_fields = ['wo_number', 'full_address', 'technician', 'notes']
     ordering_fields = '__all__'
     ordering = ['-scheduled_date']
+
+    # Opt-in: only pages when ?cursor= or ?limit= is passed
+    pagination_class = WorkOrderTodayCursorPagination
+
+    def get_queryset(self):
+        # Compute is_seen for the whole result set in one query
+        user = getattr(self.request, 'user', None)
+        return annotate_is_seen(super().get_queryset(), user)
     
     def get_serializer_context(self):
         context = super().get_serializer_context()
         context['request'] = self.request
         return context
+
+    def list(self, request, *args, **kwargs):
+        # Dashboard polls: answer 304 before serializing when nothing changed
+        not_modified = self.get_not_modified_response(self.filter_queryset(self.get_queryset()))
+        if not_modified is not None:
+            return not_modified
+
+        # One serialization per filter combination, shared by all viewers
+        try:
+            return self.cached_list_response(partial(super().list, request, *args, **kwargs))
+        except InvalidCursor as e:
+            return invalid_cursor_response(e)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        not_modified = self.get_object_not_modified_response(instance)
+        if not_modified is not None:
+            return not_modified
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
     
     @action(detail=False, methods=['post'], url_path='start-scraping', permission_classes=[IsAuthenticated])
     def trigger_scraping(self, request):
         """
-        Custom action to trigger scraping from WorkOrderToday endpoint
+        Custom action to trigger scraping from WorkOrderToday endpoint.
+        The scrape runs in the background; poll scrape-runs/<run_id>/ for its progress.
         """
         try:
-            start_scraping()
+            run, started = start_scrape_run(trigger='manual', user=request.user)
+            if not started:
+                return Response(
+                    {
+                        'status': 'success',
+                        'message': 'Scraping is already running',
+                        'run_id': run.id,
+                        'already_running': True
+                    },
+                    status=status.HTTP_200_OK
+                )
             return Response(
                 {
                     'status': 'success',
-                    'message': 'Scraping started successfully'
+                    'message': 'Scraping started successfully',
+                    'run_id': run.id,
+                    'already_running': False
                 },
-                status=status.HTTP_200_OK
+                status=status.HTTP_202_ACCEPTED
             )
         except Exception as e:
             return Response(
@@ -119,52 +187,34 @@ class WorkOrderTodayViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
 
         ids = serializer.validated_data['ids']
+        marked = mark_seen(request.user, WorkOrderToday, ids)
 
-        work_orders = WorkOrderToday.objects.filter(id__in=ids)
-
-        seen_objects = [
-            WorkOrderSeen(user=request.user, work_order=wo)
-            for wo in work_orders
-        ]
+        return Response({
+            "status": "success",
+            "marked_seen": marked
+        })
 
-        WorkOrderSeen.objects.bulk_create(
-            seen_objects,
-            ignore_conflicts=True
-        )
+    @action(detail=False, methods=['post'], url_path='mark-all-seen', permission_classes=[IsAuthenticated])
+    def bulk_mark_all_seen(self, request):
+        # Moves the user's watermark instead of inserting a row per work order
+        last_seen_id = mark_all_seen(request.user, WorkOrderToday)
 
         return Response({
             "status": "success",
-            "marked_seen": work_orders.count()
+            "last_seen_id": last_seen_id
         })
 
-    
-    def _run_automation_script(self, script_name, argument, new_status, work_order_today_id, form_data):
-        """
-        Helper method to execute external automation scripts.
-        Raises CalledProcessError if the script fails.
-        """
-        if form_data is None:
-            form_data = {"test": "0"}
-        def json_safe(obj):
-            if isinstance(obj, bytes):
-                return obj.decode("utf-8", errors="ignore")
-            return str(obj)
-
-        payload = json.dumps(form_data, default=json_safe)
-        print(">>> ABOUT TO START AUTOMATION <<<", flush=True)
-        script_path = os.path.join(os.getcwd(), 'tasks', script_name)
-        
-        # Inject current working directory to PYTHONPATH to ensure imports work
-        env = os.environ.copy()
-        env["PYTHONPATH"] = os.getcwd()
-
-        return subprocess.run(
-            [sys.executable, script_path, str(argument), str(new_status), str(work_order_today_id), payload],
-            check=True,
-            env=env
-        )
+    @action(detail=False, methods=['get'], url_path='unseen-count', permission_classes=[IsAuthenticated])
+    def unseen_count(self, request):
+        # Same filters as the list (?is_deleted=false, ?status=..., ...)
+        queryset = self.filter_queryset(self.get_queryset())
 
+        return Response({
+            "status": "success",
+            "unseen": queryset.filter(is_seen=False).count()
+        })
 
+    
     def update(self, request, *args, **kwargs):
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
@@ -173,35 +223,32 @@ class WorkOrderTodayViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         new_status = serializer.validated_data.get('status')
         
-        # Map specific statuses to their corresponding automation scripts
-        automation_map = {
-            'LOCKED': 'run_locked_deleted_edit_task.py',
-            'DELETED': 'run_locked_deleted_edit_task.py'
-        }
-
-        # Check if automation is required for the new status
-        if (new_status in automation_map):
-            script_name = automation_map[new_status]
-            print(f"Starting automation: {script_name} for ID: {instance.id}")
-
-            try:
-                # Run the script before saving to the database
-                result = self._run_automation_script(script_name, instance.full_address, new_status, 0, None)
-                print(f"Automation Success: {result.stdout}")
+        # Statuses that must be applied in Online RME first
+        automation_statuses = ('LOCKED', 'DELETED')
+
+        if new_status in automation_statuses:
+            # The worker runs the automation and saves this update only if it succeeds
+            job, created = enqueue_automation(
+                new_status,
+                instance,
+                payload={'full_address': instance.full_address, 'work_order_today_id': 0, 'form_data': {"test": "0"}},
+                changes=dict(request.data.items()),
+                user=request.user,
+                partial=partial
+            )
+            logger.info("Queued automation job %s (%s) for ID: %s", job.id, new_status, instance.id)
 
-            except subprocess.CalledProcessError as e:
-                # Automation failed; abort the database update and return error
-                print(f"Automation Failed: {e.stderr}")
-                return Response(
-                    {
-                        "status": "failed",
-                        "message": f"Automation failed for status {new_status}. Database was NOT updated.",
-                        "details": e.stderr
-                    },
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+            return Response(
+                {
+                    "status": "accepted",
+                    "message": f"Automation for status {new_status} queued. The work order is updated once it succeeds.",
+                    "job_id": job.id,
+                    "job_status": job.status
+                },
+                status=status.HTTP_202_ACCEPTED
+            )
 
-        # Only perform the database update if automation succeeded (or wasn't required)
+        # Statuses without automation are saved right away
         self.perform_update(serializer)
 
         return Response(
@@ -218,6 +265,10 @@ class WorkOrderTodayViewSet(viewsets.ModelViewSet):
         """
         Custom create method to filter out duplicates before saving.
         Supports both single object and list of objects (Bulk Create).
+
+        A list answers with the rows it inserted; X-Skipped-Duplicates counts
+        the items left out because their wo_number already exists, including
+        numbers another request inserted while this one was running.
         """
         incoming_data = request.data
 
@@ -226,6 +277,13 @@ class WorkOrderTodayViewSet(viewsets.ModelViewSet):
             unique_data = []
             seen = set()
 
+            # Database check for the whole batch in one IN query
+            existing = set(
+                WorkOrderToday.objects
+                .filter(wo_number__in=[w.get('wo_number') for w in incoming_data if w.get('wo_number')])
+                .values_list('wo_number', flat=True)
+            )
+
             for w in incoming_data:
                 # Get the work order number (Assuming the field name is 'wo_number')
                 # If your input JSON uses 'workOrderNumber', change this line accordingly.
@@ -235,27 +293,51 @@ class WorkOrderTodayViewSet(viewsets.ModelViewSet):
                 if not wo_number:
                     continue
 
-                # Skip if already seen in the current batch (Current request check)
-                if wo_number in seen:
-                    continue
-
-                # Skip if already exists in the database (Database check)
-                if WorkOrderToday.objects.filter(wo_number=wo_number).exists():
+                # Skip if already seen in the current batch or already in the database
+                if wo_number in seen or wo_number in existing:
                     continue
 
                 seen.add(wo_number)
                 unique_data.append(w)
 
             # If there is valid data left after filtering
+            rows = []
             if unique_data:
                 serializer = self.get_serializer(data=unique_data, many=True)
+                # Uniqueness was checked above for the whole batch; skip the per-row UniqueValidator query
+                serializer.child.fields['wo_number'].validators = []
                 serializer.is_valid(raise_exception=True)
-                self.perform_create(serializer)
-                return Response(serializer.data, status=status.HTTP_201_CREATED)
+                rows = serializer.validated_data
+
+            while rows:
+                try:
+                    # Batched INSERTs, all or nothing: every number left in rows is ours
+                    with transaction.atomic():
+                        WorkOrderToday.objects.bulk_create([WorkOrderToday(**item) for item in rows], batch_size=500)
+                    break
+                except IntegrityError:
+                    # Another request inserted some of these numbers since the check above
+                    taken = set(
+                        WorkOrderToday.objects
+                        .filter(wo_number__in=[item['wo_number'] for item in rows])
+                        .values_list('wo_number', flat=True)
+                    )
+                    if not taken:
+                        raise
+                    existing |= taken
+                    rows = [item for item in rows if item['wo_number'] not in taken]
+
+            headers = {'X-Skipped-Duplicates': str(len(existing))}
+            if rows:
+                created = self.get_queryset().filter(wo_number__in=[item['wo_number'] for item in rows])
+                bulk_changed.send(sender=WorkOrderToday, ids=[wo.id for wo in created], action=UPSERT)
+
+                return Response(self.get_serializer(created, many=True).data, status=status.HTTP_201_CREATED, headers=headers)
             else:
                 return Response(
                     {"message": "All items were duplicates or invalid."},
-                    status=status.HTTP_200_OK
+                    status=status.HTTP_200_OK,
+                    headers=headers
                 )
 
         # 2. If data is a single object (Normal Create)
@@ -267,19 +349,94 @@ class WorkOrderTodayViewSet(viewsets.ModelViewSet):
                     {"message": f"WorkOrder {wo_number} already exists."},
                     status=status.HTTP_409_CONFLICT
                 )
-            
-            return super().create(request, *args, **kwargs)
+
+            try:
+                return super().create(request, *args, **kwargs)
+            except IntegrityError:
+                # Lost a race with another insert of the same wo_number
+                return Response(
+                    {"message": f"WorkOrder {wo_number} already exists."},
+                    status=status.HTTP_409_CONFLICT
+                )
+
+    @action(detail=False, methods=['post'], url_path='upsert', permission_classes=[IsAuthenticated])
+    def upsert(self, request):
+        """
+        Create or update a batch of work orders keyed by wo_number.
+        Fields missing from an item are left untouched on existing rows.
+        Body: [{"wo_number": "...", ...}, ...]
+        """
+        if not isinstance(request.data, list):
+            return Response(
+                {"status": "error", "message": "Expected a list of work orders."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Last occurrence of a wo_number wins; items without one cannot be matched
+        items = {item['wo_number']: item for item in request.data if isinstance(item, dict) and item.get('wo_number')}
+        if not items:
+            return Response(
+                {"status": "error", "message": "No work orders with a wo_number were provided."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = self.get_serializer(data=list(items.values()), many=True, partial=True)
+        # Existing numbers are updated, not rejected
+        serializer.child.fields['wo_number'].validators = []
+        if not serializer.is_valid():
+            return Response({"status": "error", "details": serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Rows sending the same fields share one INSERT ... ON CONFLICT UPDATE statement
+        groups = {}
+        for data in serializer.validated_data:
+            groups.setdefault(frozenset(data), []).append(data)
+
+        numbers = list(items)
+        now = timezone.now()
+        with transaction.atomic():
+            existing = set(WorkOrderToday.objects.filter(wo_number__in=numbers).values_list('wo_number', flat=True))
+
+            for fields, rows in groups.items():
+                update_fields = sorted(fields - {'wo_number'}) + ['updated_at']
+                WorkOrderToday.objects.bulk_create(
+                    [WorkOrderToday(**data, updated_at=now) for data in rows],
+                    batch_size=500,
+                    **upsert_options(WorkOrderToday, ['wo_number'], update_fields)
+                )
+
+            # MySQL does not return ids from an upsert, so read them back by number
+            ids = list(WorkOrderToday.objects.filter(wo_number__in=numbers).values_list('id', flat=True))
+            bulk_changed.send(sender=WorkOrderToday, ids=ids, action=UPSERT)
+
+        created_count = len(numbers) - len(existing)
+        response_data = {
+            "status": "success",
+            "message": f"Upserted {len(numbers)} work orders.",
+            "created": created_count,
+            "updated": len(existing)
+        }
+
+        # Rows are only serialized when asked for (?include_data=true)
+        if request.query_params.get('include_data') in ('1', 'true', 'True'):
+            response_data["data"] = self.get_serializer(self.get_queryset().filter(id__in=ids), many=True).data
+
+        return Response(response_data, status=status.HTTP_200_OK)
 
 
 # =============================
 # LOCATES ENDPOINTS
 # =============================
 
-class LocatesViewSet(viewsets.ModelViewSet):
+class LocatesViewSet(StreamingExportViewSetMixin, ChangeFeedViewSetMixin, ConditionalGetViewSetMixin, CachedListViewSetMixin, SparseFieldsetViewSetMixin, viewsets.ModelViewSet):
     queryset = Locates.objects.all().order_by('-created_at')
     serializer_class = LocatesSerializer
     permission_classes = [IsAuthenticated]
-    
+    pagination_class = LocatesCursorPagination
+
+    def get_queryset(self):
+        # Compute is_seen for the whole result set in one query
+        user = getattr(self.request, 'user', None)
+        return annotate_is_seen(super().get_queryset(), user)
     
     def get_serializer_context(self):
         context = super().get_serializer_context()
@@ -293,22 +450,29 @@ class LocatesViewSet(viewsets.ModelViewSet):
 
         ids = serializer.validated_data['ids']
 
-        locates = Locates.objects.filter(id__in=ids)
+        # 🚀 Ignore already seen
+        marked = mark_seen(request.user, Locates, ids)
 
-        seen_objects = [
-            LocateSeen(user=request.user, locate=loc)
-            for loc in locates
-        ]
+        return Response({
+            "status": "success",
+            "marked_seen": marked
+        })
 
-        # 🚀 Ignore already seen
-        LocateSeen.objects.bulk_create(
-            seen_objects,
-            ignore_conflicts=True
-        )
+    @action(detail=False, methods=['post'], url_path='mark-all-seen', permission_classes=[IsAuthenticated])
+    def bulk_mark_all_seen(self, request):
+        # Moves the user's watermark instead of inserting a row per locate
+        last_seen_id = mark_all_seen(request.user, Locates)
+
+        return Response({
+            "status": "success",
+            "last_seen_id": last_seen_id
+        })
 
+    @action(detail=False, methods=['get'], url_path='unseen-count', permission_classes=[IsAuthenticated])
+    def unseen_count(self, request):
         return Response({
             "status": "success",
-            "marked_seen": locates.count()
+            "unseen": self.get_queryset().filter(is_seen=False).count()
         })
 
     # 1. GET ALL (Overriding list method)
@@ -317,17 +481,43 @@ class LocatesViewSet(viewsets.ModelViewSet):
         try:
             # Original logic: order by -created_at
             queryset = self.get_queryset()
-            serializer = self.get_serializer(queryset, many=True)
-            return Response({
-                'success': True,
-                'data': serializer.data
-            })
+
+            # Dashboard polls: answer 304 before serializing when nothing changed
+            not_modified = self.get_not_modified_response(queryset)
+            if not_modified is not None:
+                return not_modified
+
+            def build():
+                # Keyset paging when the client asks for it (?cursor= / ?limit=)
+                page = self.paginate_queryset(queryset)
+                if page is not None:
+                    serializer = self.get_serializer(page, many=True)
+                    return self.get_paginated_response(serializer.data)
+
+                serializer = self.get_serializer(queryset, many=True)
+                return Response({
+                    'success': True,
+                    'data': serializer.data
+                })
+
+            # One serialization per page / cursor, shared by all viewers
+            return self.cached_list_response(build)
+        except InvalidCursor as e:
+            return invalid_cursor_response(e)
         except Exception as e:
             return Response({
                 'success': False,
                 'message': str(e)
             }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        not_modified = self.get_object_not_modified_response(instance)
+        if not_modified is not None:
+            return not_modified
+        serializer = self.get_serializer(instance)
+        return Response(serializer.data)
+
     # 2. SYNC LOGIC (Custom Action)
     # Equivalent to: sync_assigned_locates
     # Note: Original function didn't have permission_classes, so we use AllowAny for this action to match behavior.
@@ -350,10 +540,8 @@ class LocatesViewSet(viewsets.ModelViewSet):
                         seen.add(wo_number)
                         unique.append(w)
                 
-                # Create locates in database
-                created_count = 0
-                for wo_data in unique:
-                    locate_data = {
+                incoming = {
+                    wo_data['workOrderNumber']: {
                         'work_order_number': wo_data.get('workOrderNumber', ''),
                         'customer_name': wo_data.get('customerName', ''),
                         'customer_address': wo_data.get('customerAddress', ''),
@@ -362,23 +550,73 @@ class LocatesViewSet(viewsets.ModelViewSet):
                         'tech_name': wo_data.get('techName', ''),
                         'scheduled_date': wo_data.get('scheduledDate', ''),
                         'created_date': wo_data.get('createdDate', ''),
-                        'scraped_at': timezone.now()
                     }
-                    
-                    # Check if already exists
-                    if not Locates.objects.filter(work_order_number=locate_data['work_order_number']).exists():
-                        Locates.objects.create(**locate_data)
-                        created_count += 1
-                
-                # Get latest data to return (Logic preserved)
-                latest_locates = Locates.objects.all().order_by('-scraped_at')[:10]
-                serializer = self.get_serializer(latest_locates, many=True)
-                
-                return Response({
+                    for wo_data in unique
+                }
+
+                # Fields FieldEdge can change on a locate we already have
+                sync_fields = ['status', 'tech_name', 'scheduled_date']
+                now = timezone.now()
+
+                with transaction.atomic():
+                    # One lookup for every incoming number
+                    existing = {
+                        loc.work_order_number: loc
+                        for loc in Locates.objects
+                        .filter(work_order_number__in=list(incoming))
+                        .only('id', 'work_order_number', *sync_fields)
+                    }
+
+                    new_locates = [
+                        Locates(**locate_data, scraped_at=now)
+                        for number, locate_data in incoming.items() if number not in existing
+                    ]
+
+                    changed_locates = []
+                    for number, locate in existing.items():
+                        locate_data = incoming[number]
+                        if any(getattr(locate, field) != locate_data[field] for field in sync_fields):
+                            for field in sync_fields:
+                                setattr(locate, field, locate_data[field])
+                            # bulk_update() does not apply auto_now
+                            locate.scraped_at = now
+                            locate.updated_at = now
+                            changed_locates.append(locate)
+
+                    # ignore_conflicts: a concurrent sync may have inserted the same number
+                    Locates.objects.bulk_create(new_locates, batch_size=500, ignore_conflicts=True)
+                    Locates.objects.bulk_update(
+                        changed_locates, sync_fields + ['scraped_at', 'updated_at'], batch_size=500
+                    )
+
+                    # bulk_create(ignore_conflicts=True) returns no ids: read them back by the
+                    # numbers that were missing from the lookup above
+                    created_ids = list(
+                        Locates.objects
+                        .filter(work_order_number__in=[loc.work_order_number for loc in new_locates])
+                        .values_list('id', flat=True)
+                    )
+                    changed_ids = created_ids + [loc.id for loc in changed_locates]
+                    if changed_ids:
+                        bulk_changed.send(sender=Locates, ids=changed_ids, action=UPSERT)
+
+                created_count = len(created_ids)
+                updated_count = len(changed_locates)
+
+                response_data = {
                     'success': True,
                     'message': f"Dashboard synced successfully with {created_count} new work orders",
-                    'data': serializer.data
-                })
+                    'created': created_count,
+                    'updated': updated_count,
+                    'unchanged': len(existing) - updated_count
+                }
+
+                # The latest rows are only serialized when asked for (?include_data=true)
+                if request.query_params.get('include_data') in ('1', 'true', 'True'):
+                    latest_locates = self.get_queryset().order_by('-scraped_at')[:10]
+                    response_data['data'] = self.get_serializer(latest_locates, many=True).data
+
+                return Response(response_data)
             
             return Response({
                 'success': False,
@@ -485,73 +723,150 @@ class UnifiedBulkUpdateView(APIView):
             return Response(payload_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         validated_data = payload_serializer.validated_data
-        work_orders_data = validated_data.get('work_orders', [])
-        locates_data = validated_data.get('locates', [])
+        # Items are validated without the per-row unique queries; see unique_conflicts() below
+        targets = [
+            (WorkOrderToday, WorkOrderTodaySerializer, WorkOrderTodayBulkSerializer, 'work_order', validated_data.get('work_orders', [])),
+            (Locates, LocatesSerializer, LocatesBulkSerializer, 'locate', validated_data.get('locates', [])),
+        ]
 
-        updated_work_orders = []
-        updated_locates = []
+        # Response rows are only needed when ?include_data is not false
+        include_data = request.query_params.get('include_data') not in ('0', 'false', 'False')
+
+        updated = {}
         errors = {}
 
-        # Use atomic transaction to ensure data integrity. 
         try:
-            with transaction.atomic():
-                
-                # --- Process Work Orders ---
-                for item in work_orders_data:
-                    wo_id = item.get('id')
-                    if not wo_id:
-                        continue # Skip items without ID
-                    
-                    # Fetch the instance
-                    instance = get_object_or_404(WorkOrderToday, pk=wo_id)
-                    
-                    # Initialize serializer with partial=True for PATCH behavior
-                    serializer = WorkOrderTodaySerializer(instance, data=item, partial=True)
-                    
-                    if serializer.is_valid():
-                        serializer.save()
-                        updated_work_orders.append(serializer.data)
-                    else:
-                        errors[f"work_order_{wo_id}"] = serializer.errors
-
-                # --- Process Locates ---
-                for item in locates_data:
-                    loc_id = item.get('id')
-                    if not loc_id:
-                        continue # Skip items without ID
-
-                    # Fetch the instance
-                    instance = get_object_or_404(Locates, pk=loc_id)
-                    
+            # 2. Load every target with one query per model and validate in memory
+            for model, _, serializer_class, prefix, items in targets:
+                items = [item for item in items if item.get('id')] # Skip items without ID
+                instances = model.objects.in_bulk([item['id'] for item in items])
+                originals = {
+                    pk: {field.attname: getattr(instance, field.attname) for field in unique_fields(model)}
+                    for pk, instance in instances.items()
+                }
+
+                changed_fields = {}
+                for item in items:
+                    instance = instances.get(item['id'])
+                    if instance is None:
+                        return Response(
+                            {"status": "error", "message": f"No {model.__name__} matches the given query."},
+                            status=status.HTTP_400_BAD_REQUEST
+                        )
+                    if instance.pk in changed_fields or f"{prefix}_{instance.pk}" in errors:
+                        errors[f"{prefix}_{instance.pk}"] = {"id": ["Listed more than once in this request."]}
+                        continue
+
                     # Initialize serializer with partial=True for PATCH behavior
-                    serializer = LocatesSerializer(instance, data=item, partial=True)
-                    
-                    if serializer.is_valid():
-                        serializer.save()
-                        updated_locates.append(serializer.data)
-                    else:
-                        errors[f"locate_{loc_id}"] = serializer.errors
-                if errors:
-                    raise serializers.ValidationError(errors)
+                    serializer = serializer_class(instance, data=item, partial=True, context={'request': request})
+                    if not serializer.is_valid():
+                        errors[f"{prefix}_{instance.pk}"] = serializer.errors
+                        continue
+
+                    for field, value in serializer.validated_data.items():
+                        setattr(instance, field, value)
+                    changed_fields[instance.pk] = set(serializer.validated_data)
+
+                # Unique values against the rest of the batch (after the update) and one IN query per field
+                rows = {pk: instances[pk] for pk in changed_fields}
+                for pk, conflict in unique_conflicts(model, rows).items():
+                    errors[f"{prefix}_{pk}"] = conflict
+
+                updated[model] = (instances, changed_fields, originals)
+
+            if errors:
+                raise serializers.ValidationError(errors)
+
+            # 3. Write: one bulk_update per model and field set, in a short transaction
+            now = timezone.now()
+            with transaction.atomic():
+                for model, (instances, changed_fields, originals) in updated.items():
+                    release_unique_values(model, {pk: instances[pk] for pk in changed_fields}, originals)
+
+                    groups = {}
+                    for pk, fields in changed_fields.items():
+                        instance = instances[pk]
+                        instance.updated_at = now # bulk_update() does not apply auto_now
+                        groups.setdefault(frozenset(fields), []).append(instance)
+
+                    for fields, group in groups.items():
+                        model.objects.bulk_update(group, sorted(fields) + ['updated_at'], batch_size=500)
+
+                    if changed_fields:
+                        bulk_changed.send(sender=model, ids=list(changed_fields), action=UPSERT)
 
         except serializers.ValidationError as e:
             return Response({"status": "error", "details": e.detail}, status=status.HTTP_400_BAD_REQUEST)
+        except IntegrityError:
+            # Lost a race with another write of the same unique value
+            return Response(
+                {"status": "error", "message": "A unique value in the request is already used by another record."},
+                status=status.HTTP_409_CONFLICT
+            )
         except Exception as e:
             return Response({"status": "error", "message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        return Response({
+        response_data = {
             "status": "success",
             "message": "Records updated successfully.",
             "updated_counts": {
-                "work_orders": len(updated_work_orders),
-                "locates": len(updated_locates)
-            },
-            "data": {
-                "work_orders": updated_work_orders,
-                "locates": updated_locates
+                "work_orders": len(updated[WorkOrderToday][1]),
+                "locates": len(updated[Locates][1])
             }
-        }, status=status.HTTP_200_OK)
+        }
+
+        if include_data:
+            # One annotated query per model instead of re-serializing row by row
+            data = {}
+            for (model, serializer_class, _, _, _), key in zip(targets, ('work_orders', 'locates')):
+                ids = list(updated[model][1])
+                rows = annotate_is_seen(model.objects.filter(pk__in=ids), request.user) if ids else []
+                rows = {row.pk: row for row in rows}
+                # Same order as the request
+                data[key] = serializer_class([rows[pk] for pk in ids], many=True, context={'request': request}).data
+            response_data["data"] = data
+
+        return Response(response_data, status=status.HTTP_200_OK)
+
 
+class DashboardSummaryView(APIView):
+    """
+    Counters for the dashboard header widgets, computed in the database.
+
+    Method: GET
+    Work order counters accept the same query parameters as the work order
+    list (WorkOrderTodayFilter); locate counters cover locates that are not
+    deleted. Responses are cached for SUMMARY_CACHE_TIMEOUT seconds and
+    dropped as soon as either table changes.
+    """
+
+    def get(self, request, *args, **kwargs):
+        params = request.query_params
+        query = sorted((key, sorted(params.getlist(key))) for key in params)
+        digest = hashlib.sha1(repr(query).encode('utf-8')).hexdigest()
+        # Read from the database, so writes from any process retire the entry
+        cache_key = f"dashboard-summary:{table_fingerprint(WorkOrderToday)}:{table_fingerprint(Locates)}:{digest}"
+
+        data = cache.get(cache_key)
+        if data is None:
+            work_orders = WorkOrderTodayFilter(params, queryset=WorkOrderToday.objects.all())
+            if not work_orders.is_valid():
+                return Response({
+                    'success': False,
+                    'message': work_orders.errors
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            data = {
+                'work_orders': work_order_summary(work_orders.qs),
+                'locates': locates_summary(Locates.objects.filter(is_deleted=False)),
+                'generated_at': timezone.now(),
+            }
+            cache.set(cache_key, data, getattr(settings, 'SUMMARY_CACHE_TIMEOUT', 30))
+
+        return Response({
+            'success': True,
+            'data': data
+        })
 
 
 class WorkOrderTodayEditViewSet(viewsets.ModelViewSet):
@@ -560,33 +875,7 @@ class WorkOrderTodayEditViewSet(viewsets.ModelViewSet):
     lookup_field = 'work_order_today_id' 
     
     
-    def _run_automation_script(self, script_name, argument, new_status, work_order_today_id, form_data):
-        """
-        Helper method to execute external automation scripts.
-        Raises CalledProcessError if the script fails.
-        """
-        if form_data is None:
-            form_data = {}
-        def json_safe(obj):
-            if isinstance(obj, bytes):
-                return obj.decode("utf-8", errors="ignore")
-            return str(obj)
-
-        payload = json.dumps(form_data, default=json_safe)
-        print(">>> ABOUT TO START AUTOMATION <<<", flush=True)
-        script_path = os.path.join(os.getcwd(), 'tasks', script_name)
-        
-        # Inject current working directory to PYTHONPATH to ensure imports work
-        env = os.environ.copy()
-        env["PYTHONPATH"] = os.getcwd()
-
-        return subprocess.run(
-            [sys.executable, script_path, str(argument), str(new_status), str(work_order_today_id), payload],
-            check=True,
-            env=env
-        )
-
-        # --- 2. Custom PATCH Method (Update specific fields) ---
+    # --- 2. Custom PATCH Method (Update specific fields) ---
     def partial_update(self, request, *args, **kwargs):
         status_query = request.query_params.get('status')
 
@@ -626,36 +915,53 @@ class WorkOrderTodayEditViewSet(viewsets.ModelViewSet):
             )
 
         # ✅ status_query 
-        response = super().partial_update(request, *args, **kwargs)
         instance = self.get_object()
+        serializer = self.get_serializer(instance, data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
 
         work_order_today = instance.work_order_today
-        full_address = work_order_today.full_address
-        work_order_today_id = work_order_today.id
-        form_data = instance.form_data
-        script_name = 'run_locked_deleted_edit_task.py'
-        print(f"Starting automation: {script_name} for ID: {instance.id}")
-        serializer = self.get_serializer(instance)
-        try:
-            self._run_automation_script(script_name, full_address, "UPDATE", work_order_today_id, form_data)
-            print("Automation Success")
-            return Response(
-                {
-                    "status": "success",
-                    "message": "Work Order edit automation completed successfully.",
-                    "data": serializer.data
-                },
-                status=status.HTTP_200_OK
-            )
-        except subprocess.CalledProcessError as e:
-            print(f"Automation Failed: {e.stderr}")
-            return Response(
-                {
-                    "status": "failed",
-                    "message": "Automation failed. Database was NOT updated.",
-                    "details": e.stderr
-                },
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        # The edit is pushed to Online RME by the worker and saved only if that succeeds
+        job, created = enqueue_automation(
+            'UPDATE',
+            work_order_today,
+            payload={
+                'full_address': work_order_today.full_address,
+                'work_order_today_id': work_order_today.id,
+                'form_data': serializer.validated_data.get('form_data', instance.form_data)
+            },
+            changes=dict(request.data.items()),
+            user=request.user
+        )
+        logger.info("Queued automation job %s (UPDATE) for ID: %s", job.id, instance.id)
+
+        return Response(
+            {
+                "status": "accepted",
+                "message": "Work Order edit automation queued. The edit is saved once it succeeds.",
+                "job_id": job.id,
+                "job_status": job.status
+            },
+            status=status.HTTP_202_ACCEPTED
+        )
 
 
+class AutomationJobViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Status / progress of the queued Online RME automations (see locates.jobs).
+    GET automation-jobs/<job_id>/ is polled after a 202 from a lock / delete / edit.
+    """
+    queryset = AutomationJob.objects.all()
+    serializer_class = AutomationJobSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['status', 'action', 'work_order_today']
+
+
+class ScrapeRunViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    Scrape runs started by work-orders-today/start-scraping/ or the scheduler,
+    with per-scraper progress (see locates.scrape_runs).
+    """
+    queryset = ScrapeRun.objects.all()
+    serializer_class = ScrapeRunSerializer
+    filter_backends = [DjangoFilterBackend]
+    filterset_fields = ['status', 'trigger']
@@ -4,3 +4,18 @@ from django.apps import AppConfig
 class TankRepairConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'tank_repair'
+
+    def ready(self):
+        from core import changes, events, search
+        from .models import TankRepair
+
+        # Columns behind TankRepairViewSet.search_fields (FULLTEXT index: migration 0002)
+        search.register(
+            TankRepair,
+            ['work_order_number', 'name', 'address', 'notes', 'assigned_to'],
+            fulltext_index='tankrepair_search_ft'
+        )
+
+        # Change feed (GET /api/tank-repairs/changes/?since=)
+        changes.track(TankRepair)
+        events.register(TankRepair)
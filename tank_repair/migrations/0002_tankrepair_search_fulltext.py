@@ -0,0 +1,33 @@
+from django.db import migrations
+
+
+INDEX_NAME = 'tankrepair_search_ft'
+COLUMNS = 'work_order_number, name, address, notes, assigned_to'
+
+
+def add_fulltext_index(apps, schema_editor):
+    # FULLTEXT / ngram only exists on MySQL; other databases use the token index
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    table = apps.get_model('tank_repair', 'TankRepair')._meta.db_table
+    schema_editor.execute(
+        f"ALTER TABLE {table} ADD FULLTEXT INDEX {INDEX_NAME} ({COLUMNS}) WITH PARSER ngram"
+    )
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    table = apps.get_model('tank_repair', 'TankRepair')._meta.db_table
+    schema_editor.execute(f"ALTER TABLE {table} DROP INDEX {INDEX_NAME}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tank_repair', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_fulltext_index, drop_fulltext_index),
+    ]
@@ -1,8 +1,10 @@
 # views.py
 from rest_framework import viewsets
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 import django_filters
+from core.changes import ChangeFeedViewSetMixin
+from core.search import IndexedSearchFilter
 from .models import TankRepair
 from .serializers import TankRepairSerializer
 
@@ -19,17 +21,19 @@ class TankRepairFilter(django_filters.FilterSet):
         return queryset.filter(needed_items__icontains=value)
 
 
-class TankRepairViewSet(viewsets.ModelViewSet):
+class TankRepairViewSet(ChangeFeedViewSetMixin, viewsets.ModelViewSet):
     queryset = TankRepair.objects.all()
     serializer_class = TankRepairSerializer
 
     filter_backends = [
         DjangoFilterBackend,
-        SearchFilter,
+        IndexedSearchFilter,
         OrderingFilter
     ]
 
     filterset_class = TankRepairFilter
-    search_fields = "__all__"
+    # Text columns only. The former "__all__" is not supported by SearchFilter
+    # (it read it as one-letter field names and every ?search= failed).
+    search_fields = ['work_order_number', 'name', 'address', 'notes', 'assigned_to']
     ordering_fields = "__all__"
 
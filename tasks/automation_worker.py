@@ -0,0 +1,123 @@
+"""
+Resident Online RME session for the automation job worker.
+
+``run_locked_deleted_edit_task.py`` starts a new interpreter, imports
+Playwright, launches Chromium, logs the API client in and signs in to Online
+RME for every lock / delete / edit. ``AutomationWorker`` does that once and
+keeps the ``OnlineRMELocedDeletedTask`` (browser, page, RME session) alive
+between jobs; ``run()`` only pays for the RME interaction itself.
+
+``run_batch()`` locks / discards several reports in one pass over the work
+history grid. The browser (from automation.services.browser_pool) is
+restarted after a failure or timeout; the RME context is recycled every
+``max_jobs`` jobs and the pool relaunches the browser after
+BROWSER_POOL_MAX_PAGES pages. The script stays the entry point for manual runs.
+"""
+import asyncio
+
+from automation.services.browser_pool import close_browser_pool
+from locates.jobs import AutomationError, job_timeout
+from tasks.run_locked_deleted_edit_task import OnlineRMELocedDeletedTask, close_task, log_info
+
+
+class AutomationWorker:
+    """
+    Runs Online RME tasks in one long-lived browser session.
+    Use ``worker.run`` as the ``runner`` of ``locates.jobs.run_job``.
+    """
+
+    def __init__(self, max_jobs=50):
+        self.max_jobs = max_jobs
+        self.loop = asyncio.new_event_loop()
+        self.task = None
+        self.jobs_run = 0
+
+    def _is_alive(self):
+        task = self.task
+        return (
+            task is not None
+            and task.browser is not None and task.browser.is_connected()
+            and task.page is not None and not task.page.is_closed()
+        )
+
+    async def _start(self):
+        log_info("Starting resident Online RME browser...")
+        self.task = OnlineRMELocedDeletedTask()
+        await self.task.initialize()
+        self.jobs_run = 0
+
+    async def _stop(self):
+        task, self.task = self.task, None
+        if task is not None:
+            await close_task(task)
+            log_info("Resident Online RME browser closed.")
+
+    async def _ensure_started(self, jobs):
+        if self.task is not None and (not self._is_alive() or self.jobs_run >= self.max_jobs):
+            await self._stop()
+        if self.task is None:
+            await self._start()
+        self.jobs_run += jobs
+
+    async def _run(self, action, payload):
+        await self._ensure_started(1)
+        try:
+            # open_search_page() inside run() only signs in again when the session expired
+            return await asyncio.wait_for(
+                self.task.run(
+                    payload.get('full_address'), action,
+                    str(payload.get('work_order_today_id', 0)), payload.get('form_data') or {}
+                ),
+                timeout=job_timeout()
+            )
+        except asyncio.TimeoutError:
+            # The browser is in an unknown state: start over with the next job
+            await self._close()
+            raise AutomationError(f"Automation timed out after {job_timeout()} seconds.")
+
+    async def _run_batch(self, items):
+        await self._ensure_started(len(items))
+        try:
+            return await asyncio.wait_for(
+                self.task.run_batch([
+                    {"full_address": payload.get('full_address'), "action": action}
+                    for action, payload in items
+                ]),
+                timeout=job_timeout()
+            )
+        except asyncio.TimeoutError:
+            await self._close()
+            raise AutomationError(f"Automation timed out after {job_timeout()} seconds.")
+
+    def run(self, action, payload):
+        """Run ``action`` for ``payload`` in the resident session. Raises AutomationError if it fails."""
+        try:
+            result = self.loop.run_until_complete(self._run(action, payload))
+        except AutomationError:
+            raise
+        except Exception as e:
+            self.loop.run_until_complete(self._close())
+            raise AutomationError(f"Automation failed for status {action}: {e}.") from e
+
+        if not result.get("success"):
+            raise AutomationError(f"Automation failed for status {action}: {result.get('error', 'Unknown error')}.")
+        return result
+
+    def run_batch(self, items):
+        """
+        Lock / discard ``(action, payload)`` items in one work history pass.
+        Returns one ``{"success", "error"}`` dict per item (see locates.jobs.run_job_batch).
+        """
+        try:
+            return self.loop.run_until_complete(self._run_batch(items))
+        except Exception:
+            self.loop.run_until_complete(self._close())
+            raise
+
+    async def _close(self):
+        await self._stop()
+        await close_browser_pool()
+
+    def close(self):
+        self.loop.run_until_complete(self._close())
+        self.loop.close()
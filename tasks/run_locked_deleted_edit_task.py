@@ -19,6 +19,7 @@ from automation.scrapers.online_rme_scraper import OnlineRMEScraper
 from tasks.helper.edit_task import OnlineRMEEditTaskHelper
 from asyncio import sleep
 from locates.models import WorkOrderTodayEdit  # ⚠️ Add your model import here
+from automation.services.browser_pool import close_browser_pool
 
 # ==========================================
 # Force Unbuffered Output (Critical for Server Logs)
@@ -48,6 +49,19 @@ def log_warning(message):
     """Writes warning messages immediately."""
     print(f"[WARNING] {message}", flush=True)
 
+# ==========================================
+# Online RME work history grid
+# ==========================================
+# Table selector - using ID contains pattern
+WORK_HISTORY_TABLE_SELECTOR = "table[id$='DataGridOMhistory']"
+# Rows selector - get all rows from tbody
+WORK_HISTORY_ROWS_SELECTOR = "table[id$='DataGridOMhistory'] tbody tr"
+
+ADDRESS_COLUMN_INDEX = 7  # Site Address column
+EDIT_COLUMN_INDEX = 10    # Edit column
+LOCK_COLUMN_INDEX = 11    # Lock column
+DISCARD_COLUMN_INDEX = 0  # Discard column (for DELETE)
+
 # ==========================================
 # Database Helper Functions (Async-Safe)
 # ==========================================
@@ -151,6 +165,155 @@ class OnlineRMELocedDeletedTask(OnlineRMEScraper, OnlineRMEEditTaskHelper):
                 "data": []
             }
     
+    async def lock_report(self, columns) -> dict:
+        """
+        Lock the report of a work history row (``columns`` = its td cells).
+        Raises if the Lock button cannot be clicked.
+        """
+        # Column 11 - Lock button (image input)
+        lock_item = columns.nth(LOCK_COLUMN_INDEX)
+        lock_button = lock_item.locator('input[type="image"]')
+        
+        log_info("Attempting to click Lock button...")
+        await lock_button.click(timeout=5000)
+        
+        # Wait for the LOCK REPORT button to appear
+        try:
+            log_info("Waiting for LOCK REPORT button...")
+            lock_report_btn_selector = self.rules.get('wait_lock_report_btn', 'input[value*="LOCK" i], input[value*="Report" i], button:has-text("LOCK")')
+            await self.page.wait_for_selector(lock_report_btn_selector, state='visible', timeout=30000)
+            
+            element = self.page.locator(lock_report_btn_selector)
+            await element.click()
+            
+            # Wait for navigation/network idle
+            await self.page.wait_for_load_state("networkidle", timeout=20000)
+            log_success("✅ Report LOCKED successfully.")
+            return {"success": True, "action": "LOCKED"}
+            
+        except Exception as e:
+            log_error(f"❌ Error clicking LOCK REPORT button: {e}")
+            return {"success": False, "error": str(e)}
+
+    async def discard_report(self, columns) -> dict:
+        """
+        Discard the report of a work history row (``columns`` = its td cells).
+        Raises if the Discard link cannot be clicked.
+        """
+        # Column 0 - Discard link (a tag with img)
+        discard_item = columns.nth(DISCARD_COLUMN_INDEX)
+        discard_link = discard_item.locator('a')
+        
+        log_info("Attempting to click Discard/Delete...")
+        await discard_link.click(timeout=5000)
+        
+        # Handle confirmation dialog if it appears
+        try:
+            # Wait for and accept any confirmation dialog
+            dialog = await self.page.wait_for_event('dialog', timeout=3000)
+            log_info(f"Dialog appeared: {dialog.message}")
+            await dialog.accept()
+            log_success("✅ Dialog accepted")
+        except:
+            log_info("No confirmation dialog appeared")
+        
+        await self.page.wait_for_timeout(2000)
+        log_success(f"✅ Report DELETED successfully.")
+        return {"success": True, "action": "DELETED"}
+
+    async def read_work_history_addresses(self) -> list:
+        """
+        Site Address of every work history row, read in one round trip
+        (None for rows too short to have one). Indexes match the grid rows.
+        """
+        await self.page.wait_for_selector(WORK_HISTORY_TABLE_SELECTOR, state='visible', timeout=10000)
+        return await self.page.eval_on_selector_all(
+            WORK_HISTORY_ROWS_SELECTOR,
+            "(rows, index) => rows.map(row => {"
+            "  const cells = row.querySelectorAll('td');"
+            "  return cells.length > index ? cells[index].innerText : null;"
+            "})",
+            ADDRESS_COLUMN_INDEX
+        )
+
+    async def lock_discard_batch(self, items: list) -> list:
+        """
+        Lock / discard many reports with one load of the work history grid.
+
+        ``items`` are ``{"full_address", "action"}`` dicts (action LOCKED or
+        DELETED), processed in order. Targets are matched against the grid in
+        memory; the grid is read again only after an action has posted back.
+        Returns one ``{"full_address", "action", "success", ...}`` per item.
+        """
+        rme_work_history_url = self.rules.get('rme_work_history_url')
+        if not rme_work_history_url:
+            log_error("❌ Configuration Error: Missing URLs or selectors in rules.")
+            return [{**item, "success": False, "error": "Configuration error"} for item in items]
+
+        log_info(f"Navigating to work history page for {len(items)} reports...")
+        await self.page.goto(url=rme_work_history_url, wait_until='domcontentloaded')
+        try:
+            addresses = await self.read_work_history_addresses()
+        except Exception as e:
+            log_error(f"❌ Work history table did not appear (Timeout): {e}")
+            return [{**item, "success": False, "error": "Table timeout"} for item in items]
+
+        results = []
+        grid_changed = False
+        for item in items:
+            action = item.get("action")
+            full_address_lower = (item.get("full_address") or "").strip().lower()
+
+            if action not in ("LOCKED", "DELETED"):
+                results.append({**item, "success": False, "error": f"Invalid status: {action}"})
+                continue
+            if not full_address_lower:
+                results.append({**item, "success": False, "error": "No address provided"})
+                continue
+
+            try:
+                if grid_changed:
+                    # The last action posted back (or left the page): row positions are stale
+                    if self.page.url != rme_work_history_url:
+                        await self.page.goto(url=rme_work_history_url, wait_until='domcontentloaded')
+                    addresses = await self.read_work_history_addresses()
+                    grid_changed = False
+
+                matches = [
+                    index for index, address_text in enumerate(addresses)
+                    if address_text and address_text.strip()
+                    and (address_text.strip().lower() in full_address_lower or full_address_lower in address_text.strip().lower())
+                ]
+                if not matches:
+                    log_warning(f"⚠️ No matching address found for: {item.get('full_address')}")
+                    results.append({**item, "success": False, "error": "No match found"})
+                    continue
+
+                grid_changed = True
+                for index in matches:
+                    log_success(f"✅ Match found at row {index + 1}: {addresses[index].strip()}")
+                    columns = self.page.locator(WORK_HISTORY_ROWS_SELECTOR).nth(index).locator("td")
+                    try:
+                        if action == "LOCKED":
+                            result = await self.lock_report(columns)
+                        else:
+                            result = await self.discard_report(columns)
+                        break
+                    except Exception as click_err:
+                        # The click did not go through, so the grid is unchanged: try the next match
+                        log_error(f"❌ Error performing action '{action}' at row {index + 1}: {click_err}")
+                        result = {"success": False, "error": str(click_err)}
+
+            except Exception as e:
+                log_error(f"❌ Error performing action '{action}' for {item.get('full_address')}: {e}")
+                result = {"success": False, "error": str(e)}
+
+            results.append({**item, **result})
+
+        succeeded = sum(1 for result in results if result.get("success"))
+        log_info(f"Batch finished: {succeeded}/{len(items)} reports processed.")
+        return results
+
     async def address_match_and_lock_task(self, full_address: str, new_status: str, work_order_edit_id: str, form_data: dict) -> dict:
         """Checks if the address exists in the work history table and performs the requested action."""
         log_info(f"Starting address match process for: {full_address}")
@@ -159,17 +322,8 @@ class OnlineRMELocedDeletedTask(OnlineRMEScraper, OnlineRMEEditTaskHelper):
         # CORRECT LOCATORS FOR YOUR TABLE STRUCTURE
         # ==========================================
         rme_work_history_url = self.rules.get('rme_work_history_url')
-        
-        # ✅ Correct table selector - using ID contains pattern
-        table_selector = "table[id$='DataGridOMhistory']"
-        
-        # ✅ Correct rows selector - get all rows from tbody
-        rows_selector = "table[id$='DataGridOMhistory'] tbody tr"
-        
-        ADDRESS_COLUMN_INDEX = 7  # Site Address column
-        EDIT_COLUMN_INDEX = 10    # Edit column
-        LOCK_COLUMN_INDEX = 11    # Lock column
-        DISCARD_COLUMN_INDEX = 0  # Discard column (for DELETE)
+        table_selector = WORK_HISTORY_TABLE_SELECTOR
+        rows_selector = WORK_HISTORY_ROWS_SELECTOR
 
         if not all([rme_work_history_url, table_selector]):
             log_error("❌ Configuration Error: Missing URLs or selectors in rules.")
@@ -229,52 +383,10 @@ class OnlineRMELocedDeletedTask(OnlineRMEScraper, OnlineRMEEditTaskHelper):
                             # ==========================================
                             
                             if new_status == "LOCKED":
-                                # Column 11 - Lock button (image input)
-                                lock_item = columns.nth(LOCK_COLUMN_INDEX)
-                                lock_button = lock_item.locator('input[type="image"]')
-                                
-                                log_info("Attempting to click Lock button...")
-                                await lock_button.click(timeout=5000)
-                                
-                                # Wait for the LOCK REPORT button to appear
-                                try:
-                                    log_info("Waiting for LOCK REPORT button...")
-                                    lock_report_btn_selector = self.rules.get('wait_lock_report_btn', 'input[value*="LOCK" i], input[value*="Report" i], button:has-text("LOCK")')
-                                    await self.page.wait_for_selector(lock_report_btn_selector, state='visible', timeout=30000)
-                                    
-                                    element = self.page.locator(lock_report_btn_selector)
-                                    await element.click()
-                                    
-                                    # Wait for navigation/network idle
-                                    await self.page.wait_for_load_state("networkidle", timeout=20000)
-                                    log_success("✅ Report LOCKED successfully.")
-                                    return {"success": True, "action": "LOCKED"}
-                                    
-                                except Exception as e:
-                                    log_error(f"❌ Error clicking LOCK REPORT button: {e}")
-                                    return {"success": False, "error": str(e)}
+                                return await self.lock_report(columns)
 
                             elif new_status == "DELETED":
-                                # Column 0 - Discard link (a tag with img)
-                                discard_item = columns.nth(DISCARD_COLUMN_INDEX)
-                                discard_link = discard_item.locator('a')
-                                
-                                log_info("Attempting to click Discard/Delete...")
-                                await discard_link.click(timeout=5000)
-                                
-                                # Handle confirmation dialog if it appears
-                                try:
-                                    # Wait for and accept any confirmation dialog
-                                    dialog = await self.page.wait_for_event('dialog', timeout=3000)
-                                    log_info(f"Dialog appeared: {dialog.message}")
-                                    await dialog.accept()
-                                    log_success("✅ Dialog accepted")
-                                except:
-                                    log_info("No confirmation dialog appeared")
-                                
-                                await self.page.wait_for_timeout(2000)
-                                log_success(f"✅ Report DELETED successfully.")
-                                return {"success": True, "action": "DELETED"}
+                                return await self.discard_report(columns)
                                 
                             elif new_status == "UPDATE":
                                 # Column 10 - Edit button (image input)
@@ -355,6 +467,21 @@ class OnlineRMELocedDeletedTask(OnlineRMEScraper, OnlineRMEEditTaskHelper):
             traceback.print_exc()
             return {"success": False, "error": str(e)}
         
+    async def open_rme_session(self):
+        """Sign in to Online RME if needed and wait for the page body."""
+        # Only signs in on first use or when the session expired
+        log_info("Opening Online RME search page...")
+        await self.open_search_page()
+        
+        # Wait for main page to load
+        wait_xpath = self.rules.get("wait_rme_body", "body")
+        try:
+            log_info("Waiting for page body...")
+            await self.page.wait_for_selector(wait_xpath, state='visible', timeout=30000)
+            log_success("✅ Page loaded successfully")
+        except Exception as e:
+            log_warning(f"⚠️ Timeout waiting for page body: {e}")
+
     async def run(self, full_address: str, new_status: str, work_order_edit_id: str, form_data: dict):
         log_info("Run method called. Initializing setup...")
         
@@ -365,18 +492,7 @@ class OnlineRMELocedDeletedTask(OnlineRMEScraper, OnlineRMEEditTaskHelper):
             log_info("Page is already initialized.")
             
         try:
-            # Ensure authentication
-            log_info("Ensuring user is authenticated...")
-            await self.ensure_authenticated()
-            
-            # Wait for main page to load
-            wait_xpath = self.rules.get("wait_rme_body", "body")
-            try:
-                log_info("Waiting for page body...")
-                await self.page.wait_for_selector(wait_xpath, state='visible', timeout=30000)
-                log_success("✅ Page loaded successfully")
-            except Exception as e:
-                log_warning(f"⚠️ Timeout waiting for page body: {e}")
+            await self.open_rme_session()
             
             # Parse address
             if not full_address:
@@ -390,15 +506,70 @@ class OnlineRMELocedDeletedTask(OnlineRMEScraper, OnlineRMEEditTaskHelper):
             import traceback
             traceback.print_exc()
             return {"success": False, "error": str(e)}
+
+    async def run_batch(self, items: list) -> list:
+        """Lock / discard many reports in one session (see lock_discard_batch)."""
+        log_info(f"Batch run called for {len(items)} reports. Initializing setup...")
         
+        if not self.page:
+            log_info("Page not ready, running initialization...")
+            await self.initialize()
+            
+        try:
+            await self.open_rme_session()
+            return await self.lock_discard_batch(items)
+            
+        except Exception as e:
+            log_error(f"❌ Locked Task Batch Error: {e}")
+            import traceback
+            traceback.print_exc()
+            return [{**item, "success": False, "error": str(e)} for item in items]
+        
+
+async def close_task(scraper):
+    """Release the browser context of a task (the pooled browser stays up)."""
+    try:
+        await scraper.cleanup()
+        log_info("Browser context closed")
+    except Exception as e:
+        log_warning(f"⚠️ Cleanup error: {e}")
+
+
+async def main_batch(batch_file):
+    """Lock / discard every ``{"full_address", "action"}`` item listed in a JSON file."""
+    try:
+        with open(batch_file, 'r', encoding='utf-8') as f:
+            items = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        log_error(f"❌ Error reading batch file: {e}")
+        return 1
+
+    scraper = None
+    try:
+        scraper = OnlineRMELocedDeletedTask()
+        results = await scraper.run_batch(items)
+        print(json.dumps(results, indent=2), flush=True)
+        return 0 if all(result.get("success") for result in results) else 1
+    finally:
+        log_info("Cleaning up resources...")
+        await close_db_connections()
+        if scraper:
+            await close_task(scraper)
+        await close_browser_pool()
+        log_info("Cleanup finished.")
+
 
 async def main():
     # Force logs to appear immediately at start
     print("\n[INFO] >>> SCRIPT STARTING execution...", flush=True)
 
+    if len(sys.argv) == 3 and sys.argv[1] == "--batch":
+        return await main_batch(sys.argv[2])
+
     if len(sys.argv) < 5:
         log_error("❌ Error: Insufficient arguments provided.")
         log_error("Usage: python script.py <address> <status> <work_order_id> <form_data_json>")
+        log_error("   or: python script.py --batch <items_json_file>")
         return 1
 
     wo_address = sys.argv[1]
@@ -469,21 +640,8 @@ async def main():
         
         # Close browser resources
         if scraper:
-            try:
-                if hasattr(scraper, 'page') and scraper.page:
-                    await scraper.page.close()
-                    log_info("Page closed")
-                if hasattr(scraper, 'browser') and scraper.browser:
-                    await scraper.browser.close()
-                    log_info("Browser closed")
-                if hasattr(scraper, 'playwright') and scraper.playwright:
-                    await scraper.playwright.stop()
-                    log_info("Playwright stopped")
-                elif hasattr(scraper, 'p') and scraper.p:
-                    await scraper.p.stop()
-                    log_info("Playwright stopped")
-            except Exception as e:
-                log_warning(f"⚠️ Cleanup error: {e}")
+            await close_task(scraper)
+        await close_browser_pool()
         
         log_info("Cleanup finished.")
                 